@@ -0,0 +1,82 @@
+"""
+Benchmark for ConflictDetector.detect_all: serial path vs. process pool with 1..N workers.
+
+Run from the repository root:
+
+    python -m benchmarks.conflict_detection --semesters 6 --lvas 300
+
+Every parallel run is checked against the serial result, so the benchmark also guards
+the deterministic merge order.
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.synthetic_project import build_project
+from src.services.conflict_service import ConflictDetector, shutdown_conflict_process_pool
+from src.services.termin_occurrence_service import expand_termine
+
+
+def _timed(detector: ConflictDetector, termine, repeat: int):
+    best = None
+    issues = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        issues = detector.detect_all(termine)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, issues
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--semesters", type=int, default=4)
+    parser.add_argument("--lvas", type=int, default=200)
+    parser.add_argument("--rooms", type=int, default=400)
+    parser.add_argument("--termine-per-lva", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="*",
+        help="Worker counts to measure (default: powers of two up to the CPU count)",
+    )
+    args = parser.parse_args()
+
+    termine, lvas, raeume = build_project(
+        semesters=args.semesters,
+        lvas=args.lvas,
+        rooms=args.rooms,
+        termine_per_lva=args.termine_per_lva,
+    )
+    cpu_count = os.cpu_count() or 1
+    workers = args.workers or sorted(
+        {*(2**i for i in range(1, 8) if 2**i <= cpu_count), max(2, cpu_count)}
+    )
+    print(
+        f"{len(termine)} Termine ({len(expand_termine(termine))} nach Serienauflösung), "
+        f"{len(lvas)} LVAs, {len(raeume)} Räume, {cpu_count} CPUs"
+    )
+
+    serial_time, serial_issues = _timed(ConflictDetector(lvas, raeume), termine, args.repeat)
+    print(f"{'Modus':<14}{'Zeit [s]':>10}{'Speedup':>10}  Issues")
+    print(f"{'seriell':<14}{serial_time:>10.3f}{1.0:>10.2f}  {len(serial_issues)}")
+
+    for count in workers:
+        if count < 2:
+            continue
+        detector = ConflictDetector(lvas, raeume, parallel=True, max_workers=count)
+        # warm-up run starts the worker processes, which is a one-time cost per session
+        detector.detect_all(termine)
+        elapsed, issues = _timed(detector, termine, args.repeat)
+        same = "ok" if issues == serial_issues else "ABWEICHUNG"
+        print(
+            f"{f'{count} Prozesse':<14}{elapsed:>10.3f}{serial_time / elapsed:>10.2f}  "
+            f"{len(issues)} {same}"
+        )
+    shutdown_conflict_process_pool()
+
+
+if __name__ == "__main__":
+    main()
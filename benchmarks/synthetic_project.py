@@ -0,0 +1,101 @@
+"""
+Synthetic project data for the benchmarks in this folder.
+
+The generated data mimics a multi-semester archive project: many LVAs spread over the
+regular Studiensemester, weekly series and single Termine, a large room catalog and a
+handful of lecturers shared between LVAs. The output is deterministic for a given seed.
+"""
+
+import random
+from datetime import time, timedelta
+from typing import List, Tuple
+
+from src.core.models import Gruppe, Lehrveranstaltung, Raum, Termin, Vortragende
+from src.services.semester_rules import semester_for_kind_year
+
+EVENT_TYPES = ("VO", "VU", "UE", "LU", "PR", "SE")
+STUDIENSEMESTER = [f"sem{i}" for i in range(1, 7)]
+
+
+def build_project(
+    semesters: int = 4,
+    lvas: int = 300,
+    rooms: int = 400,
+    termine_per_lva: int = 10,
+    series_ratio: float = 0.3,
+    seed: int = 7,
+) -> Tuple[List[Termin], List[Lehrveranstaltung], List[Raum]]:
+    rng = random.Random(seed)
+
+    raeume = [
+        Raum(
+            id=f"R{i:04d}",
+            name=f"Hörsaal {i}",
+            kapazitaet=rng.choice((20, 32, 48, 80, 120, 250)),
+            gebaeude=f"Gebäude {i % 12}",
+        )
+        for i in range(rooms)
+    ]
+    lecturers = [
+        Vortragende(name=f"Lehrperson {i}", email=f"lehrperson{i}@example.org")
+        for i in range(max(1, lvas // 3))
+    ]
+    lva_list = [
+        Lehrveranstaltung(
+            id=f"{300 + i // 1000}.{i % 1000:03d}",
+            name=f"LVA {i}",
+            vortragende=rng.choice(lecturers),
+            studiensemester=rng.sample(STUDIENSEMESTER, rng.choice((1, 1, 2))),
+            studienrichtung=rng.choice(("ETIT", "ETIT", "INF")),
+        )
+        for i in range(lvas)
+    ]
+
+    semester_list = []
+    year = 2022
+    for index in range(semesters):
+        kind = "SS" if index % 2 == 0 else "WS"
+        semester_list.append(semester_for_kind_year(kind, year))
+        if kind == "WS":
+            year += 1
+
+    termine: List[Termin] = []
+    counter = 0
+    for semester in semester_list:
+        span_days = (semester.end - semester.start).days
+        for lva in lva_list:
+            for _ in range(termine_per_lva):
+                counter += 1
+                day = semester.start + timedelta(days=rng.randrange(span_days))
+                if day.weekday() >= 5:
+                    day -= timedelta(days=day.weekday() - 4)
+                typ = rng.choice(EVENT_TYPES)
+                is_series = rng.random() < series_ratio
+                has_group = typ in {"UE", "LU", "PR"} and rng.random() < 0.6
+                termine.append(
+                    Termin(
+                        name=f"{typ} {lva.name}"
+                        + (f" Gruppe {counter % 4 + 1}" if has_group else ""),
+                        id=f"T{counter:06d}",
+                        lva_id=lva.id,
+                        typ=typ,
+                        datum=day,
+                        start_zeit=time(rng.randrange(8, 19), rng.choice((0, 0, 0, 15, 30))),
+                        raum_id=rng.choice(raeume).id,
+                        gruppe=(
+                            Gruppe(name=str(counter % 4 + 1), groesse=rng.randrange(10, 200))
+                            if has_group
+                            else None
+                        ),
+                        anwesenheitspflicht=has_group,
+                        duration=rng.choice((45, 90, 90, 120, 180)),
+                        semester_id=semester.id,
+                        datum_bis=(
+                            min(semester.end, day + timedelta(weeks=rng.randrange(4, 12)))
+                            if is_series
+                            else None
+                        ),
+                        periodizitaet="wöchentlich" if is_series else None,
+                    )
+                )
+    return termine, lva_list, raeume
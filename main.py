@@ -1,4 +1,9 @@
-from src.ui.windows.main_window import run_gui
+import multiprocessing
 
 if __name__ == "__main__":
+    # Required for the conflict detection process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
+    from src.ui.windows.main_window import run_gui
+
     run_gui()
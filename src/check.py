@@ -0,0 +1,223 @@
+"""
+Headless conflict check for one or more project folders.
+
+    python -m src.check <ordner> [<ordner> ...] [--format json|csv] [--output datei]
+
+Loads every folder with DataService, runs the ConflictDetector with the user's konflikte.json
+and writes a report of all ConflictIssues including per-stage timings. Folders are checked
+concurrently in separate processes. This module must stay free of PySide6 imports so the
+check starts quickly on build servers without a GUI.
+
+Exit codes: 0 = no findings, 1 = findings matching --fail-on, 2 = at least one folder
+could not be checked.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .core.models import ConflictIssue
+from .services.conflict_labels import conflict_category_label
+from .services.conflict_service import ConflictDetector
+from .services.data_folder_service import inspect_project_folder
+from .services.data_service import DataService
+from .services.termin_occurrence_service import expand_termine
+
+EXIT_OK = 0
+EXIT_FINDINGS = 1
+EXIT_ERROR = 2
+
+CSV_COLUMNS = [
+    "ordner",
+    "severity",
+    "category",
+    "kategorie",
+    "datum",
+    "zeit_von",
+    "zeit_bis",
+    "termin_ids",
+    "raum",
+    "lva",
+    "gruppe",
+    "message",
+]
+
+
+def issue_to_dict(issue: ConflictIssue) -> Dict[str, Any]:
+    return {
+        "severity": issue.severity,
+        "category": issue.category,
+        "kategorie": conflict_category_label(issue.category),
+        "datum": issue.datum.isoformat() if issue.datum else None,
+        "zeit_von": issue.zeit_von.strftime("%H:%M") if issue.zeit_von else None,
+        "zeit_bis": issue.zeit_bis.strftime("%H:%M") if issue.zeit_bis else None,
+        "termin_ids": [str(tid) for tid in issue.termin_ids],
+        "raum": issue.raum,
+        "lva": issue.lva,
+        "gruppe": issue.gruppe,
+        "message": issue.message,
+    }
+
+
+def check_project_folder(folder: str) -> Dict[str, Any]:
+    """Check one project folder and return a JSON-serialisable result with stage timings in ms."""
+    data_dir = Path(folder).expanduser().resolve()
+    timings: Dict[str, float] = {}
+    result: Dict[str, Any] = {
+        "ordner": str(data_dir),
+        "ok": False,
+        "fehler": None,
+        "anzahl": {},
+        "zeiten_ms": timings,
+        "issues": [],
+    }
+
+    def stage(name: str, started: float) -> float:
+        now = time.perf_counter()
+        timings[name] = round((now - started) * 1000, 2)
+        return now
+
+    started = time.perf_counter()
+    if not data_dir.is_dir():
+        result["fehler"] = "Ordner existiert nicht."
+        return result
+    inspection = inspect_project_folder(data_dir)
+    started = stage("pruefen", started)
+    if not inspection.has_project_files or inspection.invalid_files:
+        result["fehler"] = "; ".join(inspection.invalid_files) or "Keine Projektdateien gefunden."
+        return result
+
+    try:
+        ds = DataService(data_dir)
+        lvas = ds.load_lvas()
+        raeume = ds.load_raeume()
+        termine = ds.load_termine()
+        started = stage("laden", started)
+
+        occurrences = expand_termine(termine)
+        started = stage("aufloesen", started)
+
+        detector = ConflictDetector(lvas, raeume, data_dir=data_dir)
+        issues = detector.detect_all(occurrences)
+        started = stage("erkennen", started)
+    except Exception as exc:
+        result["fehler"] = f"{type(exc).__name__}: {exc}"
+        return result
+
+    result["issues"] = [issue_to_dict(issue) for issue in issues]
+    stage("bericht", started)
+    result["ok"] = True
+    result["anzahl"] = {
+        "termine": len(termine),
+        "vorkommen": len(occurrences),
+        "konflikte": sum(1 for issue in issues if issue.severity == "conflict"),
+        "warnungen": sum(1 for issue in issues if issue.severity == "warning"),
+    }
+    return result
+
+
+def run_checks(folders: List[str], jobs: int) -> List[Dict[str, Any]]:
+    """Check all folders, in a process pool when more than one job is allowed."""
+    jobs = max(1, min(jobs, len(folders)))
+    if jobs == 1:
+        return [check_project_folder(folder) for folder in folders]
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return list(pool.map(check_project_folder, folders))
+
+
+def write_json_report(results: List[Dict[str, Any]], out) -> None:
+    json.dump({"ordner": results}, out, ensure_ascii=False, indent=2)
+    out.write("\n")
+
+
+def write_csv_report(results: List[Dict[str, Any]], out) -> None:
+    writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS, delimiter=";")
+    writer.writeheader()
+    for result in results:
+        for issue in result["issues"]:
+            row = dict(issue)
+            row["ordner"] = result["ordner"]
+            row["termin_ids"] = ", ".join(issue["termin_ids"])
+            writer.writerow(row)
+
+
+def _summary_line(result: Dict[str, Any]) -> str:
+    timings = ", ".join(f"{name} {ms:.0f} ms" for name, ms in result["zeiten_ms"].items())
+    if not result["ok"]:
+        return f"{'FEHLER':<10}{result['ordner']}: {result['fehler']}"
+    counts = result["anzahl"]
+    return (
+        f"{'KONFLIKT' if counts['konflikte'] else 'OK':<10}{result['ordner']}: "
+        f"{counts['konflikte']} Konflikte, {counts['warnungen']} Warnungen, "
+        f"{counts['vorkommen']} Termine ({timings})"
+    )
+
+
+def exit_code(results: List[Dict[str, Any]], fail_on: str) -> int:
+    if any(not result["ok"] for result in results):
+        return EXIT_ERROR
+    if fail_on == "never":
+        return EXIT_OK
+    keys = ("konflikte", "warnungen") if fail_on == "warning" else ("konflikte",)
+    if any(result["anzahl"][key] for result in results for key in keys):
+        return EXIT_FINDINGS
+    return EXIT_OK
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.check",
+        description="Konfliktprüfung für Projektordner ohne grafische Oberfläche.",
+    )
+    parser.add_argument("folders", nargs="+", help="Projektordner mit termine.json usw.")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument(
+        "-o", "--output", help="Bericht in diese Datei schreiben (Standard: stdout)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Anzahl parallel geprüfter Ordner (Standard: Anzahl CPU-Kerne)",
+    )
+    parser.add_argument(
+        "--fail-on",
+        choices=("conflict", "warning", "never"),
+        default="conflict",
+        help="Ab welchem Befund der Exit-Code 1 gesetzt wird",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Keine Zusammenfassung auf stderr ausgeben"
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = run_checks(args.folders, args.jobs)
+
+    write_report = write_csv_report if args.format == "csv" else write_json_report
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write_report(results, out)
+    else:
+        write_report(results, sys.stdout)
+
+    if not args.quiet:
+        for result in results:
+            print(_summary_line(result), file=sys.stderr)
+        print(f"Gesamt: {time.perf_counter() - started:.2f} s", file=sys.stderr)
+    return exit_code(results, args.fail_on)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -83,6 +83,8 @@ class Termin:
     periodizitaet: Optional[str] = None
     ausfall_daten: List[date] = field(default_factory=list)
     serien_ausnahmen: List[SerienAusnahme] = field(default_factory=list)
+    # pinned by the user: automatic tools (e.g. the plan optimiser) never move it
+    fixiert: bool = False
 
     def is_series(self) -> bool:
         return (
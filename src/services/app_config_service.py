@@ -30,6 +30,10 @@ def user_config_dir() -> Path:
     return Path(os.environ.get("XDG_CONFIG_HOME", home / ".config")) / APP_NAME
 
 
+def user_cache_dir() -> Path:
+    return user_config_dir() / "cache"
+
+
 def user_config_path(filename: str) -> Path:
     return user_config_dir() / filename
 
@@ -0,0 +1,249 @@
+"""
+Automatic placement of unassigned Termine.
+
+Termine are placed one after another, most constrained first (fewest free slots in their
+search window, then larger groups and longer Termine). Every placement is reserved in the
+occupancy bitmaps of a CommonSlotFinder, so later Termine see it and the plan raises no
+room, group, lecturer or study-plan conflict as far as these rules are enabled. When a
+Termin has no free slot left, previously placed Termine that block one of its resources are
+moved to their next free slot (bounded backtracking, see MAX_BACKTRACKS).
+"""
+
+from dataclasses import dataclass, field, replace
+from datetime import date, time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..core.models import Raum, Termin
+from .conflict_service import ConflictConfig
+from .project_index_service import ProjectIndex
+from .semester_rules import semester_from_id
+from .slot_finder_service import DEFAULT_WEEKDAYS, CommonSlotFinder, SlotCandidate
+
+# Total number of blocking Termine that may be moved during one planning run
+MAX_BACKTRACKS = 200
+# Placed Termine tried per Termin without a free slot (most recently placed first)
+MAX_BACKTRACK_DEPTH = 3
+
+REASON_NO_WINDOW = "Kein Semester oder Zeitraum"
+REASON_NO_ROOM = "Kein ausreichend großer Raum"
+REASON_NO_SLOT = "Kein freier Zeitpunkt im Zeitraum"
+
+
+@dataclass(frozen=True)
+class Placement:
+    termin_id: str
+    datum: date
+    von: time
+    bis: time
+    raum_id: str
+    hinweise: Tuple[str, ...] = ()
+
+
+@dataclass
+class PlacementPlan:
+    placements: List[Placement] = field(default_factory=list)
+    # termin id -> reason why it could not be placed
+    unplaced: Dict[str, str] = field(default_factory=dict)
+
+    def apply(self, termine: Iterable[Termin]) -> List[Termin]:
+        """termine with date, start time and room of every placement filled in."""
+        by_id = {p.termin_id: p for p in self.placements}
+        result = []
+        for termin in termine:
+            placement = by_id.get(str(termin.id))
+            if placement is not None:
+                termin = replace(
+                    termin,
+                    datum=placement.datum,
+                    start_zeit=placement.von,
+                    raum_id=placement.raum_id,
+                )
+            result.append(termin)
+        return result
+
+
+def is_unassigned(termin: Termin) -> bool:
+    return termin.datum is None or termin.start_zeit is None
+
+
+class AutoPlacer:
+    """
+    Greedy placement with bounded backtracking on top of CommonSlotFinder.
+
+    A Termin without date is searched in its semester (intersected with the requested
+    range) on the given weekdays; a Termin that already has a date but no start time keeps
+    its date. Within the window the best slot is taken: no remaining warning first, then
+    the earliest date and time.
+    """
+
+    def __init__(
+        self,
+        index: ProjectIndex,
+        settings: Dict,
+        data_dir: str | Path | None = None,
+        config: Optional[ConflictConfig] = None,
+    ):
+        self.index = index
+        self.finder = CommonSlotFinder(index, settings, data_dir=data_dir, config=config)
+        self._originals: Dict[str, Termin] = {}
+
+    def plan(
+        self,
+        termine: Iterable[Termin],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        weekdays: Optional[Iterable[int]] = None,
+        raeume: Optional[List[Raum]] = None,
+    ) -> PlacementPlan:
+        targets = [t for t in termine if is_unassigned(t)]
+        allowed_days = tuple(DEFAULT_WEEKDAYS if weekdays is None else weekdays)
+        rooms = list(self.index.raeume if raeume is None else raeume)
+        plan = PlacementPlan()
+        finder = self.finder
+        self._originals = {str(t.id): t for t in targets}
+        finder.sync(str(t.id) for t in targets)
+
+        windows: Dict[str, Tuple[date, date, Tuple[int, ...]]] = {}
+        domain_size: Dict[str, int] = {}
+        for termin in targets:
+            window = self._window(termin, start, end, allowed_days)
+            if window is None:
+                plan.unplaced[str(termin.id)] = REASON_NO_WINDOW
+                continue
+            if not finder.candidate_rooms(termin, rooms):
+                plan.unplaced[str(termin.id)] = REASON_NO_ROOM
+                continue
+            windows[str(termin.id)] = window
+            domain_size[str(termin.id)] = len(self._search(termin, window, rooms, limit=None))
+
+        pending = sorted(
+            (t for t in targets if str(t.id) in windows),
+            key=lambda t: (
+                domain_size[str(t.id)],
+                -(t.gruppe.groesse if t.gruppe else 0),
+                -int(t.duration or 0),
+                str(t.id),
+            ),
+        )
+        # termin id -> (termin as placed, placement), in placement order
+        placed: Dict[str, Tuple[Termin, Placement]] = {}
+        budget = MAX_BACKTRACKS
+        for termin in pending:
+            candidates = self._search(termin, windows[str(termin.id)], rooms)
+            if candidates:
+                self._place(termin, candidates[0], placed)
+                continue
+            if budget > 0:
+                moved, budget = self._backtrack(termin, windows, rooms, placed, budget)
+                if moved:
+                    continue
+            plan.unplaced[str(termin.id)] = REASON_NO_SLOT
+
+        plan.placements = [placement for _termin, placement in placed.values()]
+        return plan
+
+    def _window(
+        self,
+        termin: Termin,
+        start: Optional[date],
+        end: Optional[date],
+        weekdays: Tuple[int, ...],
+    ) -> Optional[Tuple[date, date, Tuple[int, ...]]]:
+        if termin.datum is not None:
+            return termin.datum, termin.datum, tuple(range(7))
+        semester = semester_from_id(termin.semester_id) if termin.semester_id else None
+        firsts = [d for d in (start, semester.start if semester else None) if d is not None]
+        lasts = [d for d in (end, semester.end if semester else None) if d is not None]
+        if not firsts or not lasts or max(firsts) > min(lasts):
+            return None
+        return max(firsts), min(lasts), weekdays
+
+    def _search(
+        self,
+        termin: Termin,
+        window: Tuple[date, date, Tuple[int, ...]],
+        rooms: List[Raum],
+        limit: Optional[int] = 1,
+    ) -> List[SlotCandidate]:
+        first, last, weekdays = window
+        return self.finder.search(termin, first, last, weekdays=weekdays, raeume=rooms, limit=limit)
+
+    def _place(
+        self,
+        termin: Termin,
+        candidate: SlotCandidate,
+        placed: Dict[str, Tuple[Termin, Placement]],
+    ) -> None:
+        termin_placed = replace(
+            termin, datum=candidate.datum, start_zeit=candidate.von, raum_id=candidate.raum_id
+        )
+        self.finder.reserve(termin_placed)
+        placed[str(termin.id)] = (
+            termin_placed,
+            Placement(
+                termin_id=str(termin.id),
+                datum=candidate.datum,
+                von=candidate.von,
+                bis=candidate.bis,
+                raum_id=candidate.raum_id,
+                hinweise=candidate.hinweise,
+            ),
+        )
+
+    def _unplace(self, termin_id: str, placed: Dict[str, Tuple[Termin, Placement]]) -> None:
+        placed.pop(termin_id)
+        self.finder.release(termin_id)
+
+    def _backtrack(
+        self,
+        termin: Termin,
+        windows: Dict[str, Tuple[date, date, Tuple[int, ...]]],
+        rooms: List[Raum],
+        placed: Dict[str, Tuple[Termin, Placement]],
+        budget: int,
+    ) -> Tuple[bool, int]:
+        """
+        Try to free a slot for termin by moving one blocking Termin elsewhere.
+
+        Returns whether termin was placed and the remaining backtrack budget. A blocker is
+        put back where it was if neither termin nor the blocker find a slot afterwards.
+        """
+        blockers = [
+            tid
+            for tid, (placed_termin, _placement) in reversed(placed.items())
+            if self.finder.blocks(termin, placed_termin)
+        ][:MAX_BACKTRACK_DEPTH]
+        for blocker_id in blockers:
+            if budget <= 0:
+                break
+            budget -= 1
+            blocker, placement = placed[blocker_id]
+            original = self._originals[blocker_id]
+            self._unplace(blocker_id, placed)
+            candidates = self._search(termin, windows[str(termin.id)], rooms)
+            if candidates:
+                self._place(termin, candidates[0], placed)
+                alternatives = self._search(original, windows[blocker_id], rooms)
+                if alternatives:
+                    self._place(original, alternatives[0], placed)
+                    return True, budget
+                self._unplace(str(termin.id), placed)
+            self.finder.reserve(blocker)
+            placed[blocker_id] = (blocker, placement)
+        return False, budget
+
+
+def plan_auto_placement(
+    index: ProjectIndex,
+    termine: Iterable[Termin],
+    *,
+    settings: Dict,
+    data_dir: str | Path | None = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    weekdays: Optional[Iterable[int]] = None,
+) -> PlacementPlan:
+    """Place the unassigned Termine among termine; see AutoPlacer."""
+    placer = AutoPlacer(index, settings, data_dir=data_dir)
+    return placer.plan(termine, start=start, end=end, weekdays=weekdays)
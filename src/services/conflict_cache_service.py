@@ -0,0 +1,111 @@
+import hashlib
+import json
+from datetime import date, time
+from pathlib import Path
+from typing import List, Optional
+
+from ..core.models import ConflictIssue, Lehrveranstaltung, Raum, Termin
+from .app_config_service import user_cache_dir
+from .conflict_service import ConflictConfig
+
+# Bump when the detector output or the file layout changes, so old caches are ignored
+CACHE_FORMAT = 1
+CACHE_FILENAME = "konflikte_cache.json"
+
+
+def project_cache_dir(data_dir: str | Path) -> Path:
+    """Per-project folder below the user cache directory, named after the project path."""
+    resolved = str(Path(data_dir).expanduser().resolve())
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:16]
+    return user_cache_dir() / "projekte" / digest
+
+
+def conflict_cache_key(
+    termine: List[Termin],
+    lvas: List[Lehrveranstaltung],
+    raeume: List[Raum],
+    config: ConflictConfig,
+) -> str:
+    """
+    Content hash of the data a detection runs on: the Termine (occurrences) passed to
+    detect_all, the detector's LVAs and rooms and its ConflictConfig. Equal keys mean
+    detect_all would return the same issues. The key is built from the data in memory,
+    not from the files, so a save during a running detection cannot pair old issues
+    with the new file contents.
+    """
+    digest = hashlib.sha256(f"format:{CACHE_FORMAT}\n".encode("utf-8"))
+    for label, items in (("termine", termine), ("lvas", lvas), ("raeume", raeume)):
+        digest.update(f"{label}\n".encode("utf-8"))
+        # dataclass reprs list every field and are stable between sessions
+        digest.update(repr(list(items)).encode("utf-8"))
+        digest.update(b"\n")
+    settings = {
+        "rules": config.settings_by_key,
+        "studiensemester": config.studiensemester_names,
+        # frozenset order depends on the string hash seed, so sort the day types
+        "free_days": sorted(
+            (day.isoformat(), sorted(str(kind) for kind in kinds))
+            for day, kinds in config.free_days_by_date.items()
+        ),
+    }
+    digest.update(json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str).encode())
+    return digest.hexdigest()
+
+
+def load_cached_conflicts(data_dir: str | Path, key: str) -> Optional[List[ConflictIssue]]:
+    """Return the cached issues if the cache was written for `key`, otherwise None."""
+    path = project_cache_dir(data_dir) / CACHE_FILENAME
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if raw.get("format") != CACHE_FORMAT or raw.get("key") != key:
+            return None
+        return [_issue_from_dict(item) for item in raw.get("issues", [])]
+    except Exception:
+        return None
+
+
+def store_cached_conflicts(data_dir: str | Path, key: str, issues: List[ConflictIssue]) -> None:
+    """Write the issues for `key`. The cache is best effort; write errors are ignored."""
+    target = project_cache_dir(data_dir) / CACHE_FILENAME
+    payload = {
+        "format": CACHE_FORMAT,
+        "key": key,
+        "issues": [_issue_to_dict(issue) for issue in issues],
+    }
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(target)
+    except Exception:
+        pass
+
+
+def _issue_to_dict(issue: ConflictIssue) -> dict:
+    return {
+        "severity": issue.severity,
+        "category": issue.category,
+        "termin_ids": [str(tid) for tid in issue.termin_ids],
+        "message": issue.message,
+        "datum": issue.datum.isoformat() if issue.datum else None,
+        "zeit_von": issue.zeit_von.isoformat() if issue.zeit_von else None,
+        "zeit_bis": issue.zeit_bis.isoformat() if issue.zeit_bis else None,
+        "raum": issue.raum,
+        "lva": issue.lva,
+        "gruppe": issue.gruppe,
+    }
+
+
+def _issue_from_dict(item: dict) -> ConflictIssue:
+    return ConflictIssue(
+        severity=item["severity"],
+        category=item["category"],
+        termin_ids=list(item["termin_ids"]),
+        message=item["message"],
+        datum=date.fromisoformat(item["datum"]) if item.get("datum") else None,
+        zeit_von=time.fromisoformat(item["zeit_von"]) if item.get("zeit_von") else None,
+        zeit_bis=time.fromisoformat(item["zeit_bis"]) if item.get("zeit_bis") else None,
+        raum=item.get("raum", ""),
+        lva=item.get("lva", ""),
+        gruppe=item.get("gruppe", ""),
+    )
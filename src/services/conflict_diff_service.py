@@ -0,0 +1,142 @@
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..core.models import ConflictIssue
+from .conflict_service import ConflictConfig, ConflictDetector, load_conflict_config
+from .project_index_service import ProjectIndex
+
+IssueIdentity = Tuple[str, str, Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class ConflictDiff:
+    """Issues an operation introduces (added), resolves (removed) or leaves in place."""
+
+    added: List[ConflictIssue]
+    removed: List[ConflictIssue]
+    unchanged: List[ConflictIssue]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def issue_identity(issue: ConflictIssue) -> IssueIdentity:
+    """
+    Stable identity of an issue across two project states: severity, category and the
+    involved Termin ids. The message is not part of it, so renaming an LVA or room does not
+    turn an existing conflict into a new one.
+    """
+    return (
+        str(issue.severity),
+        str(issue.category),
+        tuple(sorted(str(tid) for tid in issue.termin_ids)),
+    )
+
+
+def diff_conflicts(
+    before_state: ProjectIndex,
+    after_state: ProjectIndex,
+    before_issues: Optional[List[ConflictIssue]] = None,
+    data_dir: str | Path | None = None,
+    before_config: Optional[ConflictConfig] = None,
+    after_config: Optional[ConflictConfig] = None,
+) -> ConflictDiff:
+    """
+    Compare the conflicts of two project states.
+
+    When only Termine changed, just the affected part is re-evaluated: single-Termin rules
+    for the changed Termine and pair rules for the buckets (room/day, lecturer/day, ...)
+    the changed Termine fall into, before and after the change. All other issues are taken
+    from before_issues (the full detect_all result of before_state, e.g. from the
+    conflicts dock) or detected once if not given. Changed LVAs, rooms or conflict settings
+    affect every Termin, so both states are then detected in full.
+    """
+    if before_config is None:
+        before_config = load_conflict_config(data_dir=data_dir)
+    if after_config is None:
+        after_config = before_config
+    before_detector = ConflictDetector(
+        before_state.lvas, before_state.raeume, config=before_config, index=before_state
+    )
+    after_detector = ConflictDetector(
+        after_state.lvas, after_state.raeume, config=after_config, index=after_state
+    )
+    if before_issues is None:
+        before_issues = before_detector.detect_all(before_state.occurrences)
+
+    full_diff = (
+        before_state.lvas != after_state.lvas
+        or before_state.raeume != after_state.raeume
+        or before_config != after_config
+    )
+    if full_diff:
+        return _match_issues([], before_issues, after_detector.detect_all(after_state.occurrences))
+
+    changed = before_state.changed_termin_ids(after_state)
+    if not changed:
+        return ConflictDiff(added=[], removed=[], unchanged=list(before_issues))
+
+    changed_occurrences = [t for tid in changed for t in before_state.occurrences_of(tid)]
+    changed_occurrences += [t for tid in changed for t in after_state.occurrences_of(tid)]
+    scope = before_detector.conflict_scope(changed_occurrences)
+
+    kept = [
+        issue
+        for issue in before_issues
+        if not before_detector.issue_in_scope(issue, before_state.termin_map, changed, scope)
+    ]
+    return _match_issues(
+        kept,
+        before_detector.detect_in_scope(before_state.occurrences, changed, scope),
+        after_detector.detect_in_scope(after_state.occurrences, changed, scope),
+    )
+
+
+def conflict_diff_summary(diff: ConflictDiff) -> str:
+    """Short German summary such as "2 neu (1 Konflikt, 1 Warnung), 3 behoben"."""
+
+    def counted(issues: List[ConflictIssue]) -> str:
+        severities = Counter(issue.severity for issue in issues)
+        parts = []
+        if severities["conflict"]:
+            count = severities["conflict"]
+            parts.append(f"{count} {'Konflikt' if count == 1 else 'Konflikte'}")
+        if severities["warning"]:
+            count = severities["warning"]
+            parts.append(f"{count} {'Warnung' if count == 1 else 'Warnungen'}")
+        return ", ".join(parts)
+
+    parts = []
+    if diff.added:
+        parts.append(f"{len(diff.added)} neu ({counted(diff.added)})")
+    if diff.removed:
+        parts.append(f"{len(diff.removed)} behoben ({counted(diff.removed)})")
+    if not parts:
+        return "Keine Änderung bei Konflikten"
+    return ", ".join(parts)
+
+
+def _match_issues(
+    kept: List[ConflictIssue],
+    before_issues: List[ConflictIssue],
+    after_issues: List[ConflictIssue],
+) -> ConflictDiff:
+    pending: Dict[IssueIdentity, List[ConflictIssue]] = {}
+    for issue in after_issues:
+        pending.setdefault(issue_identity(issue), []).append(issue)
+
+    unchanged = list(kept)
+    removed: List[ConflictIssue] = []
+    for issue in before_issues:
+        matches = pending.get(issue_identity(issue))
+        if matches:
+            # keep the after version, its message reflects the current names
+            unchanged.append(matches.pop(0))
+        else:
+            removed.append(issue)
+    matched_ids = {id(issue) for issue in unchanged}
+    added = [issue for issue in after_issues if id(issue) not in matched_ids]
+    return ConflictDiff(added=added, removed=removed, unchanged=unchanged)
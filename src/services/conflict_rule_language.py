@@ -0,0 +1,241 @@
+"""
+Small condition language for custom single-Termin rules in konflikte.json.
+
+A custom rule is a konflikte.json entry with a key that is not one of the built-in rules
+and a "when" condition, for example:
+
+    {
+        "name": "Abendtermin",
+        "key": "evening_warning",
+        "enabled": true,
+        "type": "warning",
+        "message_template": "Termin endet erst um {end_time}.",
+        "when": {"all": [
+            {"field": "assigned", "op": "==", "value": true},
+            {"field": "end_time", "op": ">", "value": "20:00"}
+        ]}
+    }
+
+Conditions are {"all": [...]}, {"any": [...]}, {"not": {...}} or a comparison
+{"field": ..., "op": ..., "value": ...}; a plain list means "all". The value of a
+comparison may reference another field: {"field": "group_size", "factor": 0.8}; a factor
+is only allowed with a numeric field (NUMERIC_FIELDS).
+Times are compared as "HH:MM" strings, dates as "YYYY-MM-DD" strings. Comparisons with a
+missing value (e.g. no room) never match, except "empty"/"not_empty".
+
+Rules are compiled once into closures; compiled rules are cached by their definition.
+"""
+
+import json
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from ..core.models import Lehrveranstaltung, Raum, Termin
+
+# (occurrence, its LVA, its room, free-day types of its date) -> value
+FieldGetter = Callable[[Termin, Optional[Lehrveranstaltung], Optional[Raum], FrozenSet[str]], Any]
+RulePredicate = Callable[
+    [Termin, Optional[Lehrveranstaltung], Optional[Raum], FrozenSet[str]], bool
+]
+
+
+def _hhmm(value) -> Optional[str]:
+    return value.strftime("%H:%M") if value else None
+
+
+def _lecturer_name(lva: Optional[Lehrveranstaltung]) -> Optional[str]:
+    lecturer = getattr(lva, "vortragende", None)
+    return str(getattr(lecturer, "name", "") or "") if lecturer else None
+
+
+RULE_FIELDS: Dict[str, FieldGetter] = {
+    "name": lambda t, lva, raum, free: t.name,
+    "typ": lambda t, lva, raum, free: str(t.typ or "").strip().upper(),
+    "assigned": lambda t, lva, raum, free: t.datum is not None and t.start_zeit is not None,
+    "date": lambda t, lva, raum, free: t.datum.isoformat() if t.datum else None,
+    "weekday": lambda t, lva, raum, free: t.datum.weekday() if t.datum else None,
+    "month": lambda t, lva, raum, free: t.datum.month if t.datum else None,
+    "start_time": lambda t, lva, raum, free: _hhmm(t.start_zeit),
+    "end_time": lambda t, lva, raum, free: _hhmm(t.get_end_time()),
+    "start_minute": lambda t, lva, raum, free: t.start_zeit.minute if t.start_zeit else None,
+    "duration": lambda t, lva, raum, free: t.duration,
+    "semester_id": lambda t, lva, raum, free: t.semester_id,
+    "group": lambda t, lva, raum, free: t.gruppe.name if t.gruppe else "",
+    "group_size": lambda t, lva, raum, free: t.gruppe.groesse if t.gruppe else None,
+    "anwesenheitspflicht": lambda t, lva, raum, free: bool(t.anwesenheitspflicht),
+    "zu_besprechen": lambda t, lva, raum, free: bool(t.zu_besprechen),
+    "lva_id": lambda t, lva, raum, free: t.lva_id,
+    "lva_name": lambda t, lva, raum, free: lva.name if lva else None,
+    "studienrichtung": lambda t, lva, raum, free: (
+        str(getattr(lva, "studienrichtung", "") or "") if lva else None
+    ),
+    "studiensemester": lambda t, lva, raum, free: (
+        list(getattr(lva, "studiensemester", []) or []) if lva else None
+    ),
+    "lecturer": lambda t, lva, raum, free: _lecturer_name(lva),
+    "raum_id": lambda t, lva, raum, free: t.raum_id,
+    "room_name": lambda t, lva, raum, free: raum.name if raum else None,
+    "room_capacity": lambda t, lva, raum, free: raum.kapazitaet if raum else None,
+    "building": lambda t, lva, raum, free: raum.gebaeude if raum else None,
+    "free_day": lambda t, lva, raum, free: sorted(free),
+}
+
+# Fields whose values are numbers; only these may be scaled by a "factor"
+NUMERIC_FIELDS = frozenset(
+    {"weekday", "month", "start_minute", "duration", "group_size", "room_capacity"}
+)
+
+
+def _compare(op: str, left, right) -> bool:
+    if left is None or right is None:
+        return False
+    try:
+        if op == "==":
+            return left == right
+        if op == "!=":
+            return left != right
+        if op == "<":
+            return left < right
+        if op == "<=":
+            return left <= right
+        if op == ">":
+            return left > right
+        if op == ">=":
+            return left >= right
+    except TypeError:
+        return False
+    return False
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    key: str
+    severity: str
+    category: str
+    predicate: RulePredicate
+
+
+def rule_values(
+    t: Termin, lva: Optional[Lehrveranstaltung], raum: Optional[Raum], free: FrozenSet[str]
+) -> Dict[str, Any]:
+    """All field values of an occurrence, used as message_template placeholders."""
+    values = {}
+    for name, getter in RULE_FIELDS.items():
+        value = getter(t, lva, raum, free)
+        if isinstance(value, list):
+            value = ", ".join(str(item) for item in value)
+        values[name] = "" if value is None else value
+    return values
+
+
+def is_custom_rule(item: dict) -> bool:
+    return isinstance(item, dict) and "when" in item
+
+
+def compile_condition(spec) -> RulePredicate:
+    """Compile a "when" condition into a predicate. Raises ValueError for invalid input."""
+    if isinstance(spec, list):
+        spec = {"all": spec}
+    if not isinstance(spec, dict):
+        raise ValueError(f"Bedingung muss ein Objekt sein: {spec!r}")
+
+    if "all" in spec or "any" in spec:
+        parts = tuple(compile_condition(part) for part in spec.get("all", spec.get("any")) or [])
+        if "all" in spec:
+            return lambda t, lva, raum, free: all(p(t, lva, raum, free) for p in parts)
+        return lambda t, lva, raum, free: any(p(t, lva, raum, free) for p in parts)
+    if "not" in spec:
+        inner = compile_condition(spec["not"])
+        return lambda t, lva, raum, free: not inner(t, lva, raum, free)
+
+    field_name = spec.get("field")
+    getter = RULE_FIELDS.get(field_name)
+    if getter is None:
+        raise ValueError(f"Unbekanntes Feld: {field_name!r}")
+    op = str(spec.get("op", "==")).strip()
+    value = spec.get("value")
+
+    if op == "empty":
+        return lambda t, lva, raum, free: getter(t, lva, raum, free) in (None, "", [])
+    if op == "not_empty":
+        return lambda t, lva, raum, free: getter(t, lva, raum, free) not in (None, "", [])
+    if op in ("in", "not_in"):
+        options = frozenset(value if isinstance(value, list) else [value])
+        if op == "in":
+            return lambda t, lva, raum, free: _is_in(getter(t, lva, raum, free), options)
+        return lambda t, lva, raum, free: not _is_in(getter(t, lva, raum, free), options)
+    if op == "contains":
+        needle = str(value).casefold()
+        return lambda t, lva, raum, free: needle in str(getter(t, lva, raum, free) or "").casefold()
+    if op == "matches":
+        pattern = re.compile(str(value), re.IGNORECASE)
+        return lambda t, lva, raum, free: bool(
+            pattern.search(str(getter(t, lva, raum, free) or ""))
+        )
+    if op not in ("==", "!=", "<", "<=", ">", ">="):
+        raise ValueError(f"Unbekannter Operator: {op!r}")
+
+    if isinstance(value, dict) and "field" in value:
+        other = RULE_FIELDS.get(value["field"])
+        if other is None:
+            raise ValueError(f"Unbekanntes Feld: {value['field']!r}")
+        factor = value.get("factor")
+        if factor is not None:
+            if isinstance(factor, bool) or not isinstance(factor, (int, float)):
+                raise ValueError(f"Faktor muss eine Zahl sein: {factor!r}")
+            if value["field"] not in NUMERIC_FIELDS:
+                raise ValueError(f"Faktor nur bei Zahlenfeldern erlaubt: {value['field']!r}")
+
+        def compare_fields(t, lva, raum, free) -> bool:
+            try:
+                right = other(t, lva, raum, free)
+                if factor is not None and right is not None:
+                    right = right * factor
+            except TypeError:
+                return False
+            return _compare(op, getter(t, lva, raum, free), right)
+
+        return compare_fields
+    return lambda t, lva, raum, free: _compare(op, getter(t, lva, raum, free), value)
+
+
+def _is_in(value, options: FrozenSet) -> bool:
+    if isinstance(value, list):
+        return any(item in options for item in value)
+    try:
+        return value in options
+    except TypeError:
+        return False
+
+
+_compiled_cache: Dict[str, CompiledRule] = {}
+_compiled_cache_lock = threading.Lock()
+
+
+def compile_rule(item: dict) -> CompiledRule:
+    """
+    Compile a custom konflikte.json entry. Results are cached by the entry's JSON form,
+    so repeated detector construction does not recompile. Raises ValueError if invalid.
+    """
+    cache_key = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+    with _compiled_cache_lock:
+        cached = _compiled_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    key = str(item.get("key", "")).strip()
+    if not key:
+        raise ValueError("Regel ohne key")
+    severity = "conflict" if str(item.get("type", "warning")) == "conflict" else "warning"
+    category = str(item.get("category") or item.get("name") or key).strip()
+    compiled = CompiledRule(
+        key=key,
+        severity=severity,
+        category=category,
+        predicate=compile_condition(item["when"]),
+    )
+    with _compiled_cache_lock:
+        _compiled_cache[cache_key] = compiled
+    return compiled
@@ -1,13 +1,27 @@
 from datetime import date, time, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
+import atexit
+import copy
 import json
-import re
-from dataclasses import replace
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from ..core.models import Termin, Lehrveranstaltung, Raum, ConflictIssue
 from .conflict_labels import conflict_category_label
 from .termin_occurrence_service import expand_termine, source_termin_id
+from .project_index_service import ProjectIndex, termin_is_group_term
+from .conflict_rule_language import (
+    CompiledRule,
+    RulePredicate,
+    compile_rule,
+    is_custom_rule,
+    rule_values,
+)
 from .app_config_service import (
+    default_config_path,
     ensure_user_config_file,
     load_default_config,
     save_user_config,
@@ -16,6 +30,60 @@ from .app_config_service import (
 
 DEFAULT_CONFLICTS_PATH = user_config_path("konflikte.json")
 
+# Tuple format: (settings_key, detector method name, assigned_only)
+CONFLICT_RULES: Tuple[Tuple[str, str, bool], ...] = (
+    ("room_conflict", "detect_room_conflicts", True),
+    ("group_conflict", "detect_group_conflicts", True),
+    ("lecturer_conflict", "detect_lecturer_conflicts", True),
+    ("study_semester_warning", "detect_study_semester_warnings", True),
+    ("holiday_conflict", "detect_holiday_conflicts", True),
+    ("lecture_free_conflict", "detect_lecture_free_conflicts", True),
+    ("incomplete_warning", "detect_incomplete_warnings", False),
+    ("duration_warning", "detect_duration_warnings", False),
+    ("full_hour_start_warning", "detect_full_hour_start_warnings", False),
+    ("saturday_warning", "detect_saturday_warning", False),
+    ("sunday_warning", "detect_sunday_warning", False),
+    ("capacity_warning_uebung", "detect_capacity_warning_uebung", False),
+    ("capacity_warning_vorlesung", "detect_capacity_warning_vorlesung", False),
+)
+
+# settings_key -> (severity, category) of the issues a rule reports
+RULE_CATEGORIES: Dict[str, Tuple[str, str]] = {
+    "room_conflict": ("conflict", "room"),
+    "group_conflict": ("conflict", "group"),
+    "lecturer_conflict": ("conflict", "lecturer"),
+    "study_semester_warning": ("warning", "semester"),
+    "holiday_conflict": ("conflict", "holiday"),
+    "lecture_free_conflict": ("conflict", "lecture_free"),
+    "incomplete_warning": ("warning", "incomplete"),
+    "duration_warning": ("warning", "duration"),
+    "full_hour_start_warning": ("warning", "start_time"),
+    "saturday_warning": ("warning", "saturday"),
+    "sunday_warning": ("warning", "sunday"),
+    "capacity_warning_uebung": ("warning", "Kapazität Übung"),
+    "capacity_warning_vorlesung": ("warning", "Kapazität Vorlesung"),
+}
+
+RULE_KEY_BY_CATEGORY = {category: key for key, (_severity, category) in RULE_CATEGORIES.items()}
+
+# Capacity rules: settings_key -> (default min_capacity_percent, default event type)
+CAPACITY_RULE_DEFAULTS: Dict[str, Tuple[int, str]] = {
+    "capacity_warning_uebung": (100, "UE"),
+    "capacity_warning_vorlesung": (60, "VO"),
+}
+
+# Rules that compare pairs of Termine. Their buckets always contain the date,
+# so partitioning the Termine by date never splits a bucket.
+PAIR_RULES = frozenset(
+    {"room_conflict", "group_conflict", "lecturer_conflict", "study_semester_warning"}
+)
+
+# A single-Termin rule match: (occurrence, its LVA, its room, free-day types of its date)
+UnaryMatch = Tuple[Termin, Optional[Lehrveranstaltung], Optional[Raum], frozenset]
+
+# Below this number of expanded Termine the process pool costs more than it saves
+PARALLEL_MIN_OCCURRENCES = 2000
+
 
 def preview_conflict_issues(
     termine: List[Termin],
@@ -29,16 +97,18 @@ def preview_conflict_issues(
     use_dragged_room: bool = False,
     conflict_settings_path: Optional[str] = None,
     data_dir: str | Path | None = None,
+    index: Optional[ProjectIndex] = None,
 ) -> List[ConflictIssue]:
     """
     Simulates dropping a Termin at a new position to show real-time conflict feedback during dragging.
     It creates a temporary copy of the appointments with the dragged Termin moved to the proposed date, time, and room, then runs the normal ConflictDetector
     Only real conflicts involving that dragged Termin are returned, warnings are ignored.
+    If the project index is passed, its expanded occurrences and group flags are reused.
     """
     if not target_date:
         return []
 
-    expanded = expand_termine(termine)
+    expanded = index.occurrences if index is not None else expand_termine(termine)
     dragged = next((t for t in expanded if str(t.id) == str(termin_id)), None)
     if not dragged:
         source_id = source_termin_id(termin_id)
@@ -78,6 +148,7 @@ def preview_conflict_issues(
         raeume=raeume,
         conflict_settings_path=conflict_settings_path,
         data_dir=data_dir,
+        index=index,
     )
     issues = detector.detect_all(simulated)
     return [
@@ -104,6 +175,7 @@ def preview_conflict_summary(
     use_dragged_room: bool = False,
     conflict_settings_path: Optional[str] = None,
     data_dir: str | Path | None = None,
+    index: Optional[ProjectIndex] = None,
 ) -> str:
     issues = preview_conflict_issues(
         termine=termine,
@@ -117,6 +189,7 @@ def preview_conflict_summary(
         use_dragged_room=use_dragged_room,
         conflict_settings_path=conflict_settings_path,
         data_dir=data_dir,
+        index=index,
     )
     labels = []
     seen = set()
@@ -129,6 +202,31 @@ def preview_conflict_summary(
     return ", ".join(labels)
 
 
+def probe_termin_conflicts(
+    index: ProjectIndex,
+    termin_id: str,
+    data_dir: str | Path | None = None,
+    config: Optional["ConflictConfig"] = None,
+) -> List[ConflictIssue]:
+    """
+    Return the conflicts and warnings involving one Termin (or its series occurrences).
+
+    The index must contain the Termin as it should be checked, e.g. derived from the project
+    index with an edited version of it. Only the single-Termin rules of that Termin and the
+    pair-rule buckets its occurrences fall into are evaluated, not the whole project.
+    """
+    source_id = source_termin_id(termin_id)
+    detector = ConflictDetector(
+        index.lvas, index.raeume, data_dir=data_dir, config=config, index=index
+    )
+    scope = detector.conflict_scope(index.occurrences_of(source_id))
+    return [
+        issue
+        for issue in detector.detect_in_scope(index.occurrences, {source_id}, scope)
+        if any(source_termin_id(tid) == source_id for tid in issue.termin_ids)
+    ]
+
+
 def load_conflicts(path=None):
     target = Path(path) if path else ensure_user_config_file("konflikte.json")
     try:
@@ -204,6 +302,221 @@ def save_conflicts(conflicts, path=None):
             save_user_config("konflikte.json", conflicts, indent=4)
     except Exception:
         pass
+    invalidate_conflict_config()
+
+
+@dataclass(frozen=True)
+class ConflictConfig:
+    """
+    Snapshot of everything a ConflictDetector reads from disk:
+    the merged konflikte.json rules, the Studiensemester names and the free-day map.
+    load_conflict_config returns a copy of the cached instance on every call, so changes to
+    one caller's dicts do not leak into the cache or other detectors.
+    """
+
+    settings_by_key: Dict[str, dict]
+    studiensemester_names: Dict[str, str]
+    free_days_by_date: Dict[date, frozenset]
+
+
+@dataclass(frozen=True)
+class ConflictCounts:
+    """Issue counts per (severity, category) as returned by ConflictDetector.count_all."""
+
+    by_category: Dict[Tuple[str, str], int]
+
+    @property
+    def conflicts(self) -> int:
+        return sum(n for (severity, _c), n in self.by_category.items() if severity == "conflict")
+
+    @property
+    def warnings(self) -> int:
+        return sum(n for (severity, _c), n in self.by_category.items() if severity == "warning")
+
+    def categories(self) -> List[str]:
+        return [category for (_severity, category), n in self.by_category.items() if n]
+
+
+_config_cache: Dict[Tuple[str, str], Tuple[tuple, ConflictConfig]] = {}
+_config_cache_lock = threading.Lock()
+
+
+def load_conflict_config(
+    conflict_settings_path: Optional[str] = None, data_dir: str | Path | None = None
+) -> ConflictConfig:
+    """
+    Return the ConflictConfig for the given settings file and project folder.
+
+    The parsed config is cached and reused as long as the modification time and size of
+    konflikte.json (user and default), studiensemester.json and freie_tage.json are unchanged.
+    invalidate_conflict_config() drops the cache explicitly, e.g. after the settings dialog saved.
+    Callers get their own copy of the cached config.
+    """
+    settings_path = (
+        Path(conflict_settings_path)
+        if conflict_settings_path
+        else user_config_path("konflikte.json")
+    )
+    free_path = _free_days_path(conflict_settings_path, data_dir)
+    sources = (
+        settings_path,
+        default_config_path("konflikte.json"),
+        _studiensemester_path(),
+        free_path,
+    )
+    cache_key = (str(settings_path.resolve()), str(free_path.resolve()))
+
+    stamp = tuple(_file_stamp(path) for path in sources)
+    with _config_cache_lock:
+        cached = _config_cache.get(cache_key)
+        if cached and cached[0] == stamp:
+            return _copy_config(cached[1])
+
+    settings_by_key: Dict[str, dict] = {}
+    for entry in load_conflicts(conflict_settings_path):
+        key = entry.get("key") if isinstance(entry, dict) else None
+        if key:
+            settings_by_key[key] = entry
+    config = ConflictConfig(
+        settings_by_key=settings_by_key,
+        studiensemester_names=_load_studiensemester_names(),
+        free_days_by_date=_load_free_days_map(free_path),
+    )
+    after = tuple(_file_stamp(path) for path in sources)
+    if stamp[0] is None:
+        # load_conflicts creates the missing user file from the defaults
+        stamp = after[:1] + stamp[1:]
+    # Only cache if no file changed while loading, otherwise the stamp may not match the
+    # content that was read
+    if after == stamp:
+        with _config_cache_lock:
+            _config_cache[cache_key] = (stamp, config)
+    return _copy_config(config)
+
+
+def _copy_config(config: ConflictConfig) -> ConflictConfig:
+    # dates and frozensets are immutable, only the rule entries need a deep copy
+    return ConflictConfig(
+        settings_by_key=copy.deepcopy(config.settings_by_key),
+        studiensemester_names=dict(config.studiensemester_names),
+        free_days_by_date=dict(config.free_days_by_date),
+    )
+
+
+def invalidate_conflict_config() -> None:
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _free_days_path(conflict_settings_path: Optional[str], data_dir: str | Path | None) -> Path:
+    if data_dir:
+        return Path(data_dir).resolve() / "freie_tage.json"
+    if conflict_settings_path:
+        return Path(conflict_settings_path).resolve().parent / "freie_tage.json"
+    return Path("data") / "freie_tage.json"
+
+
+def _studiensemester_path() -> Path:
+    return Path(__file__).resolve().parents[1] / "studiensemester.json"
+
+
+def _load_free_days_map(free_path: Path) -> Dict[date, frozenset]:
+    if not free_path.exists():
+        return {}
+
+    try:
+        payload = json.loads(free_path.read_text(encoding="utf-8-sig"))
+    except Exception:
+        return {}
+
+    out: Dict[date, set[str]] = {}
+    for item in payload.get("freie_tage", []):
+        raw_type = str(item.get("typ", "")).strip().lower()
+        if "feiertag" in raw_type:
+            day_type = "feiertag"
+        elif "vorlesungsfrei" in raw_type:
+            day_type = "vorlesungsfrei"
+        else:
+            continue
+
+        start_raw = str(item.get("von_datum", "")).strip()
+        end_raw = str(item.get("bis_datum", "")).strip()
+        d0 = _parse_iso_date(start_raw)
+        d1 = _parse_iso_date(end_raw)
+        if d0 is None or d1 is None or d1 < d0:
+            continue
+
+        cur = d0
+        while cur <= d1:
+            out.setdefault(cur, set()).add(day_type)
+            cur += timedelta(days=1)
+
+    return {day: frozenset(types) for day, types in out.items()}
+
+
+def _load_studiensemester_names() -> Dict[str, str]:
+    path = _studiensemester_path()
+    if not path.exists():
+        return {}
+
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8-sig"))
+    except Exception:
+        return {}
+
+    names: Dict[str, str] = {}
+    for item in obj.get("studiensemester", []):
+        if not isinstance(item, dict):
+            continue
+        semester_id = str(item.get("id", "")).strip()
+        name = str(item.get("name", "")).strip()
+        if semester_id:
+            names[semester_id] = name or semester_id
+    return names
+
+
+def lecturer_key(lva: Lehrveranstaltung) -> str:
+    """Identity of an LVA's lecturer for the lecturer rule: e-mail if set, otherwise name."""
+    lecturer = getattr(lva, "vortragende", None)
+    if not lecturer:
+        return ""
+    email = str(getattr(lecturer, "email", "") or "").strip().casefold()
+    if email:
+        return f"mail:{email}"
+    name = str(getattr(lecturer, "name", "") or "").strip().casefold()
+    return f"name:{name}" if name else ""
+
+
+def lva_study_plan(lvas: List[Lehrveranstaltung]) -> Dict[str, Tuple[str, Tuple[str, ...]]]:
+    """Map LVA id -> (Studienrichtung, distinct Studiensemester ids) for LVAs that have both."""
+    out: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+    for lva in lvas:
+        studienrichtung = str(getattr(lva, "studienrichtung", "")).strip()
+        semester_ids = tuple(
+            dict.fromkeys(
+                str(item).strip()
+                for item in (getattr(lva, "studiensemester", []) or [])
+                if str(item).strip()
+            )
+        )
+        if studienrichtung and semester_ids:
+            out[str(lva.id)] = (studienrichtung, semester_ids)
+    return out
+
+
+def _parse_iso_date(raw: str) -> Optional[date]:
+    try:
+        return datetime.strptime(raw, "%Y-%m-%d").date()
+    except Exception:
+        return None
 
 
 class ConflictDetector:
@@ -212,8 +525,8 @@ class ConflictDetector:
 
     Rules are loaded from konflikte.json and can be individually enabled/disabled.
     Each rule maps to a dedicated detect_* method that returns ConflictIssue objects.
-    Free-day data (Feiertage, Vorlesungsfreie Tage) is read from freie_tage.json and
-    pre-processed into an in-memory date map for efficient per-Termin lookups.
+    Rule settings, Studiensemester names and the free-day date map come from a cached
+    ConflictConfig, so constructing a detector does not touch the disk unless a file changed.
     """
 
     def __init__(
@@ -222,21 +535,43 @@ class ConflictDetector:
         raeume: List[Raum],
         conflict_settings_path: str = None,
         data_dir: str | Path | None = None,
+        config: Optional[ConflictConfig] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        index: Optional[ProjectIndex] = None,
     ):
         self.lvas = lvas
         self.raeume = raeume
         self.data_dir = Path(data_dir).resolve() if data_dir else None
-        # Load conflict settings (konflikte.json)
-        self.conflict_settings = {}
-        settings = load_conflicts(conflict_settings_path)
-        for entry in settings:
-            key = entry.get("key")
-            if key:
-                self.conflict_settings[key] = entry
+        # Opt-in process pool for large projects, see _detect_all_parallel
+        self.parallel = bool(parallel)
+        self.max_workers = max_workers if max_workers and max_workers > 0 else None
+        if config is None:
+            config = load_conflict_config(conflict_settings_path, self.data_dir)
+        self.config = config
+        self.conflict_settings = config.settings_by_key
+        # On duplicate ids the last entry wins here, as in the study plan and the
+        # Studiensemester warning; see _lva_of for the other rules
         self._lva_by_id = {str(lva.id): lva for lva in lvas}
         self._raum_by_id = {str(raum.id): raum for raum in raeume}
-        self._studiensemester_names = self._load_studiensemester_names()
-        self._free_days_by_date = self._load_free_days_map(conflict_settings_path)
+        # First entry wins, like the linear lookups these maps replaced
+        self._first_lva_by_id: Dict[str, Lehrveranstaltung] = {}
+        for lva in lvas:
+            self._first_lva_by_id.setdefault(str(lva.id), lva)
+        self._first_raum_by_id: Dict[str, Raum] = {}
+        for raum in raeume:
+            self._first_raum_by_id.setdefault(str(raum.id), raum)
+        self._lva_study_plan = self._build_lva_study_plan(lvas)
+        self._custom_rules = self._compile_custom_rules(config.settings_by_key)
+        self._rule_key_by_category = dict(RULE_KEY_BY_CATEGORY)
+        for key, rule in self._custom_rules.items():
+            self._rule_key_by_category.setdefault(rule.category, key)
+        # Group flags per source Termin: precomputed by the project index when available,
+        # otherwise computed once per Termin on first use
+        self._group_term_flags = index.group_term_flags if index is not None else {}
+        self._group_term_memo: Dict[str, bool] = {}
+        self._studiensemester_names = config.studiensemester_names
+        self._free_days_by_date = config.free_days_by_date
 
     def is_assigned(self, termin: Termin) -> bool:
         return termin.datum is not None and termin.start_zeit is not None
@@ -296,431 +631,621 @@ class ConflictDetector:
 
     def detect_all(self, termine: List[Termin]) -> List[ConflictIssue]:
         """Detect all conflicts and warnings in the given Termine list, respecting settings from konflikte.json."""
-        issues = []
         termine = expand_termine(termine)
         assigned = [t for t in termine if self.is_assigned(t)]
 
-        # Tuple format: (settings_key, detector_fn, assigned_only)
-        rules = [
-            ("room_conflict", self.detect_room_conflicts, True),
-            ("group_conflict", self.detect_group_conflicts, True),
-            ("lecturer_conflict", self.detect_lecturer_conflicts, True),
-            ("study_semester_warning", self.detect_study_semester_warnings, True),
-            ("holiday_conflict", self.detect_holiday_conflicts, True),
-            ("lecture_free_conflict", self.detect_lecture_free_conflicts, True),
-            ("incomplete_warning", self.detect_incomplete_warnings, False),
-            ("duration_warning", self.detect_duration_warnings, False),
-            ("full_hour_start_warning", self.detect_full_hour_start_warnings, False),
-            ("saturday_warning", self.detect_saturday_warning, False),
-            ("sunday_warning", self.detect_sunday_warning, False),
-            ("capacity_warning_uebung", self.detect_capacity_warning_uebung, False),
-            ("capacity_warning_vorlesung", self.detect_capacity_warning_vorlesung, False),
-        ]
+        if self.parallel and len(termine) >= PARALLEL_MIN_OCCURRENCES:
+            issues = self._detect_all_parallel(termine)
+            if issues is not None:
+                return issues
 
-        for key, detector, assigned_only in rules:
-            settings = self.conflict_settings.get(key, {})
-            if not settings.get("enabled", True):
-                continue
-            source = assigned if assigned_only else termine
-            detected = detector(source, settings)
+        rules = self._enabled_rules()
+        # all single-Termin rules share one pass over the Termine
+        unary = self._unary_matches([rule for rule in rules if rule[0] not in PAIR_RULES], termine)
+        issues = []
+        for key, _assigned_only, settings in rules:
+            if key in unary:
+                detected = self._single_issues(key, unary[key], settings)
+            else:
+                detected = self._run_rule(key, assigned, settings)
             if detected:
                 issues.extend(detected)
         return issues
 
-    def detect_incomplete_warnings(
-        self, termine: List[Termin], settings=None
-    ) -> List[ConflictIssue]:
-        """Detect warnings for incomplete or unassigned Termine. Uses settings if provided."""
-        warnings = []
-        missing_labels = (settings or {}).get("missing_labels", {})
-        if not isinstance(missing_labels, dict):
-            missing_labels = {}
+    def rule_keys(self) -> List[str]:
+        """Keys of all known rules in evaluation order: built-in rules, then custom rules."""
+        return [key for key, _method_name, _assigned_only in CONFLICT_RULES] + list(
+            self._custom_rules
+        )
 
-        def label(key: str) -> str:
-            val = str(missing_labels.get(key, "")).strip()
-            return val
+    def _enabled_rules(self) -> List[Tuple[str, bool, dict]]:
+        """(key, assigned_only, settings) of every enabled rule in evaluation order."""
+        rules = [
+            (key, assigned_only, self.conflict_settings.get(key, {}))
+            for key, _method_name, assigned_only in CONFLICT_RULES
+        ]
+        rules += [(key, False, self.conflict_settings.get(key, {})) for key in self._custom_rules]
+        return [rule for rule in rules if rule[2].get("enabled", True)]
+
+    def _run_rule(self, key: str, termine: List[Termin], settings=None) -> List[ConflictIssue]:
+        if key in self._custom_rules:
+            return self._detect_single(key, termine, settings)
+        return getattr(self, _RULE_METHODS[key])(termine, settings)
+
+    def _rule_category(self, key: str) -> Tuple[str, str]:
+        """(severity, category) of the issues a rule reports."""
+        rule = self._custom_rules.get(key)
+        if rule is not None:
+            return rule.severity, rule.category
+        return RULE_CATEGORIES[key]
+
+    @staticmethod
+    def _compile_custom_rules(settings_by_key: Dict[str, dict]) -> Dict[str, CompiledRule]:
+        """
+        Compile the konflikte.json entries with a "when" condition that are not built-in.
+        An invalid condition disables only its own rule, like a broken message template.
+        """
+        rules: Dict[str, CompiledRule] = {}
+        for key, item in settings_by_key.items():
+            if key in RULE_CATEGORIES or not is_custom_rule(item):
+                continue
+            try:
+                rules[key] = compile_rule(item)
+            except Exception:
+                continue
+        return rules
+
+    def _detect_all_parallel(self, termine: List[Termin]) -> Optional[List[ConflictIssue]]:
+        """
+        Run the enabled rules in a process pool and merge the results in serial order.
+
+        Pair rules are split into contiguous date ranges (one task per rule and range),
+        the single-Termin rules are evaluated together per slice of the Termine list.
+        Each task carries only its Termine plus the LVAs and rooms they reference.
+        Every returned issue has a sort key that mirrors the serial loop order
+        (bucket first appearance, then positions of both Termine), so sorting the merged
+        results reproduces detect_all's serial output exactly.
+        Returns None when the pool is unavailable so the caller can fall back to serial.
+        """
+        enabled = [key for key, _assigned_only, _settings in self._enabled_rules()]
+        if not enabled:
+            return []
+
+        workers = self.max_workers or os.cpu_count() or 1
+        if workers < 2:
+            return None
 
+        indexed = list(enumerate(termine))
+        tasks = []
+        pair_rules = [key for key in enabled if key in PAIR_RULES]
+        if pair_rules:
+            for chunk in _partition_by_date(
+                [(pos, t) for pos, t in indexed if self.is_assigned(t)], workers
+            ):
+                for key in pair_rules:
+                    tasks.append(self._partition_task((key,), chunk))
+        unary_rules = tuple(key for key in enabled if key not in PAIR_RULES)
+        if unary_rules:
+            step = max(1, -(-len(indexed) // workers))
+            for start in range(0, len(indexed), step):
+                tasks.append(self._partition_task(unary_rules, indexed[start : start + step]))
+
+        try:
+            pool = _conflict_process_pool(workers)
+            results = list(pool.map(_detect_partition, tasks))
+        except Exception:
+            shutdown_conflict_process_pool()
+            return None
+
+        merged = [item for result in results for item in result]
+        merged.sort(key=lambda item: item[0])
+        return [issue for _sort_key, issue in merged]
+
+    def conflict_scope(self, termine: List[Termin]) -> Dict[str, set]:
+        """
+        Return the buckets of every pair rule that the given Termine fall into.
+
+        Pair rules only compare Termine within one bucket, so the issues of all other
+        buckets cannot change when only these Termine change.
+        """
+        scope: Dict[str, set] = {key: set() for key in PAIR_RULES}
         for t in termine:
-            problems = []
-            has_missing = False
-            # Check for missing/unassigned date
-            if t.datum is None:
-                has_missing = True
-                txt = label("date")
-                if txt:
-                    problems.append(txt)
-            # Check for missing time
-            if t.start_zeit is None:
-                has_missing = True
-                txt = label("start_time")
-                if txt:
-                    problems.append(txt)
-            # Check for missing/invalid duration
-            if t.duration <= 0:
-                has_missing = True
-                txt = label("duration")
-                if txt:
-                    problems.append(txt)
-            # Check for missing room
-            if not t.raum_id or t.raum_id.strip() == "":
-                has_missing = True
-                txt = label("room")
-                if txt:
-                    problems.append(txt)
-            if has_missing:
-                lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-                raum = next((r for r in self.raeume if r.id == t.raum_id), None)
-                msg = self._render_message(settings, {"missing": ", ".join(problems)})
-                warnings.append(
-                    ConflictIssue(
-                        severity="warning",
-                        category="incomplete",
-                        termin_ids=[t.id],
-                        message=msg,
-                        datum=t.datum,
-                        zeit_von=t.start_zeit,
-                        zeit_bis=t.get_end_time(),
-                        raum=raum.name if raum else "",
-                        lva=lva.name if lva else t.lva_id,
-                        gruppe=t.gruppe.name if t.gruppe else "",
+            if not self.is_assigned(t):
+                continue
+            for key in PAIR_RULES:
+                bucket = self._pair_bucket_key(key, t)
+                if bucket is not None:
+                    scope[key].add(bucket)
+        return scope
+
+    def detect_in_scope(
+        self, termine: List[Termin], source_ids: set, scope: Dict[str, set]
+    ) -> List[ConflictIssue]:
+        """
+        Detect only the issues that can depend on the given source Termine: single-Termin
+        rules for their occurrences and pair rules for the buckets in `scope`.
+        The result equals detect_all(termine) restricted to that scope.
+        """
+        termine = expand_termine(termine)
+        rules = self._enabled_rules()
+        unary = self._unary_matches(
+            [rule for rule in rules if rule[0] not in PAIR_RULES],
+            [t for t in termine if source_termin_id(t.id) in source_ids],
+        )
+        issues: List[ConflictIssue] = []
+        for key, _assigned_only, settings in rules:
+            if key in unary:
+                issues.extend(self._single_issues(key, unary[key], settings))
+                continue
+            buckets = scope.get(key)
+            if not buckets:
+                continue
+            source = [
+                t
+                for t in termine
+                if self.is_assigned(t) and self._pair_bucket_key(key, t) in buckets
+            ]
+            if source:
+                issues.extend(self._run_rule(key, source, settings) or [])
+        return issues
+
+    def issue_in_scope(
+        self,
+        issue: ConflictIssue,
+        termin_by_id: Dict[str, Termin],
+        source_ids: set,
+        scope: Dict[str, set],
+    ) -> bool:
+        """Return True if detect_in_scope with the same arguments would re-evaluate the issue."""
+        key = self._rule_key_by_category.get(issue.category)
+        if key is None or not issue.termin_ids:
+            return False
+        if key not in PAIR_RULES:
+            return source_termin_id(issue.termin_ids[0]) in source_ids
+        termin = termin_by_id.get(str(issue.termin_ids[0]))
+        return termin is not None and self._pair_bucket_key(key, termin) in scope.get(key, ())
+
+    def _partition_task(self, rule_keys: Tuple[str, ...], items: List[Tuple[int, Termin]]):
+        lva_ids = {str(t.lva_id) for _pos, t in items}
+        raum_ids = {str(t.raum_id) for _pos, t in items}
+        return (
+            rule_keys,
+            items,
+            # every entry in list order, so duplicate ids resolve as in the serial run
+            [lva for lva in self.lvas if str(lva.id) in lva_ids],
+            [raum for raum in self.raeume if str(raum.id) in raum_ids],
+            self.config,
+        )
+
+    def _pair_bucket_key(self, rule_key: str, t: Termin):
+        """Return the bucket a Termin falls into for a pair rule, or None if it is skipped."""
+        if not t.datum:
+            return None
+        if rule_key == "room_conflict":
+            return (t.raum_id, t.datum) if t.raum_id else None
+        if rule_key == "group_conflict":
+            return (t.lva_id, t.gruppe.name, t.datum) if t.gruppe else None
+        if rule_key == "lecturer_conflict":
+            lva = self._lva_by_id.get(str(t.lva_id))
+            lecturer_key = self._lecturer_key(lva) if lva else ""
+            return (lecturer_key, t.datum) if lecturer_key else None
+        return t.datum
+
+    def count_all(
+        self, termine: List[Termin], visible_termin_ids: Optional[set[str]] = None
+    ) -> ConflictCounts:
+        """
+        Count the issues detect_all would report, without building ConflictIssue objects.
+
+        Runs the same matching as detect_all but skips message rendering and the LVA/room
+        lookups for the issue fields, which is all the summary chips and tab badge need.
+        With visible_termin_ids, only issues touching one of these Termine (or their
+        series) are counted, like the filter in the Konflikte dock.
+        """
+        termine = expand_termine(termine)
+        assigned = [t for t in termine if self.is_assigned(t)]
+        visible_sources = (
+            {source_termin_id(tid) for tid in visible_termin_ids}
+            if visible_termin_ids is not None
+            else None
+        )
+
+        rules = self._enabled_rules()
+        unary = self._unary_matches([rule for rule in rules if rule[0] not in PAIR_RULES], termine)
+        counts: Dict[Tuple[str, str], int] = {}
+        for key, _assigned_only, _settings in rules:
+            if key in unary:
+                matches = [match[0] for match in unary[key]]
+            else:
+                matches = self._pair_matches(key, assigned)
+            if visible_sources is not None:
+                matches = [
+                    match
+                    for match in matches
+                    if any(
+                        source_termin_id(t.id) in visible_sources
+                        for t in (match if isinstance(match, tuple) else (match,))
                     )
-                )
-        return warnings
+                ]
+            if matches:
+                category = self._rule_category(key)
+                counts[category] = counts.get(category, 0) + len(matches)
+        return ConflictCounts(counts)
 
-    def detect_room_conflicts(self, termine: List[Termin], settings=None) -> List[ConflictIssue]:
-        """Detect room conflicts (same room, date, overlapping time). Uses settings if provided."""
-        conflicts = []
-        by_room_date: Dict[Tuple[str, date], List[Termin]] = {}
+    def single_issue_counts(self, occurrences: List[Termin]) -> Tuple[int, int]:
+        """
+        (conflicts, warnings) the enabled single-Termin rules report for already expanded
+        occurrences, e.g. to score a move of one Termin without running the pair rules.
+        """
+        rules = [rule for rule in self._enabled_rules() if rule[0] not in PAIR_RULES]
+        conflicts = warnings = 0
+        for key, matches in self._unary_matches(rules, occurrences).items():
+            if self._rule_category(key)[0] == "conflict":
+                conflicts += len(matches)
+            else:
+                warnings += len(matches)
+        return conflicts, warnings
+
+    def _pair_matches(self, key: str, termine: List[Termin]) -> List[Tuple[Termin, Termin]]:
+        """Return the raw matches of a pair rule as Termin pairs."""
+        if key == "study_semester_warning":
+            return self._study_semester_pairs(termine)
+        return self._overlapping_pairs(key, termine)
+
+    def _overlapping_pairs(
+        self, rule_key: str, termine: List[Termin]
+    ) -> List[Tuple[Termin, Termin]]:
+        """
+        Return the overlapping Termin pairs of a room, group or lecturer rule.
+
+        Termine are bucketed by _pair_bucket_key; pairs are listed per bucket (in order of
+        first appearance), then by list position of both Termine.
+        """
+        buckets: Dict[object, List[Termin]] = {}
         for t in termine:
-            if not t.raum_id or not t.datum:
-                continue
-            key = (t.raum_id, t.datum)
-            by_room_date.setdefault(key, []).append(t)
-        for terms in by_room_date.values():
+            bucket = self._pair_bucket_key(rule_key, t)
+            if bucket is not None:
+                buckets.setdefault(bucket, []).append(t)
+
+        skip = self._are_lecturer_alternatives if rule_key == "lecturer_conflict" else None
+        pairs: List[Tuple[Termin, Termin]] = []
+        for terms in buckets.values():
             for i, t1 in enumerate(terms):
                 for t2 in terms[i + 1 :]:
+                    if skip is not None and skip(t1, t2):
+                        continue
                     if self.times_overlap(t1, t2):
-                        conflicts.append(self._create_conflict("room", t1, t2, settings))
-        return conflicts
+                        pairs.append((t1, t2))
+        return pairs
+
+    def _unary_matches(
+        self, rules: List[Tuple[str, bool, dict]], termine: List[Termin]
+    ) -> Dict[str, List[UnaryMatch]]:
+        """
+        Evaluate several single-Termin rules in one pass over the Termine.
+
+        The LVA, room and free-day types of each occurrence are resolved once and shared by
+        all rules. Returns the matches per rule key in list order, so concatenating them in
+        rule order gives the same issue order as running the rules one after another.
+        """
+        checks = [
+            (key, assigned_only, self._unary_rule_predicate(key, settings), [])
+            for key, assigned_only, settings in rules
+        ]
+        if not checks:
+            return {}
+        lva_get = self._first_lva_by_id.get
+        raum_get = self._first_raum_by_id.get
+        free_get = self._free_days_by_date.get
+        no_free_days = frozenset()
+        for t in termine:
+            lva = lva_get(str(t.lva_id))
+            raum = raum_get(str(t.raum_id))
+            free = free_get(t.datum, no_free_days)
+            assigned = t.datum is not None and t.start_zeit is not None
+            for _key, assigned_only, predicate, found in checks:
+                if (assigned or not assigned_only) and predicate(t, lva, raum, free):
+                    found.append((t, lva, raum, free))
+        return {key: found for key, _assigned_only, _predicate, found in checks}
+
+    def _unary_rule_predicate(self, key: str, settings=None) -> RulePredicate:
+        """Return the match test of a single-Termin rule on (Termin, LVA, room, free days)."""
+        settings = settings or {}
+        if key == "holiday_conflict":
+            return lambda t, lva, raum, free: self.is_assigned(t) and "feiertag" in free
+        if key == "lecture_free_conflict":
+            return lambda t, lva, raum, free: self.is_assigned(t) and "vorlesungsfrei" in free
+        if key == "incomplete_warning":
+            return lambda t, lva, raum, free: bool(self._missing_fields(t))
+        if key == "duration_warning":
+            min_minutes = settings.get("min_minutes", 30)
+            max_minutes = settings.get("max_minutes", 240)
+            return lambda t, lva, raum, free: (
+                self.is_assigned(t)
+                and t.duration > 0
+                and (t.duration < min_minutes or t.duration > max_minutes)
+            )
+        if key == "full_hour_start_warning":
+            return lambda t, lva, raum, free: self.is_assigned(t) and t.start_zeit.minute != 0
+        if key == "saturday_warning":
+            return lambda t, lva, raum, free: bool(t.datum) and t.datum.weekday() == 5
+        if key == "sunday_warning":
+            return lambda t, lva, raum, free: bool(t.datum) and t.datum.weekday() == 6
+        if key in CAPACITY_RULE_DEFAULTS:
+            percent, event_types = self._capacity_limits(key, settings)
+            return lambda t, lva, raum, free: (
+                self._capacity_shortfall(t, raum, percent, event_types) is not None
+            )
+        return self._custom_rules[key].predicate
+
+    def _message_values(self, key: str, match: UnaryMatch, settings=None) -> Dict[str, object]:
+        """Return the message template values of a single-Termin rule match."""
+        t, lva, raum, free = match
+        if key == "incomplete_warning":
+            missing_labels = (settings or {}).get("missing_labels", {})
+            if not isinstance(missing_labels, dict):
+                missing_labels = {}
+            problems = [
+                str(missing_labels.get(field, "")).strip() for field in self._missing_fields(t)
+            ]
+            return {"missing": ", ".join(problem for problem in problems if problem)}
+        if key == "duration_warning":
+            return {"duration": t.duration}
+        if key == "full_hour_start_warning":
+            return {"start_time": t.start_zeit.strftime("%H:%M")}
+        if key in self._custom_rules:
+            return rule_values(t, lva, raum, free)
+        if key in CAPACITY_RULE_DEFAULTS:
+            percent, event_types = self._capacity_limits(key, settings)
+            return {
+                "group_size": t.gruppe.groesse,
+                "percent": percent,
+                "required": self._capacity_shortfall(t, raum, percent, event_types),
+                "room_capacity": raum.kapazitaet,
+            }
+        return {}
+
+    def _detect_single(self, key: str, termine: List[Termin], settings=None) -> List[ConflictIssue]:
+        matches = self._unary_matches([(key, False, settings)], termine)[key]
+        return self._single_issues(key, matches, settings)
+
+    def _single_issues(
+        self, key: str, matches: List[UnaryMatch], settings=None
+    ) -> List[ConflictIssue]:
+        return [self._create_single_issue(key, match, settings) for match in matches]
+
+    def _missing_fields(self, t: Termin) -> List[str]:
+        """Return the missing_labels keys of the fields a Termin still lacks."""
+        missing = []
+        if t.datum is None:
+            missing.append("date")
+        if t.start_zeit is None:
+            missing.append("start_time")
+        if t.duration <= 0:
+            missing.append("duration")
+        if not t.raum_id or t.raum_id.strip() == "":
+            missing.append("room")
+        return missing
+
+    def _capacity_limits(self, key: str, settings=None) -> Tuple[int, set[str]]:
+        """Return (min_capacity_percent, event types) of a capacity rule."""
+        default_percent, fallback_type = CAPACITY_RULE_DEFAULTS[key]
+        percent = (settings or {}).get("min_capacity_percent", default_percent)
+        return percent, self._capacity_event_types(settings, fallback_type)
+
+    def _capacity_shortfall(
+        self, t: Termin, raum: Optional[Raum], percent: int, event_types: set[str]
+    ) -> Optional[int]:
+        """Return the required number of seats if the room is too small for the group."""
+        if not self.is_assigned(t):
+            return None
+        gruppe = getattr(t, "gruppe", None)
+        if not raum or not gruppe:
+            return None
+        if str(t.typ or "").strip().upper() not in event_types:
+            return None
+        required = int(gruppe.groesse * percent / 100)
+        if raum.kapazitaet < required:
+            return required
+        return None
+
+    def _lva_of(self, t: Termin) -> Optional[Lehrveranstaltung]:
+        return self._first_lva_by_id.get(str(t.lva_id))
+
+    def _raum_of(self, t: Termin) -> Optional[Raum]:
+        return self._first_raum_by_id.get(str(t.raum_id))
+
+    def detect_incomplete_warnings(
+        self, termine: List[Termin], settings=None
+    ) -> List[ConflictIssue]:
+        """Detect warnings for incomplete or unassigned Termine. Uses settings if provided."""
+        return self._detect_single("incomplete_warning", termine, settings)
+
+    def detect_room_conflicts(self, termine: List[Termin], settings=None) -> List[ConflictIssue]:
+        """Detect room conflicts (same room, date, overlapping time). Uses settings if provided."""
+        return [
+            self._create_conflict("room", t1, t2, settings)
+            for t1, t2 in self._overlapping_pairs("room_conflict", termine)
+        ]
 
     def detect_group_conflicts(self, termine: List[Termin], settings=None) -> List[ConflictIssue]:
         """Detect group conflicts (same LVA + group, date, overlapping time). Uses settings if provided."""
-        conflicts = []
-        by_lva_group_date: Dict[Tuple[str, str, date], List[Termin]] = {}
-        for t in termine:
-            if not t.datum or not t.gruppe:
-                continue
-            group_key = t.gruppe.name
-            key = (t.lva_id, group_key, t.datum)
-            by_lva_group_date.setdefault(key, []).append(t)
-        for key, terms in by_lva_group_date.items():
-            for i, t1 in enumerate(terms):
-                for t2 in terms[i + 1 :]:
-                    if self.times_overlap(t1, t2):
-                        conflicts.append(self._create_conflict("group", t1, t2, settings))
-        return conflicts
+        return [
+            self._create_conflict("group", t1, t2, settings)
+            for t1, t2 in self._overlapping_pairs("group_conflict", termine)
+        ]
 
     def detect_lecturer_conflicts(
         self, termine: List[Termin], settings=None
     ) -> List[ConflictIssue]:
         """Detect lecturer conflicts (same lecturer, date, overlapping time). Uses settings if provided."""
-        conflicts = []
-        by_lecturer_date: Dict[Tuple[str, date], List[Termin]] = {}
-        for t in termine:
-            if not t.datum:
-                continue
-            lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-            if not lva or not lva.vortragende:
-                continue
-            lecturer_key = self._lecturer_key(lva)
-            if not lecturer_key:
-                continue
-            key = (lecturer_key, t.datum)
-            by_lecturer_date.setdefault(key, []).append(t)
-        for terms in by_lecturer_date.values():
-            for i, t1 in enumerate(terms):
-                for t2 in terms[i + 1 :]:
-                    if self._are_lecturer_alternatives(t1, t2):
-                        continue
-                    if self.times_overlap(t1, t2):
-                        conflicts.append(self._create_conflict("lecturer", t1, t2, settings))
-        return conflicts
+        return [
+            self._create_conflict("lecturer", t1, t2, settings)
+            for t1, t2 in self._overlapping_pairs("lecturer_conflict", termine)
+        ]
 
     def detect_study_semester_warnings(
         self, termine: List[Termin], settings=None
     ) -> List[ConflictIssue]:
         """Warn when overlapping Termine belong to LVAs with the same study-plan assignment."""
-        warnings: List[ConflictIssue] = []
-        by_date: Dict[date, List[Termin]] = {}
-        for t in termine:
+        return [
+            self._create_study_semester_warning(t1, t2, settings)
+            for t1, t2 in self._study_semester_pairs(termine)
+        ]
+
+    def _study_semester_pairs(self, termine: List[Termin]) -> List[Tuple[Termin, Termin]]:
+        """
+        Return the Termin pairs of the study-plan rule.
+
+        Termine are bucketed by (Studienrichtung, Studiensemester, date) using the precomputed
+        LVA map, so only Termine that could warn against each other are compared. Each bucket is
+        sorted by start time and swept: a Termin only meets the following Termine that start
+        before it ends. A pair sharing several Studiensemester is found in several buckets and
+        reported once. The output keeps the order of the former per-day pair loop
+        (days by first appearance, then list position of both Termine).
+        """
+        day_first_pos: Dict[date, int] = {}
+        buckets: Dict[Tuple[str, str, date], List[Tuple[int, int, int]]] = {}
+        for pos, t in enumerate(termine):
             if not t.datum:
                 continue
-            by_date.setdefault(t.datum, []).append(t)
-
-        for terms in by_date.values():
-            for i, t1 in enumerate(terms):
-                for t2 in terms[i + 1 :]:
-                    if source_termin_id(t1.id) == source_termin_id(t2.id):
-                        continue
-                    if not self.times_overlap(t1, t2):
-                        continue
-                    if self._are_study_plan_alternatives(t1, t2):
-                        continue
-
-                    lva1 = self._lva_by_id.get(str(t1.lva_id))
-                    lva2 = self._lva_by_id.get(str(t2.lva_id))
-                    if not lva1 or not lva2:
-                        continue
+            day_first_pos.setdefault(t.datum, pos)
+            if not t.start_zeit or t.duration <= 0:
+                continue
+            study_key = self._lva_study_plan.get(str(t.lva_id))
+            if not study_key:
+                continue
+            studienrichtung, semester_ids = study_key
+            start = t.start_zeit.hour * 60 + t.start_zeit.minute
+            for semester_id in semester_ids:
+                buckets.setdefault((studienrichtung, semester_id, t.datum), []).append(
+                    (start, start + t.duration, pos)
+                )
 
-                    studienrichtung1 = str(getattr(lva1, "studienrichtung", "")).strip()
-                    studienrichtung2 = str(getattr(lva2, "studienrichtung", "")).strip()
-                    if not studienrichtung1 or studienrichtung1 != studienrichtung2:
-                        continue
+        candidates: set[Tuple[int, int]] = set()
+        for items in buckets.values():
+            if len(items) < 2:
+                continue
+            items.sort()
+            for i, (_start, end, pos1) in enumerate(items):
+                for start2, _end2, pos2 in items[i + 1 :]:
+                    if start2 >= end:
+                        break
+                    candidates.add((pos1, pos2) if pos1 < pos2 else (pos2, pos1))
+
+        pairs: List[Tuple[Termin, Termin]] = []
+        ordered = sorted(candidates, key=lambda pair: (day_first_pos[termine[pair[0]].datum], pair))
+        for pos1, pos2 in ordered:
+            t1 = termine[pos1]
+            t2 = termine[pos2]
+            if source_termin_id(t1.id) == source_termin_id(t2.id):
+                continue
+            if not self.times_overlap(t1, t2):
+                continue
+            if self._are_study_plan_alternatives(t1, t2):
+                continue
+            pairs.append((t1, t2))
+        return pairs
 
-                    shared_semester = self._shared_studiensemester(lva1, lva2)
-                    if not shared_semester:
-                        continue
+    def _create_study_semester_warning(
+        self, t1: Termin, t2: Termin, settings=None
+    ) -> ConflictIssue:
+        lva1 = self._lva_by_id.get(str(t1.lva_id))
+        lva2 = self._lva_by_id.get(str(t2.lva_id))
+        studienrichtung1 = str(getattr(lva1, "studienrichtung", "")).strip()
+        shared_semester = self._shared_studiensemester(lva1, lva2)
 
-                    raum1 = self._raum_by_id.get(str(t1.raum_id))
-                    raum2 = self._raum_by_id.get(str(t2.raum_id))
-                    lva1_name = lva1.name if lva1 else t1.lva_id
-                    lva2_name = lva2.name if lva2 else t2.lva_id
-                    raum1_name = raum1.name if raum1 else ""
-                    raum2_name = raum2.name if raum2 else ""
-                    semester_label = " / ".join(
-                        self._studiensemester_names.get(sem_id, sem_id)
-                        for sem_id in shared_semester
-                    )
+        raum1 = self._raum_by_id.get(str(t1.raum_id))
+        raum2 = self._raum_by_id.get(str(t2.raum_id))
+        lva1_name = lva1.name if lva1 else t1.lva_id
+        lva2_name = lva2.name if lva2 else t2.lva_id
+        raum1_name = raum1.name if raum1 else ""
+        raum2_name = raum2.name if raum2 else ""
+        semester_label = " / ".join(
+            self._studiensemester_names.get(sem_id, sem_id) for sem_id in shared_semester
+        )
 
-                    msg = self._render_message(
-                        settings,
-                        {
-                            "left_lva": lva1_name,
-                            "left_room": raum1_name,
-                            "right_lva": lva2_name,
-                            "right_room": raum2_name,
-                            "studienrichtung": studienrichtung1,
-                            "studiensemester": semester_label,
-                        },
-                    )
+        msg = self._render_message(
+            settings,
+            {
+                "left_lva": lva1_name,
+                "left_room": raum1_name,
+                "right_lva": lva2_name,
+                "right_room": raum2_name,
+                "studienrichtung": studienrichtung1,
+                "studiensemester": semester_label,
+            },
+        )
 
-                    end1 = t1.get_end_time()
-                    end2 = t2.get_end_time()
-                    warnings.append(
-                        ConflictIssue(
-                            severity="warning",
-                            category="semester",
-                            termin_ids=[t1.id, t2.id],
-                            message=msg,
-                            datum=t1.datum,
-                            zeit_von=(
-                                min(t1.start_zeit, t2.start_zeit)
-                                if t1.start_zeit and t2.start_zeit
-                                else None
-                            ),
-                            zeit_bis=max(end1, end2) if end1 and end2 else None,
-                            raum=", ".join(part for part in (raum1_name, raum2_name) if part),
-                            lva=(
-                                f"{lva1_name}, {lva2_name}" if lva1_name != lva2_name else lva1_name
-                            ),
-                            gruppe="",
-                        )
-                    )
-        return warnings
+        end1 = t1.get_end_time()
+        end2 = t2.get_end_time()
+        return ConflictIssue(
+            severity="warning",
+            category="semester",
+            termin_ids=[t1.id, t2.id],
+            message=msg,
+            datum=t1.datum,
+            zeit_von=(
+                min(t1.start_zeit, t2.start_zeit) if t1.start_zeit and t2.start_zeit else None
+            ),
+            zeit_bis=max(end1, end2) if end1 and end2 else None,
+            raum=", ".join(part for part in (raum1_name, raum2_name) if part),
+            lva=(f"{lva1_name}, {lva2_name}" if lva1_name != lva2_name else lva1_name),
+            gruppe="",
+        )
 
     def detect_holiday_conflicts(self, termine: List[Termin], settings=None) -> List[ConflictIssue]:
         """Detect conflicts for Termine that fall on Feiertag dates"""
-        conflicts: List[ConflictIssue] = []
-        if not self._free_days_by_date:
-            return conflicts
-
-        for t in termine:
-            if not self.is_assigned(t):
-                continue
-            if not t.datum:
-                continue
-            day_types = self._free_days_by_date.get(t.datum, set())
-            if "feiertag" not in day_types:
-                continue
-
-            lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-            raum = next((r for r in self.raeume if r.id == t.raum_id), None)
-            msg = self._render_message(settings)
-
-            conflicts.append(
-                ConflictIssue(
-                    severity="conflict",
-                    category="holiday",
-                    termin_ids=[t.id],
-                    message=msg,
-                    datum=t.datum,
-                    zeit_von=t.start_zeit,
-                    zeit_bis=t.get_end_time(),
-                    raum=raum.name if raum else "",
-                    lva=lva.name if lva else t.lva_id,
-                    gruppe=t.gruppe.name if t.gruppe else "",
-                )
-            )
-
-        return conflicts
+        return self._detect_single("holiday_conflict", termine, settings)
 
     def detect_lecture_free_conflicts(
         self, termine: List[Termin], settings=None
     ) -> List[ConflictIssue]:
         """Detect conflicts for Termine that fall on Vorlesungsfrei dates"""
-        conflicts: List[ConflictIssue] = []
-        if not self._free_days_by_date:
-            return conflicts
-
-        for t in termine:
-            if not self.is_assigned(t):
-                continue
-            if not t.datum:
-                continue
-            day_types = self._free_days_by_date.get(t.datum, set())
-            if "vorlesungsfrei" not in day_types:
-                continue
-
-            lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-            raum = next((r for r in self.raeume if r.id == t.raum_id), None)
-            msg = self._render_message(settings)
-
-            conflicts.append(
-                ConflictIssue(
-                    severity="conflict",
-                    category="lecture_free",
-                    termin_ids=[t.id],
-                    message=msg,
-                    datum=t.datum,
-                    zeit_von=t.start_zeit,
-                    zeit_bis=t.get_end_time(),
-                    raum=raum.name if raum else "",
-                    lva=lva.name if lva else t.lva_id,
-                    gruppe=t.gruppe.name if t.gruppe else "",
-                )
-            )
-
-        return conflicts
+        return self._detect_single("lecture_free_conflict", termine, settings)
 
     def detect_duration_warnings(self, termine: List[Termin], settings=None) -> List[ConflictIssue]:
         """Detect warnings for Termine that are unusually short or long"""
-        warnings = []
-        min_minutes = (settings or {}).get("min_minutes", 30)
-        max_minutes = (settings or {}).get("max_minutes", 240)
-        for t in termine:
-            if not self.is_assigned(t):
-                continue
-            duration = t.duration
-            if duration > 0 and (duration < min_minutes or duration > max_minutes):
-                lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-                raum = next((r for r in self.raeume if r.id == t.raum_id), None)
-                msg = self._render_message(settings, {"duration": duration})
-                warnings.append(
-                    ConflictIssue(
-                        severity="warning",
-                        category="duration",
-                        termin_ids=[t.id],
-                        message=msg,
-                        datum=t.datum,
-                        zeit_von=t.start_zeit,
-                        zeit_bis=t.get_end_time(),
-                        raum=raum.name if raum else "",
-                        lva=lva.name if lva else t.lva_id,
-                        gruppe=t.gruppe.name if t.gruppe else "",
-                    )
-                )
-        return warnings
+        return self._detect_single("duration_warning", termine, settings)
 
     def detect_full_hour_start_warnings(
         self, termine: List[Termin], settings=None
     ) -> List[ConflictIssue]:
-        warnings = []
-        for t in termine:
-            if not self.is_assigned(t):
-                continue
-            if t.start_zeit.minute == 0:
-                continue
-
-            lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-            raum = next((r for r in self.raeume if r.id == t.raum_id), None)
-            start_time = t.start_zeit.strftime("%H:%M")
-            msg = self._render_message(settings, {"start_time": start_time})
-            warnings.append(
-                ConflictIssue(
-                    severity="warning",
-                    category="start_time",
-                    termin_ids=[t.id],
-                    message=msg,
-                    datum=t.datum,
-                    zeit_von=t.start_zeit,
-                    zeit_bis=t.get_end_time(),
-                    raum=raum.name if raum else "",
-                    lva=lva.name if lva else t.lva_id,
-                    gruppe=t.gruppe.name if t.gruppe else "",
-                )
-            )
-        return warnings
+        return self._detect_single("full_hour_start_warning", termine, settings)
 
     def detect_saturday_warning(self, termine: List[Termin], settings=None) -> List[ConflictIssue]:
         """Detect warnings for Termine that fall on a Saturday"""
-        warnings = []
-        for t in termine:
-            if not t.datum:
-                continue
-            if t.datum.weekday() == 5:  # Saturday
-                lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-                raum = next((r for r in self.raeume if r.id == t.raum_id), None)
-                msg = self._render_message(settings)
-                warnings.append(
-                    ConflictIssue(
-                        severity="warning",
-                        category="saturday",
-                        termin_ids=[t.id],
-                        message=msg,
-                        datum=t.datum,
-                        zeit_von=t.start_zeit,
-                        zeit_bis=t.get_end_time(),
-                        raum=raum.name if raum else "",
-                        lva=lva.name if lva else t.lva_id,
-                        gruppe=t.gruppe.name if t.gruppe else "",
-                    )
-                )
-        return warnings
+        return self._detect_single("saturday_warning", termine, settings)
 
     def detect_sunday_warning(self, termine: List[Termin], settings=None) -> List[ConflictIssue]:
         """Detect warnings for Termine that fall on a Sunday"""
-        warnings = []
-        for t in termine:
-            if not t.datum:
-                continue
-            if t.datum.weekday() == 6:  # Sunday
-                lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-                raum = next((r for r in self.raeume if r.id == t.raum_id), None)
-                msg = self._render_message(settings)
-                warnings.append(
-                    ConflictIssue(
-                        severity="warning",
-                        category="sunday",
-                        termin_ids=[t.id],
-                        message=msg,
-                        datum=t.datum,
-                        zeit_von=t.start_zeit,
-                        zeit_bis=t.get_end_time(),
-                        raum=raum.name if raum else "",
-                        lva=lva.name if lva else t.lva_id,
-                        gruppe=t.gruppe.name if t.gruppe else "",
-                    )
-                )
-        return warnings
+        return self._detect_single("sunday_warning", termine, settings)
+
+    def _create_single_issue(self, key: str, match: UnaryMatch, settings=None) -> ConflictIssue:
+        """Create the issue of a single-Termin rule"""
+        severity, category = self._rule_category(key)
+        t, lva, raum, _free = match
+        return ConflictIssue(
+            severity=severity,
+            category=category,
+            termin_ids=[t.id],
+            message=self._render_message(settings, self._message_values(key, match, settings)),
+            datum=t.datum,
+            zeit_von=t.start_zeit,
+            zeit_bis=t.get_end_time(),
+            raum=raum.name if raum else "",
+            lva=lva.name if lva else t.lva_id,
+            gruppe=t.gruppe.name if t.gruppe else "",
+        )
 
     def _create_conflict(
         self, category: str, t1: Termin, t2: Termin, settings=None
     ) -> ConflictIssue:
         """Create a conflict issue for two overlapping Termine"""
-        lva1 = next((l for l in self.lvas if l.id == t1.lva_id), None)
-        lva2 = next((l for l in self.lvas if l.id == t2.lva_id), None)
-        raum1 = next((r for r in self.raeume if r.id == t1.raum_id), None)
-        raum2 = next((r for r in self.raeume if r.id == t2.raum_id), None)
+        lva1 = self._lva_of(t1)
+        lva2 = self._lva_of(t2)
+        raum1 = self._raum_of(t1)
+        raum2 = self._raum_of(t2)
 
         lva1_name = lva1.name if lva1 else t1.lva_id
         lva2_name = lva2.name if lva2 else t2.lva_id
@@ -777,37 +1302,35 @@ class ConflictDetector:
                 shared.append(semester_id)
         return shared
 
+    def _build_lva_study_plan(
+        self, lvas: List[Lehrveranstaltung]
+    ) -> Dict[str, Tuple[str, Tuple[str, ...]]]:
+        return lva_study_plan(lvas)
+
     def _both_have_group_names(self, t1: Termin, t2: Termin) -> bool:
         group1 = str(getattr(getattr(t1, "gruppe", None), "name", "") or "").strip()
         group2 = str(getattr(getattr(t2, "gruppe", None), "name", "") or "").strip()
         return bool(group1 and group2)
 
     def _lecturer_key(self, lva: Lehrveranstaltung) -> str:
-        lecturer = getattr(lva, "vortragende", None)
-        if not lecturer:
-            return ""
-        email = str(getattr(lecturer, "email", "") or "").strip().casefold()
-        if email:
-            return f"mail:{email}"
-        name = str(getattr(lecturer, "name", "") or "").strip().casefold()
-        return f"name:{name}" if name else ""
+        return lecturer_key(lva)
 
     def is_group_term(self, termin: Termin) -> bool:
-        group_obj = getattr(termin, "gruppe", None)
-        group_name = str(getattr(group_obj, "name", "") or "").strip()
-        group_id = str(getattr(termin, "gruppe_id", "") or "").strip()
-        group_label = str(getattr(termin, "gruppenbezeichnung", "") or "").strip()
-        if group_name or group_id or group_label:
-            return True
-
-        for field_name in ("name", "notiz", "besprechungshinweis"):
-            text = str(getattr(termin, field_name, "") or "")
-            if re.search(r"\bgr(?:uppe|\.)?\s*[A-Z0-9]", text, re.IGNORECASE):
-                return True
-        return False
+        return termin_is_group_term(termin)
+
+    def _group_flag(self, termin: Termin) -> bool:
+        """Cached is_group_term, keyed by source Termin id (series occurrences share the flag)."""
+        key = source_termin_id(termin.id)
+        flag = self._group_term_flags.get(key)
+        if flag is None:
+            flag = self._group_term_memo.get(key)
+            if flag is None:
+                flag = termin_is_group_term(termin)
+                self._group_term_memo[key] = flag
+        return flag
 
     def _are_study_plan_alternatives(self, t1: Termin, t2: Termin) -> bool:
-        if self.is_group_term(t1) or self.is_group_term(t2):
+        if self._group_flag(t1) or self._group_flag(t2):
             return True
 
         if str(t1.lva_id) != str(t2.lva_id):
@@ -823,7 +1346,7 @@ class ConflictDetector:
     def _are_lecturer_alternatives(self, t1: Termin, t2: Termin) -> bool:
         if str(t1.lva_id) == str(t2.lva_id):
             return True
-        return self.is_group_term(t1) or self.is_group_term(t2)
+        return self._group_flag(t1) or self._group_flag(t2)
 
     def _capacity_event_types(self, settings, fallback: str) -> set[str]:
         settings = settings or {}
@@ -838,149 +1361,120 @@ class ConflictDetector:
     def detect_capacity_warning_uebung(
         self, termine: List[Termin], settings=None
     ) -> List[ConflictIssue]:
-        warnings = []
-        percent = settings.get("min_capacity_percent", 100) if settings else 100
-        event_types = self._capacity_event_types(settings, "UE")
-        for t in termine:
-            if not self.is_assigned(t):
-                continue
-            raum = getattr(t, "raum", None) or next(
-                (r for r in self.raeume if r.id == t.raum_id), None
-            )
-            gruppe = getattr(t, "gruppe", None)
-            lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-            if raum and gruppe and (str(t.typ or "").strip().upper() in event_types):
-                required = int(gruppe.groesse * percent / 100)
-                if raum.kapazitaet < required:
-                    msg = self._render_message(
-                        settings,
-                        {
-                            "group_size": gruppe.groesse,
-                            "percent": percent,
-                            "required": required,
-                            "room_capacity": raum.kapazitaet,
-                        },
-                    )
-                    warnings.append(
-                        ConflictIssue(
-                            severity="warning",
-                            category="Kapazität Übung",
-                            termin_ids=[t.id],
-                            message=msg,
-                            datum=t.datum,
-                            zeit_von=t.start_zeit,
-                            zeit_bis=t.get_end_time(),
-                            raum=raum.name,
-                            lva=lva.name if lva else t.lva_id,
-                            gruppe=gruppe.name,
-                        )
-                    )
-        return warnings
+        return self._detect_single("capacity_warning_uebung", termine, settings)
 
     def detect_capacity_warning_vorlesung(
         self, termine: List[Termin], settings=None
     ) -> List[ConflictIssue]:
-        warnings = []
-        percent = settings.get("min_capacity_percent", 60) if settings else 60
-        event_types = self._capacity_event_types(settings, "VO")
-        for t in termine:
-            if not self.is_assigned(t):
-                continue
-            raum = getattr(t, "raum", None) or next(
-                (r for r in self.raeume if r.id == t.raum_id), None
-            )
-            gruppe = getattr(t, "gruppe", None)
-            lva = next((l for l in self.lvas if l.id == t.lva_id), None)
-            if raum and gruppe and (str(t.typ or "").strip().upper() in event_types):
-                required = int(gruppe.groesse * percent / 100)
-                if raum.kapazitaet < required:
-                    msg = self._render_message(
-                        settings,
-                        {
-                            "group_size": gruppe.groesse,
-                            "percent": percent,
-                            "required": required,
-                            "room_capacity": raum.kapazitaet,
-                        },
-                    )
-                    warnings.append(
-                        ConflictIssue(
-                            severity="warning",
-                            category="Kapazität Vorlesung",
-                            termin_ids=[t.id],
-                            message=msg,
-                            datum=t.datum,
-                            zeit_von=t.start_zeit,
-                            zeit_bis=t.get_end_time(),
-                            raum=raum.name,
-                            lva=lva.name if lva else t.lva_id,
-                            gruppe=gruppe.name,
-                        )
-                    )
-        return warnings
-
-    def _load_free_days_map(self, conflict_settings_path: Optional[str]) -> Dict[date, set[str]]:
-        if self.data_dir:
-            free_path = self.data_dir / "freie_tage.json"
-        elif conflict_settings_path:
-            free_path = Path(conflict_settings_path).resolve().parent / "freie_tage.json"
-        else:
-            free_path = Path("data") / "freie_tage.json"
-
-        if not free_path.exists():
-            return {}
-
-        try:
-            payload = json.loads(free_path.read_text(encoding="utf-8-sig"))
-        except Exception:
-            return {}
-
-        out: Dict[date, set[str]] = {}
-        for item in payload.get("freie_tage", []):
-            raw_type = str(item.get("typ", "")).strip().lower()
-            if "feiertag" in raw_type:
-                day_type = "feiertag"
-            elif "vorlesungsfrei" in raw_type:
-                day_type = "vorlesungsfrei"
-            else:
-                continue
+        return self._detect_single("capacity_warning_vorlesung", termine, settings)
 
-            start_raw = str(item.get("von_datum", "")).strip()
-            end_raw = str(item.get("bis_datum", "")).strip()
-            d0 = self._parse_iso_date(start_raw)
-            d1 = self._parse_iso_date(end_raw)
-            if d0 is None or d1 is None or d1 < d0:
-                continue
 
-            cur = d0
-            while cur <= d1:
-                out.setdefault(cur, set()).add(day_type)
-                cur += timedelta(days=1)
+_RULE_METHODS = {key: method_name for key, method_name, _assigned_only in CONFLICT_RULES}
+_ASSIGNED_ONLY = {key for key, _method_name, assigned_only in CONFLICT_RULES if assigned_only}
 
-        return out
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
 
-    def _load_studiensemester_names(self) -> Dict[str, str]:
-        path = Path(__file__).resolve().parents[1] / "studiensemester.json"
-        if not path.exists():
-            return {}
-
-        try:
-            obj = json.loads(path.read_text(encoding="utf-8-sig"))
-        except Exception:
-            return {}
 
-        names: Dict[str, str] = {}
-        for item in obj.get("studiensemester", []):
-            if not isinstance(item, dict):
-                continue
-            semester_id = str(item.get("id", "")).strip()
-            name = str(item.get("name", "")).strip()
-            if semester_id:
-                names[semester_id] = name or semester_id
-        return names
+def _conflict_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool, recreating it when the worker count changed."""
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is not None and _process_pool_workers != workers:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+        if _process_pool is None:
+            # spawn instead of fork: forking a process that runs Qt threads is not safe
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _process_pool_workers = workers
+        return _process_pool
+
+
+def shutdown_conflict_process_pool() -> None:
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_workers = 0
+
+
+atexit.register(shutdown_conflict_process_pool)
+
+
+def _partition_by_date(
+    items: List[Tuple[int, Termin]], parts: int
+) -> List[List[Tuple[int, Termin]]]:
+    """Split (position, Termin) items into at most `parts` contiguous date ranges of equal size."""
+    counts: Dict[date, int] = {}
+    for _pos, t in items:
+        counts[t.datum] = counts.get(t.datum, 0) + 1
+    target = max(1, -(-len(items) // max(1, parts)))
+
+    chunk_by_date: Dict[date, int] = {}
+    chunk_index = 0
+    filled = 0
+    for day in sorted(counts):
+        if filled >= target:
+            chunk_index += 1
+            filled = 0
+        chunk_by_date[day] = chunk_index
+        filled += counts[day]
+
+    chunks: List[List[Tuple[int, Termin]]] = [[] for _ in range(chunk_index + 1)]
+    for pos, t in items:
+        chunks[chunk_by_date[t.datum]].append((pos, t))
+    return [chunk for chunk in chunks if chunk]
+
+
+def _detect_partition(task) -> List[Tuple[tuple, ConflictIssue]]:
+    """Process pool entry point: run some rules on one partition and return sortable issues."""
+    rule_keys, items, lvas, raeume, config = task
+    detector = ConflictDetector(lvas, raeume, config=config)
+    termine = [t for _pos, t in items]
+    position_by_id: Dict[str, int] = {}
+    termin_by_id: Dict[str, Termin] = {}
+    for pos, t in items:
+        position_by_id.setdefault(str(t.id), pos)
+        termin_by_id.setdefault(str(t.id), t)
+
+    rule_order = {key: index for index, key in enumerate(detector.rule_keys())}
+    unary = detector._unary_matches(
+        [
+            (key, key in _ASSIGNED_ONLY, detector.conflict_settings.get(key, {}))
+            for key in rule_keys
+            if key not in PAIR_RULES
+        ],
+        termine,
+    )
+    out: List[Tuple[tuple, ConflictIssue]] = []
+    for rule_key in rule_keys:
+        rule_index = rule_order[rule_key]
+        settings = detector.conflict_settings.get(rule_key, {})
+        if rule_key in unary:
+            for issue in detector._single_issues(rule_key, unary[rule_key], settings):
+                out.append(((rule_index, position_by_id[str(issue.termin_ids[0])]), issue))
+            continue
 
-    def _parse_iso_date(self, raw: str) -> Optional[date]:
-        try:
-            return datetime.strptime(raw, "%Y-%m-%d").date()
-        except Exception:
-            return None
+        source = [t for t in termine if detector.is_assigned(t)]
+        detected = detector._run_rule(rule_key, source, settings) or []
+
+        bucket_first: Dict[object, int] = {}
+        for t in source:
+            bucket = detector._pair_bucket_key(rule_key, t)
+            if bucket is not None:
+                bucket_first.setdefault(bucket, position_by_id[str(t.id)])
+        for issue in detected:
+            left_id, right_id = (str(tid) for tid in issue.termin_ids[:2])
+            bucket = detector._pair_bucket_key(rule_key, termin_by_id[left_id])
+            sort_key = (
+                rule_index,
+                bucket_first.get(bucket, position_by_id[left_id]),
+                position_by_id[left_id],
+                position_by_id[right_id],
+            )
+            out.append((sort_key, issue))
+    return out
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 from datetime import datetime, date, time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..core.models import Raum, Vortragende, Lehrveranstaltung, Gruppe, SerienAusnahme, Termin
 from .data_folder_service import (
@@ -23,6 +23,14 @@ class DataService:
     def _src_json_path(self, filename: str) -> Path:
         return Path(__file__).resolve().parents[1] / filename
 
+    def file_stamp(self, filename: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a data file, None if it is missing; changes when it is written"""
+        try:
+            stat = (self.data_dir / filename).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _read(self, filename: str) -> Dict[str, Any]:
         path = self.data_dir / filename
         return json.loads(path.read_text(encoding="utf-8-sig"))
@@ -202,6 +210,7 @@ class DataService:
             periodizitaet=self._parse_periodizitaet(x.get("periodizitaet")),
             ausfall_daten=self._parse_date_list(x.get("ausfall_daten")),
             serien_ausnahmen=self._parse_series_exceptions(x.get("serien_ausnahmen")),
+            fixiert=self._parse_bool(x.get("fixiert", False)),
         )
 
     def load_settings(self) -> Dict[str, Any]:
@@ -288,6 +297,7 @@ class DataService:
                             }
                             for a in (getattr(t, "serien_ausnahmen", []) or [])
                         ],
+                        "fixiert": bool(getattr(t, "fixiert", False)),
                     }
                     for t in termine
                 ]
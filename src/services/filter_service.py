@@ -1,7 +1,12 @@
-from typing import List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from ..core.models import Termin
-from datetime import date as _date, time as _time
+from .project_index_service import ProjectIndex, termin_sort_key
+
+# Number of filter results kept by TerminFilterIndex
+FILTER_CACHE_SIZE = 32
 
 
 def filter_termine(
@@ -40,9 +45,9 @@ def filter_termine(
         Matches Termine through the Studienrichtung stored on their associated LVA.
         Requires lva_dict; raises ValueError if it is missing.
 
-    Sort order:
-        Unassigned Termine (datum=None) are placed first so they are always visible
-        at the top of the Termine dock regardless of date filters. Assigned Termine
+    Sort order (termin_sort_key):
+        Unassigned Termine (no date or no start time) are placed first so they are always
+        visible at the top of the Termine dock regardless of date filters. Assigned Termine
         are sorted by (date, start_time, id).
     """
     out = termine
@@ -94,14 +99,230 @@ def filter_termine(
     if datum:
         out = [t for t in out if t.datum is not None and t.datum.isoformat() == datum]
 
-    def _sort_key(t: Termin):
-        # unassigned first
-        unassigned = t.datum is None
+    return sorted(out, key=termin_sort_key)
+
+
+class TerminFilterIndex:
+    """
+    Inverted indexes over the Termine of a ProjectIndex for the planner filters.
+
+    Every criterion maps its values to the set of matching Termin ids, so a filter is a set
+    intersection over the given criteria; the hits are put in order by their rank in
+    ProjectIndex.sorted_termine. Results are cached per filter combination and data
+    version (LRU, FILTER_CACHE_SIZE entries). When the index moved on by one version only the
+    changed Termine are re-indexed; otherwise, or after LVAs or rooms changed, the indexes
+    are rebuilt. The matching rules are the same as in filter_termine.
+    """
+
+    CRITERIA = (
+        "semester",
+        "studiensemester",
+        "raum",
+        "gebaeude",
+        "lva",
+        "typ",
+        "dozent",
+        "studienrichtung",
+        "zu_besprechen",
+        "datum",
+    )
+
+    def __init__(self, index: ProjectIndex, cache_size: int = FILTER_CACHE_SIZE):
+        self.index = index
+        self.cache_size = cache_size
+        self._version: Optional[int] = None
+        # criterion -> value -> ids of matching Termine
+        self._by: Dict[str, Dict[object, Set[str]]] = {name: {} for name in self.CRITERIA}
+        # Termin id -> Termin as indexed
+        self._termine: Dict[str, Termin] = {}
+        self._cache: "OrderedDict[Tuple, List[Termin]]" = OrderedDict()
+
+    def filter(
+        self,
+        semester_id: Optional[str] = None,
+        studiensemester: Optional[str] = None,
+        raum_id: Optional[str] = None,
+        gebaeude: Optional[str] = None,
+        lva_id: Optional[str] = None,
+        typ: Optional[str] = None,
+        dozent: Optional[str] = None,
+        studienrichtung: Optional[str] = None,
+        zu_besprechen: bool = False,
+        datum: Optional[str] = None,
+    ) -> List[Termin]:
+        """
+        Sorted Termine matching every given criterion. gebaeude (the building of the room)
+        is ignored when raum_id is given. The returned list is a copy and may be modified.
+        """
+        self._ensure_current()
+        criteria = (
+            ("semester", semester_id),
+            ("studiensemester", studiensemester),
+            ("raum", raum_id),
+            ("gebaeude", None if raum_id else gebaeude),
+            ("lva", lva_id),
+            ("typ", typ),
+            ("dozent", dozent),
+            ("studienrichtung", studienrichtung),
+            ("zu_besprechen", True if zu_besprechen else None),
+            ("datum", datum),
+        )
+        key = (self._version,) + tuple(value or None for _name, value in criteria)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return list(cached)
+
+        sets = [self._by[name].get(value, set()) for name, value in criteria if value]
+        ordered = self.index.sorted_termine
+        if sets:
+            sets.sort(key=len)
+            hits = sets[0].intersection(*sets[1:])
+            rank = self.index.sort_rank()
+            result = [ordered[pos] for pos in sorted(rank[tid] for tid in hits)]
+        else:
+            result = list(ordered)
+
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return list(result)
+
+    def values(self, criterion: str) -> FrozenSet[object]:
+        """Values of criterion that at least one Termin has (e.g. all Termin types)."""
+        self._ensure_current()
+        return frozenset(self._by[criterion])
+
+    def _ensure_current(self) -> None:
+        index = self.index
+        changed = index.changes_since(self._version)
+        if changed is not None and not changed:
+            return
+        if changed is not None:
+            for tid in changed:
+                self._unindex(tid)
+            for termin in index.termine:
+                if str(termin.id) in changed:
+                    self._index(termin)
+        else:
+            self._by = {name: {} for name in self.CRITERIA}
+            self._termine = {}
+            for termin in index.termine:
+                self._index(termin)
+        self._version = index.version
+        self._cache.clear()
+
+    def _unindex(self, tid: str) -> None:
+        termin = self._termine.pop(tid, None)
+        if termin is None:
+            return
+        for name, value in self._entries(termin):
+            ids = self._by[name].get(value)
+            if ids is not None:
+                ids.discard(tid)
+                if not ids:
+                    del self._by[name][value]
+
+    def _index(self, termin: Termin) -> None:
+        tid = str(termin.id)
+        self._termine[tid] = termin
+        by = self._by
+        for name, value in self._entries(termin):
+            ids = by[name].get(value)
+            if ids is None:
+                by[name][value] = {tid}
+            else:
+                ids.add(tid)
+
+    def _entries(self, t: Termin) -> List[Tuple[str, object]]:
+        """(criterion, value) pairs t is indexed under."""
+        lva = self.index.lva_by_id.get(str(t.lva_id))
+        raum = self.index.raum_by_id.get(str(t.raum_id))
+        entries = [
+            ("semester", t.semester_id),
+            ("raum", t.raum_id),
+            ("gebaeude", str(getattr(raum, "gebaeude", "") or "").strip()),
+            ("lva", t.lva_id),
+            ("typ", t.typ),
+            ("zu_besprechen", bool(t.zu_besprechen)),
+            ("datum", t.datum.isoformat() if t.datum is not None else None),
+        ]
+        if lva is not None:
+            entries.extend(("studiensemester", value) for value in lva.studiensemester or [])
+            entries.append(("studienrichtung", lva.studienrichtung))
+            entries.append(("dozent", getattr(lva.vortragende, "name", None)))
+        return [(name, value) for name, value in entries if value]
+
+
+# (text, data) entry of a filter combo
+FilterItem = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class FilterOptions:
+    """Entries of the global filter combos, each without its "Alle" entry."""
+
+    studienrichtungen: Tuple[FilterItem, ...] = ()
+    studiensemester: Tuple[FilterItem, ...] = ()
+    lvas: Tuple[FilterItem, ...] = ()
+    dozenten: Tuple[FilterItem, ...] = ()
+    typen: Tuple[FilterItem, ...] = ()
+    gebaeude: Tuple[FilterItem, ...] = ()
+    # (text, room id, building); the room combo shows the rooms of the selected building
+    raeume: Tuple[Tuple[str, str, str], ...] = ()
+
+
+def build_filter_options(
+    studienrichtungen: Iterable,
+    lva_list: Iterable,
+    raum_list: Iterable,
+    studiensemester_list: Optional[Iterable] = None,
+    typ_list: Optional[Iterable[str]] = None,
+    dozent_list: Optional[Iterable[str]] = None,
+) -> FilterOptions:
+    """
+    Combo entries for the given master data. studiensemester_list supplies display names
+    (dicts or objects with id and name); dozent_list defaults to the lecturers of the LVAs.
+    """
+    lva_list = list(lva_list)
+    sem_id_to_display = {}
+    for item in studiensemester_list or []:
+        if isinstance(item, dict):
+            semester_id = str(item.get("id", "")).strip()
+            name = str(item.get("name", "")).strip()
+        else:
+            semester_id = str(getattr(item, "id", "")).strip()
+            name = str(getattr(item, "name", "")).strip()
+        if semester_id:
+            sem_id_to_display[semester_id] = name or semester_id
+    studiensemester_ids = {
+        sem_id for lv in lva_list for sem_id in getattr(lv, "studiensemester", [])
+    }
+
+    studienrichtung_items = []
+    for f in studienrichtungen:
+        if isinstance(f, dict):
+            studienrichtung_items.append((f.get("name", f.get("id", "")), f.get("id", "")))
+        else:
+            studienrichtung_items.append((str(f), str(f)))
 
-        d = t.datum or _date.min
-        von = t.start_zeit if t.start_zeit else _time.min
+    if dozent_list is None:
+        dozent_list = [getattr(getattr(lv, "vortragende", None), "name", "") for lv in lva_list]
 
-        # (False, ...) comes before (True, ...) so invert: (not)
-        return (not unassigned, d, von, t.id)
+    rooms = []
+    for r in raum_list:
+        building = str(getattr(r, "gebaeude", "") or "").strip()
+        rooms.append((f"{r.id} – {getattr(r, 'name', '')}", r.id, building))
 
-    return sorted(out, key=_sort_key)
+    return FilterOptions(
+        studienrichtungen=tuple(studienrichtung_items),
+        studiensemester=tuple(
+            (sem_id_to_display.get(sem_id, sem_id), sem_id)
+            for sem_id in sorted(studiensemester_ids)
+        ),
+        lvas=tuple((f"{lv.id} – {getattr(lv, 'name', '')}", lv.id) for lv in lva_list),
+        dozenten=tuple((d, d) for d in sorted({d for d in dozent_list if d})),
+        typen=tuple((tp, tp) for tp in sorted({t for t in typ_list or [] if t})),
+        gebaeude=tuple((b, b) for b in sorted({b for _text, _id, b in rooms if b})),
+        raeume=tuple(rooms),
+    )
@@ -0,0 +1,206 @@
+"""
+Slot bitmaps of occupied times per resource and day.
+
+A day is split into slots of `slot_minutes` starting at midnight; bit i of a bitmap is set
+when slot i overlaps at least one Termin. Bitmaps are plain Python ints, so "free in all of
+these rooms", "free for lecturer and group" or "free for 90 minutes in a row" are single
+&, | and shift operations per resource.
+"""
+
+from datetime import date, time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..core.models import Termin, Zeitfenster
+from .termin_occurrence_service import expand_termin
+
+# (resource key, date, semester id, occupied slots) of one occurrence
+Contribution = Tuple[str, date, str, int]
+ResourceKeys = Callable[[Termin], Iterable[str]]
+
+
+def room_resource_keys(termin: Termin) -> Iterable[str]:
+    return [str(termin.raum_id)] if termin.raum_id else []
+
+
+def minutes_of(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def time_of(minutes: int) -> time:
+    minutes = max(0, min(minutes, 24 * 60 - 1))
+    return time(minutes // 60, minutes % 60)
+
+
+def fit_starts(free: int, slots: int) -> int:
+    """Bits i of free at which `slots` consecutive free slots begin."""
+    result = free
+    span = 1
+    while span < slots and result:
+        step = min(span, slots - span)
+        result &= result >> step
+        span += step
+    return result
+
+
+def free_runs(free: int) -> List[Tuple[int, int]]:
+    """(first slot, number of slots) of every run of set bits, in ascending order."""
+    runs = []
+    while free:
+        start = (free & -free).bit_length() - 1
+        shifted = free >> start
+        length = (shifted ^ (shifted + 1)).bit_length() - 1
+        runs.append((start, length))
+        free &= ~(((1 << length) - 1) << start)
+    return runs
+
+
+class OccupancyIndex:
+    """
+    Occupied slots per (resource, date), e.g. per room, lecturer or student group.
+
+    `sync` brings the index up to date with a list of source Termine. Only Termine that were
+    added, changed or removed since the previous sync are (re)expanded; the bitmaps of the
+    (resource, date) pairs they touch are rebuilt from the remaining contributions.
+    """
+
+    def __init__(self, slot_minutes: int = 15, resource_keys: ResourceKeys = room_resource_keys):
+        self.slot_minutes = max(1, int(slot_minutes or 15))
+        self.slots_per_day = -(-24 * 60 // self.slot_minutes)
+        self.resource_keys = resource_keys
+        self._termin_by_id: Dict[str, Termin] = {}
+        self._contributions: Dict[str, List[Contribution]] = {}
+        # date -> resource -> [(source Termin id, semester id, slots)]
+        self._entries: Dict[date, Dict[str, List[Tuple[str, str, int]]]] = {}
+        # date -> resource -> OR of all entries
+        self._bits: Dict[date, Dict[str, int]] = {}
+
+    def sync(
+        self,
+        termine: Iterable[Termin],
+        occurrences_of: Callable[[Termin], List[Termin]] = expand_termin,
+    ) -> Set[str]:
+        """Update the bitmaps for termine and return the ids of changed source Termine."""
+        seen: Set[str] = set()
+        changed: Set[str] = set()
+        for termin in termine:
+            tid = str(termin.id)
+            seen.add(tid)
+            previous = self._termin_by_id.get(tid)
+            if previous is not None and (previous is termin or previous == termin):
+                continue
+            changed.add(tid)
+            self._remove(tid)
+            self._add(tid, termin, occurrences_of(termin))
+        for tid in [tid for tid in self._termin_by_id if tid not in seen]:
+            changed.add(tid)
+            self._remove(tid)
+        return changed
+
+    def add(self, termin: Termin, occurrences: List[Termin]) -> None:
+        """Add (or replace) one source Termin without a full sync, e.g. a tentative placement."""
+        tid = str(termin.id)
+        self._remove(tid)
+        self._add(tid, termin, occurrences)
+
+    def discard(self, termin_id: str) -> None:
+        self._remove(str(termin_id))
+
+    def slot_mask(self, start: time, end: Optional[time]) -> int:
+        """Slots overlapping [start, end); an end at or before start means until midnight."""
+        first = minutes_of(start) // self.slot_minutes
+        end_minutes = minutes_of(end) if end is not None else 0
+        if end_minutes <= minutes_of(start):
+            end_minutes = 24 * 60
+        last = -(-end_minutes // self.slot_minutes)
+        return ((1 << max(0, last - first)) - 1) << first
+
+    def window_mask(self, day_start: time, day_end: time) -> int:
+        """Slots that lie completely within [day_start, day_end)."""
+        first = -(-minutes_of(day_start) // self.slot_minutes)
+        last = minutes_of(day_end) // self.slot_minutes
+        if last <= first:
+            return 0
+        return ((1 << (last - first)) - 1) << first
+
+    def busy(self, resource: str, datum: date, semester_id: Optional[str] = None) -> int:
+        by_resource = self._bits.get(datum)
+        if not by_resource:
+            return 0
+        if semester_id is None:
+            return by_resource.get(str(resource), 0)
+        bits = 0
+        for _tid, entry_semester, mask in self._entries[datum].get(str(resource), ()):
+            if entry_semester == semester_id:
+                bits |= mask
+        return bits
+
+    def busy_any(self, resources: Iterable[str], datum: date) -> int:
+        """Slots in which at least one of the resources is occupied."""
+        by_resource = self._bits.get(datum)
+        if not by_resource:
+            return 0
+        bits = 0
+        for resource in resources:
+            bits |= by_resource.get(str(resource), 0)
+        return bits
+
+    def busy_resources(self, datum: date) -> Dict[str, int]:
+        """All resources with occupied slots on datum (resource -> bitmap)."""
+        return dict(self._bits.get(datum, {}))
+
+    def free_windows(self, free: int, duration_minutes: int) -> List[Zeitfenster]:
+        """Runs of free slots that are at least duration_minutes long."""
+        needed = max(1, -(-int(duration_minutes) // self.slot_minutes))
+        return [
+            Zeitfenster(
+                von=time_of(start * self.slot_minutes),
+                bis=time_of((start + length) * self.slot_minutes),
+            )
+            for start, length in free_runs(free)
+            if length >= needed
+        ]
+
+    def free_resources(
+        self, resources: Sequence[str], datum: date, start: time, end: time
+    ) -> List[str]:
+        """Resources (in the given order) without any Termin between start and end."""
+        mask = self.slot_mask(start, end)
+        by_resource = self._bits.get(datum, {})
+        return [r for r in resources if not by_resource.get(str(r), 0) & mask]
+
+    def _add(self, tid: str, termin: Termin, occurrences: List[Termin]) -> None:
+        self._termin_by_id[tid] = termin
+        contributions: List[Contribution] = []
+        for occurrence in occurrences:
+            if occurrence.datum is None or occurrence.start_zeit is None:
+                continue
+            if int(occurrence.duration or 0) <= 0:
+                continue
+            mask = self.slot_mask(occurrence.start_zeit, occurrence.get_end_time())
+            semester_id = str(occurrence.semester_id or "")
+            for resource in self.resource_keys(occurrence):
+                contributions.append((str(resource), occurrence.datum, semester_id, mask))
+        self._contributions[tid] = contributions
+        for resource, datum, semester_id, mask in contributions:
+            self._entries.setdefault(datum, {}).setdefault(resource, []).append(
+                (tid, semester_id, mask)
+            )
+            by_resource = self._bits.setdefault(datum, {})
+            by_resource[resource] = by_resource.get(resource, 0) | mask
+
+    def _remove(self, tid: str) -> None:
+        self._termin_by_id.pop(tid, None)
+        for resource, datum in {(c[0], c[1]) for c in self._contributions.pop(tid, [])}:
+            entries = [e for e in self._entries[datum][resource] if e[0] != tid]
+            if entries:
+                self._entries[datum][resource] = entries
+                bits = 0
+                for _tid, _semester, mask in entries:
+                    bits |= mask
+                self._bits[datum][resource] = bits
+                continue
+            del self._entries[datum][resource]
+            del self._bits[datum][resource]
+            if not self._entries[datum]:
+                del self._entries[datum]
+                del self._bits[datum]
@@ -0,0 +1,301 @@
+"""
+Local search that reduces the warnings of an existing plan.
+
+Three kinds of moves are tried: shift a Termin to another full-hour start (single Termine
+also to another weekday of the same week), swap the rooms of two Termine that overlap in
+time, and swap the slots (date and start time) of two Termine of the same duration.
+
+A move is scored only by the Termine it changes: single-Termin rules through
+ConflictDetector.single_issue_counts, pair rules through the occupancy bitmaps of a
+CommonSlotFinder (CommonSlotFinder.overlaps). Scoring therefore does not depend on the size
+of the plan. A move is kept if it adds no conflict and lowers the weighted score. Locked
+Termine (see is_locked) never move; series with individually moved dates are left alone.
+"""
+
+import random
+import time as time_module
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.models import Termin
+from .conflict_service import (
+    ConflictConfig,
+    ConflictCounts,
+    ConflictDetector,
+    load_conflict_config,
+)
+from .occupancy_service import minutes_of, time_of
+from .project_index_service import ProjectIndex
+from .slot_finder_service import DEFAULT_WEEKDAYS, CommonSlotFinder
+from .termin_occurrence_service import expand_termin
+
+DEFAULT_TIME_BUDGET_S = 5.0
+# A conflict outweighs any number of warnings a move could remove
+CONFLICT_WEIGHT = 1000
+# Start times tried per shift move
+SHIFT_CANDIDATES = 8
+# Partner Termine tried per swap move
+SWAP_CANDIDATES = 4
+
+# (conflicts, warnings)
+Score = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class TerminChange:
+    before: Termin
+    after: Termin
+
+
+@dataclass
+class OptimizationResult:
+    changes: List[TerminChange] = field(default_factory=list)
+    before: ConflictCounts = field(default_factory=lambda: ConflictCounts({}))
+    after: ConflictCounts = field(default_factory=lambda: ConflictCounts({}))
+    moves_tried: int = 0
+    moves_accepted: int = 0
+
+    def apply(self, termine: Iterable[Termin]) -> List[Termin]:
+        """termine with every change of the result applied."""
+        by_id = {str(change.after.id): change.after for change in self.changes}
+        return [by_id.get(str(t.id), t) for t in termine]
+
+
+def is_locked(termin: Termin, locked_ids: Set[str] | frozenset = frozenset()) -> bool:
+    """Termine the optimiser must not move: pinned, still to be discussed or listed."""
+    return (
+        bool(getattr(termin, "fixiert", False))
+        or bool(getattr(termin, "zu_besprechen", False))
+        or str(termin.id) in locked_ids
+    )
+
+
+def _weight(score: Score) -> int:
+    return score[0] * CONFLICT_WEIGHT + score[1]
+
+
+class PlanOptimizer:
+    """Hill climbing over shift and swap moves under a time budget."""
+
+    def __init__(
+        self,
+        index: ProjectIndex,
+        settings: Dict,
+        data_dir: str | Path | None = None,
+        config: Optional[ConflictConfig] = None,
+        seed: int = 0,
+    ):
+        self.index = index
+        self.settings = settings or {}
+        config = config if config is not None else load_conflict_config(data_dir=data_dir)
+        self.finder = CommonSlotFinder(index, self.settings, config=config)
+        self.detector = ConflictDetector(index.lvas, index.raeume, config=config, index=index)
+        self.random = random.Random(seed)
+        day_start = datetime.strptime(self.settings.get("day_start", "08:00"), "%H:%M").time()
+        day_end = datetime.strptime(self.settings.get("day_end", "18:00"), "%H:%M").time()
+        self._day_start = minutes_of(day_start)
+        self._day_end = minutes_of(day_end)
+        self._current: Dict[str, Termin] = {}
+        # date -> ids of movable single Termine on that date (swap partners)
+        self._singles_by_date: Dict[date, Set[str]] = {}
+
+    def optimize(
+        self,
+        locked_ids: Iterable[str] = (),
+        time_budget: float = DEFAULT_TIME_BUDGET_S,
+        semester_id: Optional[str] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> OptimizationResult:
+        """
+        Improve the plan of the index (only Termine of semester_id, if given) for at most
+        time_budget seconds and return the changes with exact before/after issue counts.
+        """
+        deadline = time_module.perf_counter() + max(0.0, float(time_budget))
+        locked = {str(tid) for tid in locked_ids}
+        self._current = {str(t.id): t for t in self.index.termine}
+        movable = [
+            str(t.id)
+            for t in self.index.termine
+            if t.datum is not None
+            and t.start_zeit is not None
+            and int(t.duration or 0) > 0
+            and not t.serien_ausnahmen
+            and not is_locked(t, locked)
+            and (semester_id is None or t.semester_id == semester_id)
+        ]
+        self._singles_by_date = {}
+        for tid in movable:
+            termin = self._current[tid]
+            if not termin.is_series():
+                self._singles_by_date.setdefault(termin.datum, set()).add(tid)
+        self.finder.sync()
+
+        result = OptimizationResult(before=self.detector.count_all(self.index.termine))
+        moves = (self._try_shift, self._try_room_swap, self._try_slot_swap)
+        order = list(movable)
+        while order and time_module.perf_counter() < deadline:
+            if should_stop is not None and should_stop():
+                break
+            self.random.shuffle(order)
+            improved = False
+            for tid in order:
+                if time_module.perf_counter() >= deadline:
+                    break
+                if self._score_in_place(self._current[tid]) == (0, 0):
+                    continue
+                for move in self.random.sample(moves, len(moves)):
+                    result.moves_tried += 1
+                    if move(tid):
+                        result.moves_accepted += 1
+                        improved = True
+                        break
+            if not improved:
+                break
+
+        originals = {str(t.id): t for t in self.index.termine}
+        result.changes = [
+            TerminChange(before=originals[tid], after=termin)
+            for tid, termin in self._current.items()
+            if termin != originals[tid]
+        ]
+        result.after = self.detector.count_all(result.apply(self.index.termine))
+        return result
+
+    def _score(self, termin: Termin) -> Score:
+        """Score of termin against the occupancy, which must not contain termin itself."""
+        single_conflicts, single_warnings = self.detector.single_issue_counts(expand_termin(termin))
+        pair_conflicts, pair_warnings = self.finder.overlaps(termin)
+        return single_conflicts + pair_conflicts, single_warnings + pair_warnings
+
+    def _score_in_place(self, termin: Termin) -> Score:
+        self.finder.release(str(termin.id))
+        try:
+            return self._score(termin)
+        finally:
+            self.finder.reserve(termin)
+
+    def _try(self, options: List[List[Termin]]) -> bool:
+        """
+        Apply the best of several alternative moves if it is an improvement.
+
+        Every option lists the new versions of the Termine it changes; all options of one
+        call must change the same Termine.
+        """
+        if not options:
+            return False
+        olds = [self._current[str(t.id)] for t in options[0]]
+        for old in olds:
+            self.finder.release(str(old.id))
+        before = [sum(s) for s in zip(*(self._score(old) for old in olds))]
+        best: Optional[List[Termin]] = None
+        best_score = before
+        for option in options:
+            score = [sum(s) for s in zip(*(self._score(new) for new in option))]
+            if score[0] <= before[0] and _weight(score) < _weight(best_score):
+                best, best_score = option, score
+        for termin in best if best is not None else olds:
+            self.finder.reserve(termin)
+        if best is None:
+            return False
+        for old, new in zip(olds, best):
+            self._update(old, new)
+        return True
+
+    def _update(self, old: Termin, new: Termin) -> None:
+        tid = str(new.id)
+        self._current[tid] = new
+        if not new.is_series():
+            self._singles_by_date.get(old.datum, set()).discard(tid)
+            self._singles_by_date.setdefault(new.datum, set()).add(tid)
+
+    def _start_times(self, termin: Termin) -> List[time]:
+        latest = self._day_end - int(termin.duration)
+        first_hour = -(-self._day_start // 60)
+        return [
+            time_of(hour * 60)
+            for hour in range(first_hour, 24)
+            if hour * 60 <= latest and time_of(hour * 60) != termin.start_zeit
+        ]
+
+    def _try_shift(self, tid: str) -> bool:
+        termin = self._current[tid]
+        starts = self._start_times(termin)
+        if termin.is_series():
+            slots = [(termin.datum, start) for start in starts]
+        else:
+            monday = termin.datum - timedelta(days=termin.datum.weekday())
+            days = [
+                monday + timedelta(days=weekday)
+                for weekday in DEFAULT_WEEKDAYS
+                if not self.finder.blocked_day(monday + timedelta(days=weekday))
+            ]
+            slots = [(day, start) for day in days for start in starts]
+            slots += [(day, termin.start_zeit) for day in days if day != termin.datum]
+        if not slots:
+            return False
+        picked = self.random.sample(slots, min(SHIFT_CANDIDATES, len(slots)))
+        options = []
+        for datum, start in picked:
+            moved = replace(termin, start_zeit=start)
+            if not termin.is_series():
+                moved = replace(moved, datum=datum)
+            options.append([moved])
+        return self._try(options)
+
+    def _try_room_swap(self, tid: str) -> bool:
+        termin = self._current[tid]
+        if termin.is_series():
+            return False
+        end = minutes_of(termin.start_zeit) + int(termin.duration)
+        partners = [
+            other
+            for other_id in self._singles_by_date.get(termin.datum, ())
+            if other_id != tid
+            and (other := self._current[other_id]).raum_id != termin.raum_id
+            and minutes_of(other.start_zeit) < end
+            and minutes_of(termin.start_zeit) < minutes_of(other.start_zeit) + other.duration
+        ]
+        for other in self.random.sample(partners, min(SWAP_CANDIDATES, len(partners))):
+            if self._try(
+                [[replace(termin, raum_id=other.raum_id), replace(other, raum_id=termin.raum_id)]]
+            ):
+                return True
+        return False
+
+    def _try_slot_swap(self, tid: str) -> bool:
+        termin = self._current[tid]
+        if termin.is_series():
+            return False
+        monday = termin.datum - timedelta(days=termin.datum.weekday())
+        partners = [
+            other
+            for weekday in range(7)
+            for other_id in self._singles_by_date.get(monday + timedelta(days=weekday), ())
+            if other_id != tid
+            and (other := self._current[other_id]).duration == termin.duration
+            and (other.datum, other.start_zeit) != (termin.datum, termin.start_zeit)
+        ]
+        for other in self.random.sample(partners, min(SWAP_CANDIDATES, len(partners))):
+            swapped = [
+                replace(termin, datum=other.datum, start_zeit=other.start_zeit),
+                replace(other, datum=termin.datum, start_zeit=termin.start_zeit),
+            ]
+            if self._try([swapped]):
+                return True
+        return False
+
+
+def optimize_plan(
+    index: ProjectIndex,
+    *,
+    settings: Dict,
+    data_dir: str | Path | None = None,
+    locked_ids: Iterable[str] = (),
+    time_budget: float = DEFAULT_TIME_BUDGET_S,
+    semester_id: Optional[str] = None,
+) -> OptimizationResult:
+    """One-off optimisation run; see PlanOptimizer."""
+    optimizer = PlanOptimizer(index, settings, data_dir=data_dir)
+    return optimizer.optimize(locked_ids, time_budget=time_budget, semester_id=semester_id)
@@ -0,0 +1,279 @@
+import copy
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, time
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..core.models import Lehrveranstaltung, Raum, Termin
+from .termin_occurrence_service import expand_termin
+
+GROUP_TERM_RE = re.compile(r"\bgr(?:uppe|\.)?\s*[A-Z0-9]", re.IGNORECASE)
+# Above this share of changed Termine the order is sorted again instead of patched
+ORDER_RESORT_SHARE = 0.125
+
+
+def termin_sort_key(t: Termin):
+    """Unassigned Termine (no date or no start time) first, then by (date, start_time, id)."""
+    unassigned = t.datum is None or t.start_zeit is None
+    d = t.datum or date.min
+    von = t.start_zeit if t.start_zeit else time.min
+    # (False, ...) comes before (True, ...) so invert: (not)
+    return (not unassigned, d, von, t.id)
+
+
+def termin_is_group_term(termin: Termin) -> bool:
+    """
+    Return True if a Termin belongs to one of several parallel groups.
+
+    A Termin counts as group Termin when it has a group name/id/label or when its name,
+    notiz or besprechungshinweis mentions a group ("Gruppe A", "Gr. 2", "gr3", ...).
+    All occurrences of a series share the flag of their source Termin.
+    """
+    group_obj = getattr(termin, "gruppe", None)
+    group_name = str(getattr(group_obj, "name", "") or "").strip()
+    group_id = str(getattr(termin, "gruppe_id", "") or "").strip()
+    group_label = str(getattr(termin, "gruppenbezeichnung", "") or "").strip()
+    if group_name or group_id or group_label:
+        return True
+
+    for field_name in ("name", "notiz", "besprechungshinweis"):
+        text = str(getattr(termin, field_name, "") or "")
+        if GROUP_TERM_RE.search(text):
+            return True
+    return False
+
+
+class _SortedTermine:
+    """Termine in termin_sort_key order, patched with bisect."""
+
+    __slots__ = ("items", "keys")
+
+    def __init__(self, termine: Iterable[Termin] = ()) -> None:
+        self.items: List[Termin] = sorted(termine, key=termin_sort_key)
+        self.keys = [termin_sort_key(t) for t in self.items]
+
+    def copy(self) -> "_SortedTermine":
+        other = _SortedTermine()
+        other.items = list(self.items)
+        other.keys = list(self.keys)
+        return other
+
+    def discard(self, termin: Termin) -> None:
+        key = termin_sort_key(termin)
+        pos = bisect_left(self.keys, key)
+        if pos < len(self.keys) and self.keys[pos] == key:
+            del self.keys[pos]
+            del self.items[pos]
+
+    def add(self, termin: Termin) -> None:
+        key = termin_sort_key(termin)
+        pos = bisect_right(self.keys, key)
+        self.keys.insert(pos, key)
+        self.items.insert(pos, termin)
+
+
+class ProjectIndex:
+    """
+    Derived lookup tables for the currently loaded project.
+
+    The index is updated in place whenever the project data is (re)loaded. Per-Termin work
+    such as series expansion and the group flag is only redone for Termine that were added
+    or changed since the last update; unchanged Termine reuse their cached entries.
+    `version` increases with every update that changed anything, so consumers can use it as
+    a cheap cache key. `last_changed` holds the Termin ids changed by the update that
+    produced `version` (None if LVAs or rooms changed), so consumers that are exactly one
+    version behind can catch up incrementally.
+
+    Termine and occurrences are also kept in termin_sort_key order (`sorted_termine`,
+    `sorted_occurrences`). An update moves only the changed entries (bisect) unless more
+    than ORDER_RESORT_SHARE of the Termine changed, so views get sorted data without
+    sorting on every refresh.
+    """
+
+    def __init__(self) -> None:
+        self.termine: List[Termin] = []
+        self.lvas: List[Lehrveranstaltung] = []
+        self.raeume: List[Raum] = []
+        self.occurrences: List[Termin] = []
+        self.termin_map: Dict[str, Termin] = {}
+        self.lva_by_id: Dict[str, Lehrveranstaltung] = {}
+        self.raum_by_id: Dict[str, Raum] = {}
+        # source Termin id -> result of termin_is_group_term
+        self.group_term_flags: Dict[str, bool] = {}
+        self.version = 0
+        self.last_changed: Optional[Set[str]] = None
+        self._termin_by_id: Dict[str, Termin] = {}
+        self._occurrences_by_source: Dict[str, List[Termin]] = {}
+        self._termin_order = _SortedTermine()
+        self._occurrence_order = _SortedTermine()
+        self._sort_rank: Optional[Dict[str, int]] = None
+
+    @property
+    def sorted_termine(self) -> List[Termin]:
+        """Termine in termin_sort_key order. Read-only; copy before modifying."""
+        return self._termin_order.items
+
+    @property
+    def sorted_occurrences(self) -> List[Termin]:
+        """Occurrences (series expanded) in termin_sort_key order. Read-only."""
+        return self._occurrence_order.items
+
+    def sort_rank(self) -> Dict[str, int]:
+        """Termin id -> position in sorted_termine; sorting ids by it restores the order."""
+        if self._sort_rank is None:
+            self._sort_rank = {str(t.id): pos for pos, t in enumerate(self.sorted_termine)}
+        return self._sort_rank
+
+    def changes_since(self, version: Optional[int]) -> Optional[Set[str]]:
+        """
+        Termin ids changed since version (empty if none), or None if a consumer that is at
+        version has to rebuild: it is more than one update behind or LVAs or rooms changed.
+        """
+        if version == self.version:
+            return set()
+        if version is not None and self.version == version + 1 and self.last_changed is not None:
+            return self.last_changed
+        return None
+
+    def occurrences_in_order(self, termin_ids: Iterable[str]) -> List[Termin]:
+        """Occurrences of the given source Termine, in termin_sort_key order."""
+        wanted = {
+            id(occurrence)
+            for tid in termin_ids
+            for occurrence in self._occurrences_by_source.get(str(tid), ())
+        }
+        return [o for o in self.sorted_occurrences if id(o) in wanted]
+
+    @classmethod
+    def build(
+        cls,
+        termine: Iterable[Termin],
+        lvas: Iterable[Lehrveranstaltung],
+        raeume: Iterable[Raum],
+    ) -> "ProjectIndex":
+        index = cls()
+        index.update(termine, lvas, raeume)
+        return index
+
+    def update(
+        self,
+        termine: Iterable[Termin],
+        lvas: Iterable[Lehrveranstaltung],
+        raeume: Iterable[Raum],
+    ) -> Set[str]:
+        """Bring the index up to date and return the ids of added, changed or removed Termine."""
+        termine = list(termine)
+        lvas = list(lvas)
+        raeume = list(raeume)
+        master_data_changed = lvas != self.lvas or raeume != self.raeume
+
+        changed: Set[str] = set()
+        termin_by_id: Dict[str, Termin] = {}
+        occurrences_by_source: Dict[str, List[Termin]] = {}
+        group_term_flags: Dict[str, bool] = {}
+        occurrences: List[Termin] = []
+        for termin in termine:
+            tid = str(termin.id)
+            previous = self._termin_by_id.get(tid)
+            if previous is not None and (previous is termin or previous == termin):
+                expanded = self._occurrences_by_source[tid]
+                flag = self.group_term_flags[tid]
+            else:
+                expanded = expand_termin(termin)
+                flag = termin_is_group_term(termin)
+                changed.add(tid)
+            termin_by_id[tid] = termin
+            occurrences_by_source[tid] = expanded
+            group_term_flags[tid] = flag
+            occurrences.extend(expanded)
+        changed.update(tid for tid in self._termin_by_id if tid not in termin_by_id)
+        if changed:
+            self._update_order(changed, termin_by_id, occurrences_by_source)
+
+        self.termine = termine
+        self.occurrences = occurrences
+        self._termin_by_id = termin_by_id
+        self._occurrences_by_source = occurrences_by_source
+        self.group_term_flags = group_term_flags
+        self.termin_map = {str(t.id): t for t in termine}
+        self.termin_map.update({str(t.id): t for t in occurrences})
+        if master_data_changed:
+            self.lvas = lvas
+            self.raeume = raeume
+            self.lva_by_id = {str(lva.id): lva for lva in lvas}
+            self.raum_by_id = {str(raum.id): raum for raum in raeume}
+        if changed or master_data_changed:
+            self.version += 1
+            self.last_changed = None if master_data_changed else set(changed)
+        return changed
+
+    def _update_order(
+        self,
+        changed: Set[str],
+        termin_by_id: Dict[str, Termin],
+        occurrences_by_source: Dict[str, List[Termin]],
+    ) -> None:
+        """Bring the sorted orders up to date; must run before the maps are replaced."""
+        self._sort_rank = None
+        patch_limit = ORDER_RESORT_SHARE * len(termin_by_id)
+        if not self._termin_order.items or len(changed) > patch_limit:
+            self._termin_order = _SortedTermine(termin_by_id.values())
+            self._occurrence_order = _SortedTermine(
+                o for occurrences in occurrences_by_source.values() for o in occurrences
+            )
+            return
+        # copies, so indexes made by derive() do not share the lists
+        termin_order = self._termin_order.copy()
+        occurrence_order = self._occurrence_order.copy()
+        for tid in changed:
+            previous = self._termin_by_id.get(tid)
+            if previous is not None:
+                termin_order.discard(previous)
+                for occurrence in self._occurrences_by_source[tid]:
+                    occurrence_order.discard(occurrence)
+            termin = termin_by_id.get(tid)
+            if termin is not None:
+                termin_order.add(termin)
+                for occurrence in occurrences_by_source[tid]:
+                    occurrence_order.add(occurrence)
+        self._termin_order = termin_order
+        self._occurrence_order = occurrence_order
+
+    def derive(
+        self,
+        termine: Iterable[Termin],
+        lvas: Iterable[Lehrveranstaltung] | None = None,
+        raeume: Iterable[Raum] | None = None,
+    ) -> "ProjectIndex":
+        """
+        Return an index for other project data (e.g. a preview of an import) that reuses the
+        cached per-Termin entries of this index. This index itself is left unchanged.
+        """
+        other = copy.copy(self)
+        other.update(
+            termine,
+            self.lvas if lvas is None else lvas,
+            self.raeume if raeume is None else raeume,
+        )
+        return other
+
+    def adopt(self, other: "ProjectIndex") -> None:
+        """
+        Take over the state of an index made by derive() from this one, e.g. in a worker
+        thread. Objects holding a reference to this index see the new data.
+        """
+        self.__dict__.update(other.__dict__)
+
+    def changed_termin_ids(self, other: "ProjectIndex") -> Set[str]:
+        """Ids of Termine that were added, removed or changed between this index and other."""
+        changed = {
+            tid
+            for tid, termin in other._termin_by_id.items()
+            if (previous := self._termin_by_id.get(tid)) is None
+            or not (previous is termin or previous == termin)
+        }
+        changed.update(tid for tid in self._termin_by_id if tid not in other._termin_by_id)
+        return changed
+
+    def occurrences_of(self, termin_id: str) -> List[Termin]:
+        return list(self._occurrences_by_source.get(str(termin_id), []))
@@ -0,0 +1,417 @@
+"""
+Substring search over short texts (names, ids, hints).
+
+Every key (e.g. a Termin id) has a few text values. Distinct values are indexed by their
+character bigrams and trigrams, so a query token of two characters is looked up directly and
+a longer one only checks the values that contain all of its trigrams; single characters scan
+the distinct values. A query matches a key when every whitespace-separated token is a
+substring of one of its values, which covers prefix and substring queries. Keys sharing a
+value (all Termine of one LVA share the LVA name) share its index entries.
+
+For ranked results (quick find) the distinct values and the word starts inside them are also
+kept in sorted lists per length, so the best prefix hits are read off in order and a broad
+query stops after the first few. ProjectSearchIndex keeps one such index for the Termine
+(Termine dock search) and one for LVAs, rooms and lecturers; the quick-find palette ranks
+hits from both.
+"""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..core.models import Termin
+from .project_index_service import ProjectIndex
+
+GRAM = 3
+# Two-character words are looked up in the gram index too
+BIGRAM = 2
+QUICK_FIND_LIMIT = 50
+# Up to this many keys left by the other words of a ranked query are scored one by one
+RANK_DIRECTLY = 500
+# Ranking of equally good quick-find hits
+KIND_ORDER = ("dozent", "lva", "raum", "termin")
+# Match quality (lower is better) of SubstringIndex.ranked
+SCORE_EXACT, SCORE_PREFIX, SCORE_WORD_PREFIX, SCORE_SUBSTRING, SCORE_FUZZY = range(5)
+
+
+def normalize_search_text(text) -> str:
+    return str(text or "").strip().lower()
+
+
+def search_tokens(query: str) -> List[str]:
+    return normalize_search_text(query).split()
+
+
+class SubstringIndex:
+    """Keys with text values, searchable by substring; updated key by key."""
+
+    def __init__(self) -> None:
+        self._values_of: Dict[Hashable, Tuple[str, ...]] = {}
+        # value -> keys having it
+        self._keys_of: Dict[str, Set[Hashable]] = {}
+        # trigram -> values containing it
+        self._grams: Dict[str, Set[str]] = {}
+        # length -> sorted values; prefix hits come out shortest first (ranked)
+        self._values_by_len: Dict[int, List[str]] = {}
+        # word start inside a value ("lva 0" of "ue lva 0") -> values having it
+        self._word_heads: Dict[str, Set[str]] = {}
+        self._heads_by_len: Dict[int, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._values_of)
+
+    def set(self, key: Hashable, values: Iterable[str]) -> None:
+        """Index key under values (normalised, empty ones dropped), replacing earlier values."""
+        self.discard(key)
+        normalized = tuple({text for text in map(normalize_search_text, values) if text})
+        self._values_of[key] = normalized
+        for value in normalized:
+            keys = self._keys_of.get(value)
+            if keys is not None:
+                keys.add(key)
+                continue
+            self._keys_of[value] = {key}
+            for gram in self._grams_of(value):
+                self._grams.setdefault(gram, set()).add(value)
+            insort(self._values_by_len.setdefault(len(value), []), value)
+            for head in self._heads_of(value):
+                owners = self._word_heads.get(head)
+                if owners is None:
+                    self._word_heads[head] = {value}
+                    insort(self._heads_by_len.setdefault(len(head), []), head)
+                else:
+                    owners.add(value)
+
+    def discard(self, key: Hashable) -> None:
+        for value in self._values_of.pop(key, ()):
+            keys = self._keys_of[value]
+            keys.discard(key)
+            if keys:
+                continue
+            del self._keys_of[value]
+            for gram in self._grams_of(value):
+                values = self._grams[gram]
+                values.discard(value)
+                if not values:
+                    del self._grams[gram]
+            _remove_sorted(self._values_by_len, value)
+            for head in self._heads_of(value):
+                owners = self._word_heads[head]
+                owners.discard(value)
+                if not owners:
+                    del self._word_heads[head]
+                    _remove_sorted(self._heads_by_len, head)
+
+    def values_matching(self, token: str) -> List[str]:
+        """Distinct values that contain token."""
+        if len(token) < BIGRAM:
+            return [value for value in self._keys_of if token in value]
+        if len(token) < GRAM:
+            return list(self._grams.get(token, ()))
+        sets = []
+        for gram in self._trigrams_of(token):
+            values = self._grams.get(gram)
+            if not values:
+                return []
+            sets.append(values)
+        if len(token) == GRAM:
+            return list(sets[0])
+        sets.sort(key=len)
+        candidates = sets[0].intersection(*sets[1:]) if len(sets) > 1 else sets[0]
+        return [value for value in candidates if token in value]
+
+    def keys_matching(self, token: str) -> Set[Hashable]:
+        keys_of = self._keys_of
+        return set().union(*(keys_of[value] for value in self.values_matching(token)))
+
+    def search(self, query: str) -> Optional[Set[Hashable]]:
+        """Keys matching every token of query; None for an empty query (no restriction)."""
+        tokens = sorted(set(search_tokens(query)), key=len, reverse=True)
+        if not tokens:
+            return None
+        result: Optional[Set[Hashable]] = None
+        for token in tokens:
+            keys = self.keys_matching(token)
+            result = keys if result is None else result & keys
+            if not result:
+                return set()
+        return result
+
+    def ranked(self, query: str, limit: int, fuzzy: bool = False) -> List[Tuple[int, Hashable]]:
+        """
+        Up to limit (score, key) pairs matching query, best score first. The longest word
+        decides the score (see SCORE_*); the other words only have to match. With fuzzy, a
+        query without substring hits is retried with its longest word as a subsequence.
+
+        Hits are produced lazily, best first, and only until limit is reached: prefix and
+        word prefix hits come from the length-sorted lists, the substring scan only runs if
+        those are not enough.
+        """
+        tokens = sorted(set(search_tokens(query)), key=len, reverse=True)
+        if not tokens or limit <= 0:
+            return []
+        primary, others = tokens[0], tokens[1:]
+        allowed: Optional[Set[Hashable]] = None
+        checked: List[str] = []
+        for token in others:
+            values = self.values_matching(token)
+            if len(values) * 4 > len(self._keys_of):
+                # a common word is cheaper to check on the few keys that get that far
+                checked.append(token)
+                continue
+            key_sets = [self._keys_of[value] for value in values]
+            if sum(map(len, key_sets)) * 4 > len(self):
+                checked.append(token)
+                continue
+            keys = set().union(*key_sets)
+            allowed = keys if allowed is None else allowed & keys
+            if not allowed:
+                return []
+        if allowed is not None and len(allowed) <= RANK_DIRECTLY:
+            scored = self._scored_keys(allowed, primary)
+        else:
+            scored = self._scored_values(primary)
+        result = self._collect(scored, allowed, checked, limit)
+        if result or not fuzzy:
+            return result
+        pattern = re.compile(".*?".join(map(re.escape, primary)))
+        fuzzy_values = [value for value in self._keys_of if pattern.search(value)]
+        scored = ((SCORE_FUZZY, value) for value in _shortest_first(fuzzy_values, limit))
+        return self._collect(scored, allowed, checked, limit)
+
+    def _scored_values(self, primary: str) -> Iterator[Tuple[int, str]]:
+        """(score, value) for the values containing primary, best first."""
+        for value in _with_prefix(self._values_by_len, primary):
+            yield (SCORE_EXACT if value == primary else SCORE_PREFIX), value
+        for head in _with_prefix(self._heads_by_len, primary):
+            for value in sorted(self._word_heads[head], key=_value_order):
+                yield SCORE_WORD_PREFIX, value
+        # values already yielded come again here, but their keys are all seen by then
+        if len(primary) < GRAM:
+            inner: Iterable[str] = (
+                value
+                for length in sorted(self._values_by_len)
+                for value in self._values_by_len[length]
+                if primary in value
+            )
+        else:
+            inner = sorted(self.values_matching(primary), key=_value_order)
+        for value in inner:
+            yield SCORE_SUBSTRING, value
+
+    def _scored_keys(self, keys: Set[Hashable], primary: str) -> List[Tuple[int, str]]:
+        """Same order as _scored_values, computed from a few keys instead of all values."""
+        word_prefix = f" {primary}"
+        scored = set()
+        for key in keys:
+            for value in self._values_of[key]:
+                if value == primary:
+                    scored.add((SCORE_EXACT, value))
+                elif value.startswith(primary):
+                    scored.add((SCORE_PREFIX, value))
+                elif word_prefix in value:
+                    scored.add((SCORE_WORD_PREFIX, value))
+                elif primary in value:
+                    scored.add((SCORE_SUBSTRING, value))
+        return sorted(scored, key=lambda item: (item[0], *_value_order(item[1])))
+
+    def _collect(
+        self,
+        scored_values: Iterable[Tuple[int, str]],
+        allowed: Optional[Set[Hashable]],
+        checked: List[str],
+        limit: int,
+    ) -> List[Tuple[int, Hashable]]:
+        result: List[Tuple[int, Hashable]] = []
+        seen: Set[Hashable] = set()
+        for score, value in scored_values:
+            for key in self._keys_of[value]:
+                if key in seen:
+                    continue
+                seen.add(key)
+                if allowed is not None and key not in allowed:
+                    continue
+                key_values = self._values_of[key]
+                if all(any(token in v for v in key_values) for token in checked):
+                    result.append((score, key))
+                    if len(result) >= limit:
+                        return result
+        return result
+
+    @staticmethod
+    def _grams_of(text: str) -> Set[str]:
+        return {text[i : i + n] for n in (BIGRAM, GRAM) for i in range(len(text) - n + 1)}
+
+    @staticmethod
+    def _trigrams_of(text: str) -> Set[str]:
+        return {text[i : i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+    @staticmethod
+    def _heads_of(text: str) -> Set[str]:
+        return {text[i + 1 :] for i, char in enumerate(text) if char == " " and text[i + 1 :]}
+
+
+def _value_order(value: str) -> Tuple[int, str]:
+    return len(value), value
+
+
+def _shortest_first(values: List[str], limit: int) -> Iterator[str]:
+    """values by length, then text; only sorts all of them if the first limit do not do."""
+    head = heapq.nsmallest(limit, values, key=_value_order)
+    yield from head
+    if len(head) < len(values):
+        yield from sorted(values, key=_value_order)[len(head) :]
+
+
+def _with_prefix(by_len: Dict[int, List[str]], prefix: str) -> Iterator[str]:
+    """Texts of by_len starting with prefix, by length, then text."""
+    for length in sorted(by_len):
+        if length < len(prefix):
+            continue
+        texts = by_len[length]
+        i = bisect_left(texts, prefix)
+        while i < len(texts) and texts[i].startswith(prefix):
+            yield texts[i]
+            i += 1
+
+
+def _remove_sorted(by_len: Dict[int, List[str]], text: str) -> None:
+    texts = by_len[len(text)]
+    del texts[bisect_left(texts, text)]
+    if not texts:
+        del by_len[len(text)]
+
+
+def termin_search_values(termin: Termin, index: ProjectIndex) -> Tuple[str, ...]:
+    """Texts a Termin is found by in the Termine dock search."""
+    lva = index.lva_by_id.get(str(termin.lva_id))
+    raum = index.raum_by_id.get(str(termin.raum_id))
+    return (
+        getattr(termin, "name", ""),
+        termin.id,
+        termin.lva_id,
+        termin.raum_id,
+        lva.name if lva else "",
+        raum.name if raum else "",
+        getattr(getattr(lva, "vortragende", None), "name", "") or "",
+        getattr(termin, "besprechungshinweis", ""),
+        "zu besprechen" if bool(getattr(termin, "zu_besprechen", False)) else "",
+    )
+
+
+@dataclass(frozen=True)
+class QuickFindHit:
+    # "termin", "lva", "raum" or "dozent"
+    kind: str
+    # Termin/LVA/room id; the name for lecturers
+    id: str
+    title: str
+    detail: str
+    score: int
+
+
+class ProjectSearchIndex:
+    """
+    Search index over the project: Termine (name, id, LVA id and name, room id and name,
+    lecturer, hint) and, separately, LVAs, rooms and lecturers. Follows the ProjectIndex:
+    after an edit only the changed Termine are re-indexed, after a change of LVAs or rooms
+    everything is.
+    """
+
+    def __init__(self, index: ProjectIndex):
+        self.index = index
+        self._version: Optional[int] = None
+        self._termine = SubstringIndex()
+        self._entities = SubstringIndex()
+        self._lecturer_emails: Dict[str, str] = {}
+
+    def search_termine(self, query: str) -> Optional[Set[str]]:
+        """Ids of the Termine matching query; None for an empty query."""
+        self._ensure_current()
+        return self._termine.search(query)
+
+    def quick_find(self, query: str, limit: int = QUICK_FIND_LIMIT) -> List[QuickFindHit]:
+        """Best matching LVAs, lecturers, rooms and Termine for the quick-find palette."""
+        self._ensure_current()
+        ranked = self._entities.ranked(query, limit, fuzzy=True)
+        ranked += [(score, ("termin", tid)) for score, tid in self._termine.ranked(query, limit)]
+        hits = [self._hit(kind, key_id, score) for score, (kind, key_id) in ranked]
+        rank = self.index.sort_rank()
+        # stable: keeps the shortest-first order of ranked() for LVAs, rooms and lecturers;
+        # equally good Termine are listed in plan order
+        hits = sorted(
+            (hit for hit in hits if hit is not None),
+            key=lambda h: (
+                h.score,
+                KIND_ORDER.index(h.kind),
+                rank.get(h.id, 0) if h.kind == "termin" else 0,
+            ),
+        )
+        return hits[:limit]
+
+    def _hit(self, kind: str, key_id: str, score: int) -> Optional[QuickFindHit]:
+        index = self.index
+        if kind == "termin":
+            termin = index.termin_map.get(key_id)
+            if termin is None:
+                return None
+            lva = index.lva_by_id.get(str(termin.lva_id))
+            lva_name = lva.name if lva else str(termin.lva_id)
+            parts = [str(termin.id), getattr(termin, "name", ""), lva_name, termin.typ]
+            if termin.datum is None or termin.start_zeit is None:
+                detail = "nicht zugewiesen"
+            else:
+                detail = f"{termin.datum:%d.%m.%Y} {termin.start_zeit:%H:%M}"
+                if termin.raum_id:
+                    detail += f" · {termin.raum_id}"
+            title = " · ".join(p for p in parts if p)
+            return QuickFindHit(kind, key_id, title, detail, score)
+        if kind == "lva":
+            lva = index.lva_by_id.get(key_id)
+            if lva is None:
+                return None
+            lecturer = getattr(lva.vortragende, "name", "") or ""
+            detail = " · ".join(p for p in (lva.id, lecturer) if p)
+            return QuickFindHit(kind, key_id, lva.name or lva.id, detail, score)
+        if kind == "raum":
+            raum = index.raum_by_id.get(key_id)
+            if raum is None:
+                return None
+            parts = [raum.id, str(raum.gebaeude or "").strip(), f"{raum.kapazitaet} Plätze"]
+            detail = " · ".join(p for p in parts if p)
+            return QuickFindHit(kind, key_id, raum.name or raum.id, detail, score)
+        return QuickFindHit(kind, key_id, key_id, self._lecturer_emails.get(key_id, ""), score)
+
+    def _ensure_current(self) -> None:
+        index = self.index
+        changed = index.changes_since(self._version)
+        if changed is None:
+            self._termine = SubstringIndex()
+            for termin in index.termine:
+                self._termine.set(str(termin.id), termin_search_values(termin, index))
+            self._index_entities()
+        elif changed:
+            for tid in changed:
+                self._termine.discard(tid)
+            for termin in index.termine:
+                if str(termin.id) in changed:
+                    self._termine.set(str(termin.id), termin_search_values(termin, index))
+        self._version = index.version
+
+    def _index_entities(self) -> None:
+        entities = SubstringIndex()
+        emails: Dict[str, str] = {}
+        for lva in self.index.lvas:
+            lecturer = getattr(lva.vortragende, "name", "") or ""
+            entities.set(("lva", str(lva.id)), (lva.id, lva.name, lecturer))
+            if lecturer.strip():
+                # keyed by the raw name, as offered by the lecturer filter
+                emails.setdefault(lecturer, getattr(lva.vortragende, "email", "") or "")
+        for raum in self.index.raeume:
+            entities.set(("raum", str(raum.id)), (raum.id, raum.name, raum.gebaeude))
+        for name, email in emails.items():
+            entities.set(("dozent", name), (name, email))
+        self._entities = entities
+        self._lecturer_emails = emails
@@ -2,15 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
-from typing import Any, Iterable, List, Sequence
+from pathlib import Path
+from typing import Any, FrozenSet, Iterable, List, Optional, Sequence
 
-from ..core.models import Lehrveranstaltung, Semester, Termin
+from ..core.models import ConflictIssue, Lehrveranstaltung, Raum, Semester, Termin
+from .conflict_service import RULE_CATEGORIES, ConflictConfig, ConflictDetector
 from .id_service import next_id
-from .termin_occurrence_service import series_date_sequence
+from .project_index_service import ProjectIndex
+from .termin_occurrence_service import series_date_sequence, source_termin_id
 
 DATE_MODE_SEMESTER_WEEK = "semester_week"
 DATE_MODE_PLUS_YEAR = "plus_year"
 
+# Conflict rules the copy preview reports
+COPY_PREVIEW_RULES = ("room_conflict", "group_conflict", "lecturer_conflict")
+
 
 @dataclass(frozen=True)
 class LvaTermSummary:
@@ -28,6 +34,24 @@ class CopySemesterResult:
     auto_cancelled_occurrences: int = 0
 
 
+@dataclass(frozen=True)
+class CopyConflictPreview:
+    """
+    Conflicts that copying the source semester would cause in the target semester.
+
+    `issues` are the room, group and lecturer conflicts of the copies of all source LVAs;
+    `lva_ids` holds, per issue, the LVAs whose copies are involved in it.
+    """
+
+    issues: List[ConflictIssue]
+    lva_ids: List[FrozenSet[str]]
+
+    def conflicts_for(self, lva_ids: Iterable[str]) -> List[ConflictIssue]:
+        """The conflicts of copying only the given LVAs."""
+        selected = {str(lva_id) for lva_id in lva_ids}
+        return [issue for issue, needed in zip(self.issues, self.lva_ids) if needed <= selected]
+
+
 def semester_lva_summaries(
     termine: Iterable[Termin],
     lvas: Iterable[Lehrveranstaltung],
@@ -199,7 +223,8 @@ def copy_semester_termine(
         return CopySemesterResult(list(termine), 0)
 
     out = list(termine)
-    existing_ids = [str(termin.id) for termin in out]
+    # like calling next_id for every copy, without rescanning all ids each time
+    first_number = int(next_id("T", [str(termin.id) for termin in out], width=3)[1:])
     created: List[Termin] = []
     free_days = _free_day_dates(freie_tage)
     target_free_day_occurrences = 0
@@ -211,8 +236,7 @@ def copy_semester_termine(
         if str(getattr(termin, "lva_id", "")) not in selected_lva_ids:
             continue
 
-        new_id = next_id("T", existing_ids, width=3)
-        existing_ids.append(new_id)
+        new_id = f"T{first_number + len(created):03d}"
         copied = replace(
             termin,
             id=new_id,
@@ -260,6 +284,87 @@ def copy_semester_termine(
     )
 
 
+def preview_semester_copy_conflicts(
+    termine: Sequence[Termin],
+    lvas: Sequence[Lehrveranstaltung],
+    raeume: Sequence[Raum],
+    *,
+    source: Semester,
+    target: Semester,
+    date_mode: str = DATE_MODE_SEMESTER_WEEK,
+    copy_ausfall_daten: bool = False,
+    freie_tage: Iterable[dict] | None = None,
+    auto_cancel_target_free_days: bool = False,
+    index: Optional[ProjectIndex] = None,
+    data_dir: str | Path | None = None,
+    config: Optional[ConflictConfig] = None,
+) -> CopyConflictPreview:
+    """
+    Dry run of copy_semester_termine for all LVAs of the source semester.
+
+    The candidate copies are checked against the Termine already in the target semester
+    only, nothing is saved. Room, group and lecturer conflicts depend on nothing but the two
+    Termine involved, so the conflicts of any selection of LVAs are a subset of this one run
+    (see CopyConflictPreview.conflicts_for) and ticking LVAs needs no new detection.
+    With the project index, the series expansion of the target Termine is reused.
+    """
+    source_lva_ids = {
+        str(termin.lva_id)
+        for termin in termine
+        if str(getattr(termin, "semester_id", "")) == str(source.id)
+    }
+    result = copy_semester_termine(
+        termine,
+        source=source,
+        target=target,
+        lva_ids=source_lva_ids,
+        date_mode=date_mode,
+        copy_ausfall_daten=copy_ausfall_daten,
+        freie_tage=freie_tage,
+        auto_cancel_target_free_days=auto_cancel_target_free_days,
+    )
+    copies = result.termine[len(result.termine) - result.created_count :]
+    if not copies:
+        return CopyConflictPreview([], [])
+
+    probe = [
+        termin for termin in termine if str(getattr(termin, "semester_id", "")) == str(target.id)
+    ] + copies
+    if index is not None:
+        target_index = index.derive(probe, lvas, raeume)
+    else:
+        target_index = ProjectIndex.build(probe, lvas, raeume)
+    detector = ConflictDetector(
+        target_index.lvas, target_index.raeume, data_dir=data_dir, config=config, index=target_index
+    )
+
+    lva_by_copy = {str(copy.id): str(copy.lva_id) for copy in copies}
+    copy_occurrences = [
+        occurrence for copy in copies for occurrence in target_index.occurrences_of(copy.id)
+    ]
+    scope = {
+        key: buckets
+        for key, buckets in detector.conflict_scope(copy_occurrences).items()
+        if key in COPY_PREVIEW_RULES
+    }
+    categories = {RULE_CATEGORIES[key][1] for key in COPY_PREVIEW_RULES}
+
+    issues: List[ConflictIssue] = []
+    lva_ids: List[FrozenSet[str]] = []
+    for issue in detector.detect_in_scope(target_index.occurrences, set(lva_by_copy), scope):
+        if issue.category not in categories:
+            continue
+        involved = frozenset(
+            lva_by_copy[source_id]
+            for source_id in (source_termin_id(tid) for tid in issue.termin_ids)
+            if source_id in lva_by_copy
+        )
+        if involved:
+            issues.append(issue)
+            lva_ids.append(involved)
+    return CopyConflictPreview(issues, lva_ids)
+
+
 def delete_semester_termine(
     termine: Sequence[Termin], semester_id: str
 ) -> tuple[List[Termin], int]:
@@ -0,0 +1,383 @@
+"""
+Common free-slot search for a Termin: times at which its lecturer, its Studiensemester
+cohort, its group and a large enough room are all free.
+
+Availability comes from one OccupancyIndex whose resources are rooms, lecturers, cohorts and
+LVA groups. Resources follow the pair rules of the ConflictDetector, so a suggested slot
+does not raise a room, group, lecturer or study-plan issue (as far as these rules are
+enabled in konflikte.json).
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.models import Raum, Termin
+from .conflict_service import ConflictConfig, lecturer_key, load_conflict_config, lva_study_plan
+from .occupancy_service import OccupancyIndex, fit_starts, time_of
+from .project_index_service import ProjectIndex, termin_is_group_term
+from .semester_rules import semester_from_id
+from .termin_occurrence_service import expand_termin, series_date_sequence, source_termin_id
+
+DEFAULT_WEEKDAYS = (0, 1, 2, 3, 4)
+MAX_CANDIDATES = 30
+# keeps the list from being filled with one day's start times
+MAX_CANDIDATES_PER_DAY = 4
+SEARCH_DAYS = 14
+
+
+@dataclass(frozen=True)
+class SlotCandidate:
+    datum: date
+    von: time
+    bis: time
+    raum_id: str
+    # lower is better; counts the warnings the slot would still raise
+    penalty: int
+    hinweise: Tuple[str, ...] = ()
+
+
+def _room_key(raum_id: str) -> str:
+    return f"raum|{raum_id}"
+
+
+def _lecturer_resource(lecturer: str, lva_id: str) -> str:
+    return f"person|{lecturer}|{lva_id}"
+
+
+def _cohort_resource(studienrichtung: str, semester_id: str, lva_id: str) -> str:
+    return f"kohorte|{studienrichtung}|{semester_id}|{lva_id}"
+
+
+def _group_resource(lva_id: str, group_name: str) -> str:
+    return f"gruppe|{lva_id}|{group_name}"
+
+
+class CommonSlotFinder:
+    """
+    Ranked free slots for one Termin across rooms, lecturer, cohort and group.
+
+    Lecturer and cohort bitmaps are kept per LVA, because Termine of the same LVA do not
+    conflict with each other in these rules; a query ORs the bitmaps of all other LVAs of
+    the same lecturer or cohort. Group Termine (see termin_is_group_term) are alternatives
+    and therefore not part of these bitmaps.
+    """
+
+    def __init__(
+        self,
+        index: ProjectIndex,
+        settings: Dict,
+        data_dir: str | Path | None = None,
+        config: Optional[ConflictConfig] = None,
+    ):
+        self.index = index
+        self.settings = settings or {}
+        self.config = config if config is not None else load_conflict_config(data_dir=data_dir)
+        self._rule_settings = self.config.settings_by_key
+        self._lecturer_by_lva = {
+            str(lva.id): key for lva in index.lvas if (key := lecturer_key(lva))
+        }
+        self._study_plan = lva_study_plan(index.lvas)
+        self._lvas_by_lecturer: Dict[str, List[str]] = {}
+        for lva_id, key in self._lecturer_by_lva.items():
+            self._lvas_by_lecturer.setdefault(key, []).append(lva_id)
+        self._lvas_by_cohort: Dict[Tuple[str, str], List[str]] = {}
+        for lva_id, (studienrichtung, semester_ids) in self._study_plan.items():
+            for semester_id in semester_ids:
+                self._lvas_by_cohort.setdefault((studienrichtung, semester_id), []).append(lva_id)
+        self.occupancy = OccupancyIndex(
+            int(self.settings.get("time_slot_minutes", 15)), self._resource_keys
+        )
+        self._synced_without: Optional[frozenset] = None
+
+    def rule_enabled(self, key: str) -> bool:
+        return bool(self._rule_settings.get(key, {}).get("enabled", True))
+
+    def _resource_keys(self, termin: Termin) -> Iterable[str]:
+        lva_id = str(termin.lva_id)
+        keys = []
+        if termin.raum_id:
+            keys.append(_room_key(str(termin.raum_id)))
+        if termin.gruppe and termin.gruppe.name:
+            keys.append(_group_resource(lva_id, termin.gruppe.name))
+        if self.index.group_term_flags.get(source_termin_id(termin.id), False):
+            return keys
+        lecturer = self._lecturer_by_lva.get(lva_id)
+        if lecturer:
+            keys.append(_lecturer_resource(lecturer, lva_id))
+        studienrichtung, semester_ids = self._study_plan.get(lva_id, ("", ()))
+        for semester_id in semester_ids:
+            keys.append(_cohort_resource(studienrichtung, semester_id, lva_id))
+        return keys
+
+    def sync(self, exclude: Iterable[str] = ()) -> None:
+        """Occupancy of every Termin of the index except the excluded ones (being placed)."""
+        excluded = frozenset(str(termin_id) for termin_id in exclude)
+        termine = [t for t in self.index.termine if str(t.id) not in excluded]
+        self.occupancy.sync(termine, lambda t: self.index.occurrences_of(t.id))
+        self._synced_without = excluded
+
+    def reserve(self, termin: Termin) -> None:
+        """Mark the slots of a tentatively placed termin as occupied (until the next sync)."""
+        self.occupancy.add(termin, expand_termin(termin))
+
+    def release(self, termin_id: str) -> None:
+        self.occupancy.discard(termin_id)
+
+    def blocks(self, termin: Termin, other: Termin) -> bool:
+        """Whether the placed Termin other occupies a resource that termin needs."""
+        needed = set(self._person_resources(termin))
+        if other.raum_id and self.rule_enabled("room_conflict"):
+            needed.add(_room_key(str(other.raum_id)))
+        return any(key in needed for key in self._resource_keys(other))
+
+    def overlaps(self, termin: Termin) -> Tuple[int, int]:
+        """
+        (conflicts, warnings) termin causes against the current occupancy: the number of
+        occupied room, group and lecturer resources resp. cohort resources its occurrences
+        overlap. Close to the pair issue counts of the ConflictDetector, at bitmap cost.
+        """
+        by_rule = self._rule_resources(termin)
+        hard = by_rule.get("group_conflict", []) + by_rule.get("lecturer_conflict", [])
+        soft = by_rule.get("study_semester_warning", [])
+        check_rooms = self.rule_enabled("room_conflict")
+        occupancy = self.occupancy
+        conflicts = warnings = 0
+        for occurrence in expand_termin(termin):
+            if occurrence.datum is None or occurrence.start_zeit is None:
+                continue
+            if int(occurrence.duration or 0) <= 0:
+                continue
+            datum = occurrence.datum
+            mask = occupancy.slot_mask(occurrence.start_zeit, occurrence.get_end_time())
+            if check_rooms and occurrence.raum_id:
+                conflicts += bool(occupancy.busy(_room_key(str(occurrence.raum_id)), datum) & mask)
+            conflicts += sum(1 for key in hard if occupancy.busy(key, datum) & mask)
+            warnings += sum(1 for key in soft if occupancy.busy(key, datum) & mask)
+        return conflicts, warnings
+
+    def _rule_resources(self, termin: Termin) -> Dict[str, List[str]]:
+        """Resources termin must not overlap with, per enabled pair rule."""
+        lva_id = str(termin.lva_id)
+        resources: Dict[str, List[str]] = {}
+        if self.rule_enabled("group_conflict") and termin.gruppe and termin.gruppe.name:
+            resources["group_conflict"] = [_group_resource(lva_id, termin.gruppe.name)]
+        if termin_is_group_term(termin):
+            return resources
+        lecturer = self._lecturer_by_lva.get(lva_id)
+        if lecturer and self.rule_enabled("lecturer_conflict"):
+            resources["lecturer_conflict"] = [
+                _lecturer_resource(lecturer, other)
+                for other in self._lvas_by_lecturer.get(lecturer, [])
+                if other != lva_id
+            ]
+        if self.rule_enabled("study_semester_warning"):
+            studienrichtung, semester_ids = self._study_plan.get(lva_id, ("", ()))
+            resources["study_semester_warning"] = [
+                _cohort_resource(studienrichtung, semester_id, other)
+                for semester_id in semester_ids
+                for other in self._lvas_by_cohort.get((studienrichtung, semester_id), [])
+                if other != lva_id
+            ]
+        return resources
+
+    def _person_resources(self, termin: Termin) -> List[str]:
+        """Lecturer, cohort and group resources termin must not overlap with."""
+        return [key for keys in self._rule_resources(termin).values() for key in keys]
+
+    def blocked_day(self, datum: date) -> bool:
+        free_types = self.config.free_days_by_date.get(datum, frozenset())
+        if "feiertag" in free_types and self.rule_enabled("holiday_conflict"):
+            return True
+        return "vorlesungsfrei" in free_types and self.rule_enabled("lecture_free_conflict")
+
+    def _pattern_dates(self, termin: Termin, datum: date) -> List[date]:
+        """Dates a Termin moved to datum would occupy (all dates of a series)."""
+        if not termin.is_series():
+            return [datum]
+        span = termin.datum_bis - termin.datum
+        return series_date_sequence(datum, datum + span, termin.periodizitaet)
+
+    def candidate_rooms(self, termin: Termin, raeume: List[Raum]) -> List[Raum]:
+        """Rooms large enough for the group, current room first, then smallest first."""
+        size = termin.gruppe.groesse if termin.gruppe else 0
+        rooms = [r for r in raeume if int(r.kapazitaet or 0) >= size]
+        return sorted(
+            rooms,
+            key=lambda r: (str(r.id) != str(termin.raum_id or ""), int(r.kapazitaet or 0), r.id),
+        )
+
+    def find(
+        self,
+        termin: Termin,
+        start: date,
+        end: date,
+        duration_minutes: Optional[int] = None,
+        weekdays: Optional[Iterable[int]] = None,
+        raeume: Optional[List[Raum]] = None,
+        limit: int = MAX_CANDIDATES,
+    ) -> List[SlotCandidate]:
+        """
+        Free slots for termin between start and end (inclusive), best first.
+
+        For each date and start time on the time grid the best free room is chosen (the
+        current room if possible, otherwise the smallest large enough room). Candidates are
+        ranked by the warnings they would still raise (start not on the full hour, Saturday,
+        Sunday), then by date and time; at most MAX_CANDIDATES_PER_DAY per date. A series is
+        only suggested where all of its dates are free.
+        """
+        if self._synced_without != frozenset({str(termin.id)}):
+            self.sync((str(termin.id),))
+        return self.search(termin, start, end, duration_minutes, weekdays, raeume, limit)
+
+    def search(
+        self,
+        termin: Termin,
+        start: date,
+        end: date,
+        duration_minutes: Optional[int] = None,
+        weekdays: Optional[Iterable[int]] = None,
+        raeume: Optional[List[Raum]] = None,
+        limit: Optional[int] = MAX_CANDIDATES,
+    ) -> List[SlotCandidate]:
+        """Like find, but against the current occupancy (see sync and reserve)."""
+        occupancy = self.occupancy
+        slot = occupancy.slot_minutes
+        duration = int(duration_minutes or termin.duration or 0) or slot
+        needed = max(1, -(-duration // slot))
+        day_start = datetime.strptime(self.settings.get("day_start", "08:00"), "%H:%M").time()
+        day_end = datetime.strptime(self.settings.get("day_end", "18:00"), "%H:%M").time()
+        window = occupancy.window_mask(day_start, day_end)
+        allowed_days: Set[int] = set(DEFAULT_WEEKDAYS if weekdays is None else weekdays)
+        resources = self._person_resources(termin)
+        rooms = self.candidate_rooms(termin, self.index.raeume if raeume is None else raeume)
+        check_rooms = self.rule_enabled("room_conflict")
+        hour_mask = 0
+        for slot_number in range(occupancy.slots_per_day):
+            if (slot_number * slot) % 60 == 0:
+                hour_mask |= 1 << slot_number
+
+        candidates: List[SlotCandidate] = []
+        datum = start
+        while datum <= end:
+            if datum.weekday() in allowed_days and not self.blocked_day(datum):
+                candidates += self._day_candidates(
+                    termin,
+                    datum,
+                    window,
+                    needed,
+                    duration,
+                    resources,
+                    rooms,
+                    check_rooms,
+                    hour_mask,
+                )
+            datum += timedelta(days=1)
+        candidates.sort(key=lambda c: (c.penalty, c.datum, c.von))
+        return candidates if limit is None else candidates[:limit]
+
+    def _day_candidates(
+        self,
+        termin: Termin,
+        datum: date,
+        window: int,
+        needed: int,
+        duration: int,
+        resources: List[str],
+        rooms: List[Raum],
+        check_rooms: bool,
+        hour_mask: int,
+    ) -> List[SlotCandidate]:
+        occupancy = self.occupancy
+        dates = self._pattern_dates(termin, datum)
+        free = window
+        for day in dates:
+            free &= ~occupancy.busy_any(resources, day)
+        possible = fit_starts(free, needed)
+        if not possible:
+            return []
+
+        chosen: Dict[int, str] = {}
+        taken = 0
+        for raum in rooms if check_rooms else rooms[:1]:
+            if taken == possible:
+                break
+            room_free = free
+            if check_rooms:
+                for day in dates:
+                    room_free &= ~occupancy.busy(_room_key(str(raum.id)), day)
+            starts = fit_starts(room_free, needed) & ~taken
+            taken |= starts
+            while starts:
+                low = starts & -starts
+                chosen[low.bit_length() - 1] = str(raum.id)
+                starts ^= low
+
+        penalty_day = 0
+        notes_day: List[str] = []
+        if datum.weekday() == 5 and self.rule_enabled("saturday_warning"):
+            penalty_day, notes_day = 2, ["Samstag"]
+        elif datum.weekday() == 6 and self.rule_enabled("sunday_warning"):
+            penalty_day, notes_day = 3, ["Sonntag"]
+        check_full_hour = self.rule_enabled("full_hour_start_warning")
+
+        def off_hour(first: int) -> bool:
+            return check_full_hour and not (hour_mask >> first) & 1
+
+        out: List[SlotCandidate] = []
+        for first in sorted(chosen, key=lambda first: (off_hour(first), first))[
+            :MAX_CANDIDATES_PER_DAY
+        ]:
+            penalty = penalty_day
+            notes = list(notes_day)
+            if off_hour(first):
+                penalty += 1
+                notes.append("Start nicht zur vollen Stunde")
+            start_minutes = first * occupancy.slot_minutes
+            out.append(
+                SlotCandidate(
+                    datum=datum,
+                    von=time_of(start_minutes),
+                    bis=time_of(start_minutes + duration),
+                    raum_id=chosen[first],
+                    penalty=penalty,
+                    hinweise=tuple(notes),
+                )
+            )
+        return out
+
+
+def default_search_range(termin: Termin, today: date) -> Tuple[date, date]:
+    """
+    SEARCH_DAYS days from the Termin's date, or for an unassigned Termin from today within its
+    semester (from the semester start if today lies outside), ending at the semester end at
+    the latest.
+    """
+    semester = semester_from_id(termin.semester_id) if termin.semester_id else None
+    start = termin.datum or today
+    if termin.datum is None and semester is not None:
+        start = today if semester.start <= today <= semester.end else semester.start
+    end = start + timedelta(days=SEARCH_DAYS - 1)
+    if semester is not None and semester.start <= start <= semester.end:
+        end = min(end, semester.end)
+    return start, end
+
+
+def find_common_slots(
+    index: ProjectIndex,
+    termin: Termin,
+    start: date,
+    end: date,
+    *,
+    settings: Dict,
+    data_dir: str | Path | None = None,
+    duration_minutes: Optional[int] = None,
+    weekdays: Optional[Iterable[int]] = None,
+    limit: int = MAX_CANDIDATES,
+) -> List[SlotCandidate]:
+    """One-off search; keep a CommonSlotFinder to run several searches on the same index."""
+    finder = CommonSlotFinder(index, settings, data_dir=data_dir)
+    return finder.find(
+        termin, start, end, duration_minutes=duration_minutes, weekdays=weekdays, limit=limit
+    )
@@ -1,19 +1,41 @@
 from datetime import date, datetime, time, timedelta
-from typing import List, Optional, Dict, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..core.models import Termin, Zeitfenster
-from .termin_occurrence_service import expand_termine
+from .occupancy_service import OccupancyIndex, fit_starts, time_of
+from .project_index_service import ProjectIndex
+from .termin_occurrence_service import expand_termin
 
 
 class TerminService:
-    """Service for Termin-related calculations, such as finding free time slots in a room"""
+    """
+    Service for Termin-related calculations, such as finding free time slots in a room.
 
-    def __init__(self, settings: Dict):
+    Room availability is answered from an OccupancyIndex with one slot bitmap per
+    (room, date) at `time_slot_minutes` granularity. The bitmaps are synced with the Termine
+    passed to each query; only Termine that changed since the previous query are expanded
+    again (via the ProjectIndex, if one is given and already holds the Termin).
+    """
+
+    def __init__(self, settings: Dict, index: Optional[ProjectIndex] = None):
         self.settings = settings
+        self.index = index
+        self.room_occupancy = OccupancyIndex(int(self.settings.get("time_slot_minutes", 15)))
+
+    def day_window(self) -> Tuple[time, time]:
+        day_start = datetime.strptime(self.settings.get("day_start", "08:00"), "%H:%M").time()
+        day_end = datetime.strptime(self.settings.get("day_end", "18:00"), "%H:%M").time()
+        return day_start, day_end
+
+    def sync_rooms(self, termine: Iterable[Termin]) -> OccupancyIndex:
+        """Bring the room bitmaps up to date with termine and return them."""
+        self.room_occupancy.sync(termine, self._occurrences_of)
+        return self.room_occupancy
 
-    @staticmethod
-    def _to_dt(d: date, t: time) -> datetime:
-        return datetime(d.year, d.month, d.day, t.hour, t.minute)
+    def _occurrences_of(self, termin: Termin) -> List[Termin]:
+        if self.index is not None and self.index.termin_map.get(str(termin.id)) is termin:
+            return self.index.occurrences_of(termin.id)
+        return expand_termin(termin)
 
     def find_free_slots_in_room(
         self,
@@ -26,91 +48,66 @@ class TerminService:
         """
         Return all free time windows in a room on a given date that fit the requested duration.
 
-        Algorithm:
-
-        1. Collect busy intervals.
-        Filter Termine to those matching the room and date, then convert each one
-        to a (start_datetime, end_datetime) interval. Sort by start time.
-
-        2. Merge overlapping busy intervals.
-        Go through the sorted intervals. If the next interval starts after the
-        current merged block ends, start a new block. Otherwise, extend the current
-        block's end to cover the overlap.
-
-        3. Adjust free periods to the time grid and filter by minimum duration.
-        Find the gaps between the merged busy periods.
-        - The gap start is rounded up to the next grid line, so the returned slot
-            always starts on a valid time.
-        - The gap end is rounded down to the previous grid line.
-        After adjusting, only gaps that are at least as long as the requested duration
-        are returned. This ensures the returned Zeitfenster fit the visual grid and
-        are long enough for the event.
+        A slot of the time grid is free if no Termin in the room overlaps it. Runs of free
+        slots between day_start and day_end are returned if they are at least
+        duration_minutes long, so the windows always start and end on the visual grid.
+        With semester_id only Termine of that semester count as occupied.
         """
-        day_start = datetime.strptime(self.settings.get("day_start", "08:00"), "%H:%M").time()
-        day_end = datetime.strptime(self.settings.get("day_end", "18:00"), "%H:%M").time()
-
-        # relevante Termine
-        expanded_termine = expand_termine(termine)
-        rel = [
-            t
-            for t in expanded_termine
-            if t.raum_id == raum_id
-            and t.datum == datum
-            and t.start_zeit is not None
-            and t.duration > 0
-            and (semester_id is None or t.semester_id == semester_id)
-        ]
-        rel = sorted(rel, key=lambda x: x.start_zeit)
-
-        start_dt = self._to_dt(datum, day_start)
-        end_dt = self._to_dt(datum, day_end)
-        slot = timedelta(minutes=int(self.settings.get("time_slot_minutes", 15)))
-        want = timedelta(minutes=duration_minutes)
+        occupancy = self.sync_rooms(termine)
+        window = occupancy.window_mask(*self.day_window())
+        busy = occupancy.busy(raum_id, datum, semester_id)
+        return occupancy.free_windows(window & ~busy, duration_minutes)
 
-        # belegte Intervalle als dt
-        busy: List[Tuple[datetime, datetime]] = [
-            (self._to_dt(datum, t.start_zeit), self._to_dt(datum, t.get_end_time() or t.start_zeit))
-            for t in rel
-        ]
-
-        # Merge busy
-        merged_tmp = []
-        for b in busy:
-            if not merged_tmp or b[0] > merged_tmp[-1][1]:
-                merged_tmp.append(list(b))  # add new interval
-            else:
-                merged_tmp[-1][1] = max(merged_tmp[-1][1], b[1])
-        # convert it to a list of tuples from a list of lists because tuples are not mutable
-        merged: List[Tuple[datetime, datetime]] = [(a, b) for a, b in merged_tmp]
-
-        # Erzeuge freie Fenster
-        free: List[Tuple[datetime, datetime]] = []
-        cursor = start_dt
-        for a, b in merged:
-            if a > cursor:
-                free.append((cursor, a))
-            cursor = max(cursor, b)
-        if cursor < end_dt:
-            free.append((cursor, end_dt))
-
-        # Rastere in Slots und filtere nach Mindestdauer
-        out: List[Zeitfenster] = []
-        for a, b in free:
-            # runden auf Slot-Raster nach oben/unten
-            def ceil_to_slot(dt: datetime) -> datetime:
-                minutes = dt.hour * 60 + dt.minute
-                s = int(slot.total_seconds() // 60)
-                m = ((minutes + s - 1) // s) * s
-                return dt.replace(hour=m // 60, minute=m % 60, second=0, microsecond=0)
-
-            def floor_to_slot(dt: datetime) -> datetime:
-                minutes = dt.hour * 60 + dt.minute
-                s = int(slot.total_seconds() // 60)
-                m = (minutes // s) * s
-                return dt.replace(hour=m // 60, minute=m % 60, second=0, microsecond=0)
+    def free_rooms_at(
+        self,
+        termine: List[Termin],
+        raum_ids: Sequence[str],
+        datum: date,
+        von: time,
+        bis: time,
+    ) -> List[str]:
+        """Rooms out of raum_ids (in that order) that are free on datum from von to bis."""
+        return self.sync_rooms(termine).free_resources(raum_ids, datum, von, bis)
 
-            a2 = ceil_to_slot(a)
-            b2 = floor_to_slot(b)
-            if b2 - a2 >= want:
-                out.append(Zeitfenster(von=a2.time(), bis=b2.time()))
-        return out
+    def next_free_slot(
+        self,
+        termine: List[Termin],
+        raum_ids: Sequence[str],
+        start: date,
+        duration_minutes: int,
+        max_days: int = 60,
+        weekdays: Optional[Iterable[int]] = None,
+        not_before: Optional[time] = None,
+    ) -> Optional[Tuple[str, date, Zeitfenster]]:
+        """
+        Earliest (room, date, time window) at or after start where one of raum_ids is free for
+        duration_minutes. On the first day, not_before can exclude earlier start times.
+        Only dates with a weekday in weekdays (0 = Monday) are searched, if given.
+        """
+        occupancy = self.sync_rooms(termine)
+        slot = occupancy.slot_minutes
+        needed = max(1, -(-int(duration_minutes) // slot))
+        window = occupancy.window_mask(*self.day_window())
+        allowed_days = set(weekdays) if weekdays is not None else None
+
+        for offset in range(max_days):
+            datum = start + timedelta(days=offset)
+            if allowed_days is not None and datum.weekday() not in allowed_days:
+                continue
+            day_window = window
+            if offset == 0 and not_before is not None:
+                day_window &= ~((1 << -(-(not_before.hour * 60 + not_before.minute) // slot)) - 1)
+            best: Optional[Tuple[int, str]] = None
+            for raum_id in raum_ids:
+                starts = fit_starts(day_window & ~occupancy.busy(raum_id, datum), needed)
+                if not starts:
+                    continue
+                first = (starts & -starts).bit_length() - 1
+                if best is None or first < best[0]:
+                    best = (first, raum_id)
+            if best is not None:
+                first, raum_id = best
+                von = time_of(first * slot)
+                bis = time_of(first * slot + int(duration_minutes))
+                return raum_id, datum, Zeitfenster(von=von, bis=bis)
+        return None
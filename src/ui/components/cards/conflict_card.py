@@ -1,74 +1,332 @@
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QLabel, QHBoxLayout, QVBoxLayout, QFrame
-
-
-class ConflictCard(QFrame):
-    """Clickable UI card that presents a scheduling conflict
-    and emits affected `termin_ids` when clicked"""
-
-    clicked = Signal(list)
-
-    def __init__(
-        self,
-        termin_ids: list[str],
-        title: str,
-        subtitle: str,
-        typ: str,
-        raum: str,
-        lva: str,
-        gruppe: str,
-        message: str,
-        conflict_kind: str,
-        severity: str,
-        parent=None,
-    ):
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, time
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QFontMetrics, QPainter, QPen, QTextLayout
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+from ....core.models import ConflictIssue
+from ....services.conflict_labels import conflict_category_kind, conflict_category_label
+from ...utils.datetime_utils import fmt_date, fmt_time
+from ...utils.qss_tokens import qss_color
+
+GROUP_NONE = "none"
+GROUP_CATEGORY = "category"
+GROUP_DATE = "date"
+
+CONFLICT_ROW_IS_HEADER_ROLE = Qt.UserRole + 1
+CONFLICT_TERMIN_IDS_ROLE = Qt.UserRole + 2
+CONFLICT_CARD_ROLE = Qt.UserRole + 3
+CONFLICT_KIND_ROLE = Qt.UserRole + 4
+CONFLICT_SEVERITY_ROLE = Qt.UserRole + 5
+
+
+@dataclass(frozen=True)
+class ConflictGroupHeader:
+    label: str
+    count: int
+
+
+@dataclass(frozen=True)
+class ConflictCardText:
+    title: str
+    subtitle: str
+    message: str
+    chips: Tuple[Tuple[str, str], ...]  # (chip kind, text)
+
+
+class ConflictListModel(QAbstractListModel):
+    """
+    Flat list of ConflictIssues for the conflicts dock, optionally split into groups by
+    category or date with a header row per group.
+
+    The model only keeps references to the issues. Card texts (title, subtitle, chips) are
+    built when a row is first painted and kept in a small LRU cache, so memory and refresh
+    cost do not depend on how many issues the list can scroll through.
+    """
+
+    TEXT_CACHE_SIZE = 512
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[ConflictIssue | ConflictGroupHeader] = []
+        self._texts: "OrderedDict[int, ConflictCardText]" = OrderedDict()
+        self._issue_count = 0
+
+    def set_issues(self, issues: List[ConflictIssue], group_by: str = GROUP_NONE) -> None:
+        self.beginResetModel()
+        self._rows = _grouped_rows(issues, group_by)
+        self._texts.clear()
+        self._issue_count = len(issues)
+        self.endResetModel()
+
+    def issue_count(self) -> int:
+        return self._issue_count
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if isinstance(self._rows[index.row()], ConflictGroupHeader):
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if isinstance(row, ConflictGroupHeader):
+            if role == CONFLICT_ROW_IS_HEADER_ROLE:
+                return True
+            if role in (Qt.DisplayRole, CONFLICT_CARD_ROLE):
+                return row
+            return None
+
+        if role == CONFLICT_ROW_IS_HEADER_ROLE:
+            return False
+        if role == CONFLICT_TERMIN_IDS_ROLE:
+            return [str(tid) for tid in row.termin_ids] if row.termin_ids else []
+        if role == CONFLICT_KIND_ROLE:
+            return conflict_category_kind(row.category)
+        if role == CONFLICT_SEVERITY_ROLE:
+            return row.severity
+        if role == CONFLICT_CARD_ROLE:
+            return self._card_text(index.row(), row)
+        if role == Qt.DisplayRole:
+            return self._card_text(index.row(), row).title
+        if role == Qt.ToolTipRole:
+            return row.message
+        return None
+
+    def _card_text(self, row_number: int, issue: ConflictIssue) -> ConflictCardText:
+        text = self._texts.get(row_number)
+        if text is not None:
+            self._texts.move_to_end(row_number)
+            return text
+        text = conflict_card_text(issue)
+        self._texts[row_number] = text
+        if len(self._texts) > self.TEXT_CACHE_SIZE:
+            self._texts.popitem(last=False)
+        return text
+
+
+def conflict_card_text(issue: ConflictIssue) -> ConflictCardText:
+    type_text = "Konflikt" if issue.severity == "conflict" else "Warnung"
+    zeit_str = ""
+    if issue.zeit_von and issue.zeit_bis:
+        zeit_str = f"{fmt_time(issue.zeit_von)} - {fmt_time(issue.zeit_bis)}"
+    elif issue.zeit_von:
+        zeit_str = fmt_time(issue.zeit_von)
+
+    chips = [("type", type_text)]
+    if issue.raum:
+        chips.append(("room", issue.raum))
+    if issue.lva:
+        chips.append(("lva", issue.lva))
+    if issue.gruppe:
+        chips.append(("group", issue.gruppe))
+    return ConflictCardText(
+        title=f"{type_text} · {conflict_category_label(issue.category)}",
+        subtitle=f"{fmt_date(issue.datum)} · {zeit_str}".strip(" ·"),
+        message=issue.message,
+        chips=tuple(chips),
+    )
+
+
+def _grouped_rows(
+    issues: List[ConflictIssue], group_by: str
+) -> List[ConflictIssue | ConflictGroupHeader]:
+    if group_by == GROUP_CATEGORY:
+        groups: dict[str, List[ConflictIssue]] = {}
+        for issue in issues:
+            groups.setdefault(conflict_category_label(issue.category), []).append(issue)
+        ordered = sorted(groups.items(), key=lambda item: item[0].casefold())
+    elif group_by == GROUP_DATE:
+        by_date: dict[Optional[date], List[ConflictIssue]] = {}
+        for issue in issues:
+            by_date.setdefault(issue.datum, []).append(issue)
+        ordered = []
+        # Issues without a date (e.g. unassigned Termine) come last
+        for day in sorted(by_date, key=lambda d: (d is None, d or date.min)):
+            day_issues = sorted(by_date[day], key=lambda i: i.zeit_von or time.min)
+            ordered.append((fmt_date(day), day_issues))
+    else:
+        return list(issues)
+
+    rows: List[ConflictIssue | ConflictGroupHeader] = []
+    for label, group in ordered:
+        rows.append(ConflictGroupHeader(label=label, count=len(group)))
+        rows.extend(group)
+    return rows
+
+
+class ConflictCardDelegate(QStyledItemDelegate):
+    """Paints conflict cards and group headers directly, without embedded widgets."""
+
+    CARD_SPACING = 8
+    PADDING_X = 12
+    PADDING_Y = 10
+    LINE_GAP = 6
+    MESSAGE_LINES = 2
+    CHIP_HEIGHT = 18
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.termin_ids = termin_ids
-
-        self.setObjectName("ConflictCard")
-        self.setCursor(Qt.PointingHandCursor)
-        self.setProperty("conflictKind", conflict_kind)
-        self.setProperty("severity", severity)
-
-        root = QVBoxLayout(self)
-        root.setContentsMargins(12, 10, 12, 10)
-        root.setSpacing(6)
-
-        lbl_title = QLabel(title)
-        lbl_title.setObjectName("CardTitle")
-        root.addWidget(lbl_title)
-
-        lbl_sub = QLabel(subtitle)
-        lbl_sub.setObjectName("CardSub")
-        root.addWidget(lbl_sub)
-
-        lbl_msg = QLabel(message)
-        lbl_msg.setObjectName("CardSub")
-        lbl_msg.setWordWrap(True)
-        root.addWidget(lbl_msg)
-
-        chips = QHBoxLayout()
-        chips.setSpacing(6)
-
-        def chip(text, name):
-            l = QLabel(text)
-            l.setObjectName(name)
-            l.setAlignment(Qt.AlignCenter)
-            l.setProperty("chip", True)
-            return l
-
-        chips.addWidget(chip(typ, "ChipType"))
-        if raum:
-            chips.addWidget(chip(raum, "ChipRoom"))
-        if lva:
-            chips.addWidget(chip(lva, "ChipLva"))
-        if gruppe:
-            chips.addWidget(chip(gruppe, "ChipGroup"))
-
-        chips.addStretch(1)
-        root.addLayout(chips)
-
-    def mousePressEvent(self, e) -> None:
-        if e.button() == Qt.LeftButton:
-            self.clicked.emit(self.termin_ids)
-        super().mousePressEvent(e)
+        # font key -> (header height, card height); sizeHint is asked for every row
+        self._heights: dict[str, Tuple[int, int]] = {}
+
+    def sizeHint(self, option, index) -> QSize:
+        heights = self._heights.get(option.font.key())
+        if heights is None:
+            header_h = QFontMetrics(self._font(option, 12, True)).height() + 14
+            heights = (header_h, self._card_height(option) + self.CARD_SPACING)
+            self._heights[option.font.key()] = heights
+        is_header = bool(index.data(CONFLICT_ROW_IS_HEADER_ROLE))
+        return QSize(option.rect.width(), heights[0] if is_header else heights[1])
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        if index.data(CONFLICT_ROW_IS_HEADER_ROLE):
+            self._paint_header(painter, option, index.data(CONFLICT_CARD_ROLE))
+        else:
+            self._paint_card(painter, option, index)
+        painter.restore()
+
+    def _font(self, option, pixel_size: int, bold: bool = False) -> QFont:
+        font = QFont(option.font)
+        font.setPixelSize(pixel_size)
+        if bold:
+            font.setWeight(QFont.DemiBold)
+        return font
+
+    def _card_height(self, option) -> int:
+        title_h = QFontMetrics(self._font(option, 13, True)).height()
+        sub_h = QFontMetrics(self._font(option, 11)).height()
+        return (
+            2 * self.PADDING_Y
+            + title_h
+            + sub_h * (1 + self.MESSAGE_LINES)
+            + self.CHIP_HEIGHT
+            + 3 * self.LINE_GAP
+        )
+
+    def _paint_header(self, painter: QPainter, option, header: ConflictGroupHeader) -> None:
+        rect = option.rect.adjusted(2, 6, -2, -2)
+        font = self._font(option, 12, True)
+        painter.setFont(font)
+        painter.setPen(qss_color("conflict-group-header-text"))
+        label = QFontMetrics(font).elidedText(
+            f"{header.label} · {header.count}", Qt.ElideRight, rect.width()
+        )
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, label)
+
+    def _paint_card(self, painter: QPainter, option, index) -> None:
+        card: ConflictCardText = index.data(CONFLICT_CARD_ROLE)
+        kind = index.data(CONFLICT_KIND_ROLE) or "default"
+        rect = option.rect.adjusted(0, 0, -1, -self.CARD_SPACING - 1)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        selected = bool(option.state & QStyle.State_Selected)
+
+        bg = self._kind_color(kind, "hover-bg" if hovered or selected else "bg")
+        border = qss_color("conflict-card-selected-border" if selected else "conflict-card-border")
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(QBrush(bg))
+        painter.drawRoundedRect(rect, 8, 8)
+
+        accent = QRect(rect.left(), rect.top() + 1, 3, rect.height() - 1)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(self._kind_color(kind, "accent")))
+        painter.drawRoundedRect(accent, 1.5, 1.5)
+
+        content = rect.adjusted(self.PADDING_X, self.PADDING_Y, -self.PADDING_X, -self.PADDING_Y)
+        y = content.top()
+
+        title_font = self._font(option, 13, True)
+        title_metrics = QFontMetrics(title_font)
+        painter.setFont(title_font)
+        painter.setPen(qss_color("conflict-card-title"))
+        painter.drawText(
+            content.left(),
+            y,
+            content.width(),
+            title_metrics.height(),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            title_metrics.elidedText(card.title, Qt.ElideRight, content.width()),
+        )
+        y += title_metrics.height() + self.LINE_GAP
+
+        text_font = self._font(option, 11)
+        text_metrics = QFontMetrics(text_font)
+        painter.setFont(text_font)
+        painter.setPen(qss_color("conflict-card-text"))
+        lines = [text_metrics.elidedText(card.subtitle, Qt.ElideRight, content.width())]
+        lines += _elided_lines(card.message, text_font, content.width(), self.MESSAGE_LINES)
+        for number, line in enumerate(lines):
+            painter.drawText(
+                content.left(),
+                y,
+                content.width(),
+                text_metrics.height(),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                line,
+            )
+            y += text_metrics.height()
+            if number == 0:
+                y += self.LINE_GAP
+        y = content.bottom() - self.CHIP_HEIGHT + 1
+
+        self._paint_chips(painter, option, card.chips, content.left(), y, content.right())
+
+    def _paint_chips(self, painter: QPainter, option, chips, left: int, y: int, right: int) -> None:
+        font = self._font(option, 10, True)
+        metrics = QFontMetrics(font)
+        painter.setFont(font)
+        x = left
+        for chip_kind, text in chips:
+            available = right - x
+            if available < 24:
+                break
+            text_width = metrics.horizontalAdvance(text)
+            width = min(text_width + 16, available)
+            chip = QRect(x, y, width, self.CHIP_HEIGHT)
+            prefix = "conflict-chip-group" if chip_kind == "group" else "conflict-chip"
+            painter.setPen(QPen(qss_color(f"{prefix}-border"), 1))
+            painter.setBrush(QBrush(qss_color(f"{prefix}-bg")))
+            painter.drawRoundedRect(chip, self.CHIP_HEIGHT / 2, self.CHIP_HEIGHT / 2)
+            painter.setPen(qss_color(f"{prefix}-text"))
+            if text_width > width - 16:
+                text = metrics.elidedText(text, Qt.ElideRight, width - 16)
+            painter.drawText(chip, Qt.AlignCenter, text)
+            x += width + 6
+
+    def _kind_color(self, kind: str, part: str) -> QColor:
+        try:
+            return qss_color(f"conflict-{kind}-{part}")
+        except KeyError:
+            return qss_color(f"conflict-default-{part}")
+
+
+def _elided_lines(text: str, font: QFont, width: int, max_lines: int) -> List[str]:
+    """Wrap text to at most max_lines lines of the given width; the last line is elided."""
+    text = " ".join(str(text or "").split())
+    layout = QTextLayout(text, font)
+    layout.beginLayout()
+    spans = []
+    while len(spans) < max_lines:
+        line = layout.createLine()
+        if not line.isValid():
+            break
+        line.setLineWidth(width)
+        spans.append((line.textStart(), line.textLength()))
+    layout.endLayout()
+
+    lines = [text[start : start + length].rstrip() for start, length in spans]
+    if spans and sum(spans[-1]) < len(text):
+        rest = text[spans[-1][0] :]
+        lines[-1] = QFontMetrics(font).elidedText(rest, Qt.ElideRight, width)
+    return lines
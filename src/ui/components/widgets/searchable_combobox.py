@@ -0,0 +1,42 @@
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QComboBox, QCompleter
+
+from .tight_combobox import TightComboBox
+
+
+class SearchableComboBox(TightComboBox):
+    """TightComboBox for long lists: typing shows the entries containing the text"""
+
+    def __init__(self, parent=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.NoInsert)
+
+        # Works on the combo's own model, so picking a completion selects that row
+        completer = QCompleter(self.model(), self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.setCompletionMode(QCompleter.PopupCompletion)
+        completer.setMaxVisibleItems(12)
+        self.setCompleter(completer)
+
+        self.lineEdit().editingFinished.connect(self._restore_current_text)
+        self.currentIndexChanged.connect(self._restore_current_text)
+
+    def keyPressEvent(self, event):
+        # Typed letters go to the search text, not to TightComboBox's letter jump
+        QComboBox.keyPressEvent(self, event)
+
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        QTimer.singleShot(0, self.lineEdit().selectAll)
+
+    def _restore_current_text(self, *_) -> None:
+        # Leftover search text that matched nothing shows the selected entry again
+        text = self.itemText(self.currentIndex()) if self.currentIndex() >= 0 else ""
+        line_edit = self.lineEdit()
+        if line_edit.text() != text:
+            line_edit.setText(text)
+        if not line_edit.hasFocus():
+            # show the start of long entries, like the non-editable combos
+            line_edit.setCursorPosition(0)
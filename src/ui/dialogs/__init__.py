@@ -10,6 +10,10 @@ from .catalog_import_dialog import CatalogImportDialog
 from .semester_tools_dialog import SemesterToolsDialog
 from .free_day_import_dialog import FreeDayImportDialog
 from .project_export_dialog import ProjectExportDialog, ExportFileOption
+from .free_slot_dialog import FreeSlotDialog
+from .auto_placement_dialog import AutoPlacementDialog
+from .plan_optimizer_dialog import PlanOptimizerDialog
+from .quick_find_dialog import QuickFindDialog
 
 __all__ = [
     "LVADialog",
@@ -25,4 +29,8 @@ __all__ = [
     "FreeDayImportDialog",
     "ProjectExportDialog",
     "ExportFileOption",
+    "FreeSlotDialog",
+    "AutoPlacementDialog",
+    "PlanOptimizerDialog",
+    "QuickFindDialog",
 ]
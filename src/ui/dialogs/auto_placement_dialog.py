@@ -0,0 +1,274 @@
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QComboBox,
+    QDateEdit,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QFrame,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from ...core.models import Lehrveranstaltung, Raum, Termin
+from ...services.auto_placement_service import AutoPlacer, PlacementPlan, is_unassigned
+from ...services.project_index_service import ProjectIndex
+from ...services.semester_rules import semester_from_id
+from ..components.widgets.tick_checkbox import TickCheckBox
+from ..utils.datetime_utils import date_to_qdate, fmt_date, fmt_time, qdate_to_date
+from ..utils.qss_tokens import qss_color
+
+WEEKDAY_NAMES = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+# Sunday is never offered as a placement day
+PLACEMENT_WEEKDAYS = 6
+
+
+class AutoPlacementDialog(QDialog):
+    """Preview of the automatic placement of unassigned Termine; accepting applies the plan."""
+
+    def __init__(
+        self,
+        parent,
+        *,
+        termine: Iterable[Termin],
+        lvas: Iterable[Lehrveranstaltung],
+        raeume: Iterable[Raum],
+        index: ProjectIndex,
+        settings: Dict,
+        data_dir: str | Path | None = None,
+        default_semester_id: Optional[str] = None,
+    ):
+        super().__init__(parent)
+        self.setObjectName("AppDialog")
+        self.setWindowTitle("Termine automatisch einplanen")
+        self.setModal(True)
+        self.resize(900, 680)
+        self._termine = [t for t in termine if is_unassigned(t)]
+        self._lva_by_id = {str(lva.id): lva for lva in lvas}
+        self._raum_by_id = {str(r.id): r for r in raeume}
+        self._index = index
+        self._settings = settings
+        self._data_dir = data_dir
+        self._plan: Optional[PlacementPlan] = None
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(18, 16, 18, 14)
+        root.setSpacing(12)
+
+        title = QLabel("Termine automatisch einplanen", self)
+        title.setObjectName("DialogTitle")
+        root.addWidget(title)
+        subtitle = QLabel(
+            "Nicht zugewiesene Termine erhalten Datum, Uhrzeit und einen ausreichend großen "
+            "Raum, ohne Raum-, Gruppen-, Lehrpersonen- oder Studiensemester-Konflikte. "
+            "Die Vorschau ändert noch nichts.",
+            self,
+        )
+        subtitle.setObjectName("DialogSubtitle")
+        subtitle.setWordWrap(True)
+        root.addWidget(subtitle)
+
+        self.semester_cb = QComboBox()
+        self.semester_cb.setObjectName("HeaderCombo")
+        counts: Dict[str, int] = {}
+        for termin in self._termine:
+            counts[termin.semester_id or ""] = counts.get(termin.semester_id or "", 0) + 1
+        self.semester_cb.addItem(f"Alle Semester ({len(self._termine)} offen)", "")
+        for semester_id in sorted(sid for sid in counts if sid):
+            semester = semester_from_id(semester_id)
+            label = semester.name if semester else semester_id
+            self.semester_cb.addItem(f"{label} ({counts[semester_id]} offen)", semester_id)
+        self.semester_cb.currentIndexChanged.connect(self._on_semester_changed)
+
+        self.from_de = QDateEdit()
+        self.from_de.setCalendarPopup(True)
+        self.from_de.setObjectName("DateEdit")
+        self.to_de = QDateEdit()
+        self.to_de.setCalendarPopup(True)
+        self.to_de.setObjectName("DateEdit")
+        range_row = QHBoxLayout()
+        range_row.setSpacing(8)
+        range_row.addWidget(self.from_de)
+        range_row.addWidget(QLabel("bis"))
+        range_row.addWidget(self.to_de)
+        range_row.addStretch(1)
+
+        weekday_row = QHBoxLayout()
+        weekday_row.setSpacing(10)
+        self.weekday_cbs: List[TickCheckBox] = []
+        for weekday, name in enumerate(WEEKDAY_NAMES[:PLACEMENT_WEEKDAYS]):
+            cb = TickCheckBox(name)
+            cb.setChecked(weekday < 5)
+            self.weekday_cbs.append(cb)
+            weekday_row.addWidget(cb)
+        weekday_row.addStretch(1)
+
+        self.preview_btn = QPushButton("Vorschau berechnen")
+        self.preview_btn.setObjectName("SecondaryButton")
+        self.preview_btn.clicked.connect(self._compute_preview)
+        weekday_row.addWidget(self.preview_btn)
+
+        form = QFormLayout()
+        form.setHorizontalSpacing(14)
+        form.setVerticalSpacing(10)
+        form.addRow("Semester:", self.semester_cb)
+        form.addRow("Zeitraum:", range_row)
+        form.addRow("Wochentage:", weekday_row)
+        root.addWidget(self._section("Einschränkungen", form))
+
+        self.table = QTableWidget(0, 5, self)
+        self.table.setObjectName("AutoPlacementTable")
+        self.table.setHorizontalHeaderLabels(["Termin", "Datum", "Zeit", "Raum", "Hinweise"])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in (1, 2, 3, 4):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        root.addWidget(self.table, 1)
+
+        self.status_lbl = QLabel(self)
+        self.status_lbl.setObjectName("SettingsHelp")
+        self.status_lbl.setWordWrap(True)
+        root.addWidget(self.status_lbl)
+
+        bb = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self._ok_btn = bb.button(QDialogButtonBox.Ok)
+        cancel_btn = bb.button(QDialogButtonBox.Cancel)
+        if self._ok_btn:
+            self._ok_btn.setText("Einplanen")
+            self._ok_btn.setObjectName("PrimaryButton")
+            self._ok_btn.setEnabled(False)
+        if cancel_btn:
+            cancel_btn.setText("Abbrechen")
+            cancel_btn.setObjectName("SecondaryButton")
+        bb.accepted.connect(self.accept)
+        bb.rejected.connect(self.reject)
+        bb.setObjectName("DialogButtons")
+        root.addWidget(bb)
+
+        if default_semester_id:
+            idx = self.semester_cb.findData(default_semester_id)
+            if idx >= 0:
+                self.semester_cb.setCurrentIndex(idx)
+        self._on_semester_changed()
+        self.status_lbl.setText(
+            f"{len(self._termine)} nicht zugewiesene Termine. "
+            "„Vorschau berechnen“ erstellt einen Vorschlag."
+            if self._termine
+            else "Es gibt keine nicht zugewiesenen Termine."
+        )
+        self.preview_btn.setEnabled(bool(self._termine))
+
+    @property
+    def plan(self) -> Optional[PlacementPlan]:
+        return self._plan
+
+    def _section(self, title: str, content_layout: QFormLayout) -> QFrame:
+        section = QFrame(self)
+        section.setObjectName("DialogSection")
+        layout = QVBoxLayout(section)
+        layout.setContentsMargins(14, 12, 14, 14)
+        layout.setSpacing(10)
+        label = QLabel(title, section)
+        label.setObjectName("DialogSectionTitle")
+        layout.addWidget(label)
+        layout.addLayout(content_layout)
+        return section
+
+    def _on_semester_changed(self, *_args) -> None:
+        semester = semester_from_id(self.semester_cb.currentData() or "")
+        # Without a semester every Termin is placed within its own semester
+        self.from_de.setEnabled(semester is not None)
+        self.to_de.setEnabled(semester is not None)
+        if semester is not None:
+            self.from_de.setDate(date_to_qdate(semester.start))
+            self.to_de.setDate(date_to_qdate(semester.end))
+        self._set_plan(None)
+
+    def _selected_termine(self) -> List[Termin]:
+        semester_id = self.semester_cb.currentData() or ""
+        if not semester_id:
+            return list(self._termine)
+        return [t for t in self._termine if t.semester_id == semester_id]
+
+    def _compute_preview(self) -> None:
+        weekdays = [day for day, cb in enumerate(self.weekday_cbs) if cb.isChecked()]
+        limited = self.from_de.isEnabled()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            started = perf_counter()
+            placer = AutoPlacer(self._index, self._settings, data_dir=self._data_dir)
+            plan = placer.plan(
+                self._selected_termine(),
+                start=qdate_to_date(self.from_de.date()) if limited else None,
+                end=qdate_to_date(self.to_de.date()) if limited else None,
+                weekdays=weekdays,
+            )
+            elapsed = perf_counter() - started
+        finally:
+            QApplication.restoreOverrideCursor()
+        self._set_plan(plan)
+        total = len(plan.placements) + len(plan.unplaced)
+        text = f"{len(plan.placements)} von {total} Terminen eingeplant"
+        if plan.unplaced:
+            text += f", {len(plan.unplaced)} ohne Vorschlag"
+        self.status_lbl.setText(f"{text} ({elapsed:.1f} s).")
+
+    def _termin_label(self, termin: Termin) -> str:
+        lva = self._lva_by_id.get(str(termin.lva_id))
+        parts = [str(termin.id), lva.name if lva else str(termin.lva_id), termin.typ]
+        if termin.name:
+            parts.append(termin.name)
+        return " · ".join(p for p in parts if p)
+
+    def _set_plan(self, plan: Optional[PlacementPlan]) -> None:
+        self._plan = plan
+        self.table.setRowCount(0)
+        if self._ok_btn:
+            self._ok_btn.setEnabled(bool(plan and plan.placements))
+        if plan is None:
+            return
+
+        termin_by_id = {str(t.id): t for t in self._termine}
+        placements = sorted(plan.placements, key=lambda p: (p.datum, p.von, p.termin_id))
+        rows = [(termin_by_id[p.termin_id], p, "") for p in placements]
+        rows += [(termin_by_id[tid], None, reason) for tid, reason in sorted(plan.unplaced.items())]
+        unplaced_color = qss_color("conflict-severity-warning-text")
+        self.table.setRowCount(len(rows))
+        for row, (termin, placement, reason) in enumerate(rows):
+            if placement is not None:
+                raum = self._raum_by_id.get(placement.raum_id)
+                values = [
+                    self._termin_label(termin),
+                    f"{WEEKDAY_NAMES[placement.datum.weekday()]} {fmt_date(placement.datum)}",
+                    f"{fmt_time(placement.von)} - {fmt_time(placement.bis)}",
+                    placement.raum_id,
+                    ", ".join(placement.hinweise),
+                ]
+                tooltips = {3: raum.name} if raum else {}
+            else:
+                values = [self._termin_label(termin), "", "", "", reason]
+                tooltips = {}
+            tooltips[0] = values[0]
+            for column, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                if column in tooltips:
+                    item.setToolTip(tooltips[column])
+                if placement is None:
+                    item.setForeground(unplaced_color)
+                self.table.setItem(row, column, item)
@@ -0,0 +1,202 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDateEdit,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QFrame,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from ...core.models import Raum, Termin
+from ...services.slot_finder_service import CommonSlotFinder, SlotCandidate
+from ..components.widgets.tick_checkbox import TickCheckBox
+from ..utils.datetime_utils import date_to_qdate, fmt_date, fmt_time, qdate_to_date
+
+WEEKDAY_NAMES = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+
+
+class FreeSlotDialog(QDialog):
+    """Suggest times at which lecturer, Studiensemester, group and a fitting room are free."""
+
+    def __init__(
+        self,
+        parent,
+        *,
+        finder: CommonSlotFinder,
+        termin: Termin,
+        raeume: List[Raum],
+        start: date,
+        end: date,
+        duration_minutes: Optional[int] = None,
+    ):
+        super().__init__(parent)
+        self.setObjectName("AppDialog")
+        self.setWindowTitle("Freien Termin suchen")
+        self.setModal(True)
+        self.resize(760, 560)
+        self._finder = finder
+        self._termin = termin
+        self._duration = duration_minutes
+        self._raum_by_id: Dict[str, Raum] = {str(r.id): r for r in raeume}
+        self._candidates: List[SlotCandidate] = []
+        self._result: Optional[SlotCandidate] = None
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(18, 16, 18, 14)
+        root.setSpacing(12)
+
+        title = QLabel("Freien Termin suchen", self)
+        title.setObjectName("DialogTitle")
+        root.addWidget(title)
+        subtitle = QLabel(
+            "Zeitpunkte, an denen Lehrperson, Studiensemester, Gruppe und ein ausreichend "
+            "großer Raum frei sind. Die besten Vorschläge stehen oben.",
+            self,
+        )
+        subtitle.setObjectName("DialogSubtitle")
+        subtitle.setWordWrap(True)
+        root.addWidget(subtitle)
+
+        self.from_de = QDateEdit()
+        self.from_de.setCalendarPopup(True)
+        self.from_de.setObjectName("DateEdit")
+        self.from_de.setDate(date_to_qdate(start))
+        self.to_de = QDateEdit()
+        self.to_de.setCalendarPopup(True)
+        self.to_de.setObjectName("DateEdit")
+        self.to_de.setDate(date_to_qdate(end))
+        self.saturday_cb = TickCheckBox("Samstag einbeziehen")
+        search_btn = QPushButton("Suchen")
+        search_btn.setObjectName("SecondaryButton")
+        search_btn.clicked.connect(self._search)
+
+        range_row = QHBoxLayout()
+        range_row.setSpacing(8)
+        range_row.addWidget(self.from_de)
+        range_row.addWidget(QLabel("bis"))
+        range_row.addWidget(self.to_de)
+        range_row.addStretch(1)
+        range_row.addWidget(search_btn)
+
+        form = QFormLayout()
+        form.setHorizontalSpacing(14)
+        form.setVerticalSpacing(10)
+        form.addRow("Zeitraum:", range_row)
+        form.addRow("", self.saturday_cb)
+        root.addWidget(self._section("Suche", form))
+
+        self.table = QTableWidget(0, 4, self)
+        self.table.setObjectName("FreeSlotTable")
+        self.table.setHorizontalHeaderLabels(["Datum", "Zeit", "Raum", "Hinweise"])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setAlternatingRowColors(True)
+        header = self.table.horizontalHeader()
+        for column in (0, 1, 3):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.itemSelectionChanged.connect(self._sync_accept_enabled)
+        self.table.cellDoubleClicked.connect(lambda *_: self._accept())
+        root.addWidget(self.table, 1)
+
+        self.status_lbl = QLabel(self)
+        self.status_lbl.setObjectName("SettingsHelp")
+        self.status_lbl.setWordWrap(True)
+        root.addWidget(self.status_lbl)
+
+        bb = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self._ok_btn = bb.button(QDialogButtonBox.Ok)
+        cancel_btn = bb.button(QDialogButtonBox.Cancel)
+        if self._ok_btn:
+            self._ok_btn.setText("Übernehmen")
+            self._ok_btn.setObjectName("PrimaryButton")
+        if cancel_btn:
+            cancel_btn.setText("Abbrechen")
+            cancel_btn.setObjectName("SecondaryButton")
+        bb.accepted.connect(self._accept)
+        bb.rejected.connect(self.reject)
+        bb.setObjectName("DialogButtons")
+        root.addWidget(bb)
+
+        self._search()
+
+    @property
+    def result(self) -> Optional[SlotCandidate]:
+        return self._result
+
+    def _section(self, title: str, content_layout: QFormLayout) -> QFrame:
+        section = QFrame(self)
+        section.setObjectName("DialogSection")
+        layout = QVBoxLayout(section)
+        layout.setContentsMargins(14, 12, 14, 14)
+        layout.setSpacing(10)
+        label = QLabel(title, section)
+        label.setObjectName("DialogSectionTitle")
+        layout.addWidget(label)
+        layout.addLayout(content_layout)
+        return section
+
+    def _search(self) -> None:
+        start = qdate_to_date(self.from_de.date())
+        end = qdate_to_date(self.to_de.date())
+        weekdays = range(6) if self.saturday_cb.isChecked() else range(5)
+        self._candidates = self._finder.find(
+            self._termin, start, end, duration_minutes=self._duration, weekdays=weekdays
+        )
+
+        self.table.setRowCount(len(self._candidates))
+        for row, candidate in enumerate(self._candidates):
+            raum = self._raum_by_id.get(candidate.raum_id)
+            room_text = f"{candidate.raum_id} – {raum.name}" if raum else candidate.raum_id
+            if raum:
+                room_text += f" ({raum.kapazitaet} Plätze)"
+            values = [
+                f"{WEEKDAY_NAMES[candidate.datum.weekday()]} {fmt_date(candidate.datum)}",
+                f"{fmt_time(candidate.von)} - {fmt_time(candidate.bis)}",
+                room_text,
+                ", ".join(candidate.hinweise),
+            ]
+            for column, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                item.setData(Qt.UserRole, row)
+                self.table.setItem(row, column, item)
+
+        if self._candidates:
+            self.table.selectRow(0)
+            self.status_lbl.setText(f"{len(self._candidates)} Vorschläge.")
+        else:
+            self.status_lbl.setText(
+                "Kein gemeinsamer freier Termin im Zeitraum gefunden. "
+                "Zeitraum vergrößern oder Samstag einbeziehen."
+            )
+        self._sync_accept_enabled()
+
+    def _selected_candidate(self) -> Optional[SlotCandidate]:
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self._candidates[rows[0].row()]
+
+    def _sync_accept_enabled(self) -> None:
+        if self._ok_btn:
+            self._ok_btn.setEnabled(self._selected_candidate() is not None)
+
+    def _accept(self) -> None:
+        candidate = self._selected_candidate()
+        if candidate is None:
+            return
+        self._result = candidate
+        self.accept()
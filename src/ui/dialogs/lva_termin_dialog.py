@@ -1,7 +1,9 @@
+from dataclasses import replace
 from datetime import date, time, timedelta
+from pathlib import Path
 from typing import List, Optional, Dict
 
-from PySide6.QtCore import QTime, QDate, Qt, QEvent, QTimer
+from PySide6.QtCore import QTime, QDate, Qt, QEvent, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QWidget,
@@ -38,24 +40,35 @@ from ...core.models import (
     Vortragende,
     Studiensemester,
     SerienAusnahme,
+    ConflictIssue,
 )
+from ...services.conflict_labels import conflict_category_label
+from ...services.conflict_service import load_conflict_config, probe_termin_conflicts
+from ...services.project_index_service import ProjectIndex
 from ...services.semester_rules import semester_for_date, semester_from_id
+from ...services.slot_finder_service import CommonSlotFinder, default_search_range
 from ...services.termin_occurrence_service import (
     SUPPORTED_PERIODIZITAET,
+    occurrence_date_from_id,
     occurrence_id,
     series_date_sequence,
+    source_termin_id,
 )
-from ..utils.datetime_utils import date_to_qdate, qdate_to_date
+from ..utils.datetime_utils import date_to_qdate, fmt_date, qdate_to_date
+from ..utils.qss_tokens import qss_color
 
 from ..components.widgets.tick_checkbox import TickCheckBox
 from ..components.widgets.tight_combobox import TightComboBox
 from ..components.widgets.semester_selector import SemesterSelector
 from ..components.widgets.chip_list_widget import ChipListWidget
 from .series_occurrence_dialog import SeriesOccurrenceDialog
+from .free_slot_dialog import FreeSlotDialog
 
 NEW_LVA_SENTINEL = "__new_lva__"
 NEW_RAUM_SENTINEL = "__new_raum__"
 STANDARD_TERMIN_TYPES = ["VO", "UE", "VU", "LU", "SE", "PR"]
+# Delay after the last field change before the live conflict check runs
+CONFLICT_CHECK_DELAY_MS = 300
 
 
 def _scrollable_tab(form: QFormLayout) -> QScrollArea:
@@ -117,6 +130,9 @@ def _scrollable_sections(*sections: QWidget) -> QScrollArea:
 class LVATerminDialog(QDialog):
     """Dialog for editing LVA master data and Termin planning in one window."""
 
+    # Emitted from the live conflict check worker: (check generation, issues)
+    _conflicts_checked = Signal(int, object)
+
     def __init__(
         self,
         parent: QWidget,
@@ -130,6 +146,8 @@ class LVATerminDialog(QDialog):
         settings: Optional[Dict] = None,
         new_id=None,
         default_semester_id: Optional[str] = None,
+        index: Optional[ProjectIndex] = None,
+        data_dir: str | Path | None = None,
     ):
         super().__init__(parent)
         self.new_id = new_id
@@ -152,6 +170,18 @@ class LVATerminDialog(QDialog):
         self._creating_lva = False
         self._creating_raum = False
 
+        # Live conflict check against the project index, debounced and run in a worker
+        self._conflict_index = index
+        self._conflict_config = load_conflict_config(data_dir=data_dir) if index else None
+        self._conflict_generation = 0
+        self._checked_termin_id: Optional[str] = None
+        self._occurrence_issues: Dict[date, List[ConflictIssue]] = {}
+        self._conflict_timer = QTimer(self)
+        self._conflict_timer.setSingleShot(True)
+        self._conflict_timer.setInterval(CONFLICT_CHECK_DELAY_MS)
+        self._conflict_timer.timeout.connect(self._start_conflict_check)
+        self._conflicts_checked.connect(self._on_conflicts_checked)
+
         # Sentinel for unassigned date
         self._unassigned_qdate = QDate(1900, 1, 1)
 
@@ -389,6 +419,12 @@ class LVATerminDialog(QDialog):
             str(getattr(termin, "besprechungshinweis", "") or "") if termin else ""
         )
 
+        self.fixiert_cb = TickCheckBox("Nicht automatisch verschieben")
+        self.fixiert_cb.setToolTip(
+            "Fixierte Termine werden von der Plan-Optimierung nie verschoben."
+        )
+        self.fixiert_cb.setChecked(bool(getattr(termin, "fixiert", False)) if termin else False)
+
         self.besprechungshinweis_wrap = QWidget()
         self.besprechungshinweis_wrap.setObjectName("InlineField")
         besprechnung_lay = QVBoxLayout(self.besprechungshinweis_wrap)
@@ -556,11 +592,21 @@ class LVATerminDialog(QDialog):
         termin_time_form.addRow("Von:", self.time_from)
         termin_time_form.addRow("Bis:", self.time_to)
         termin_time_form.addRow("Dauer *:", self.duration_sb)
+        self.free_slot_btn = QPushButton("Freien Termin suchen…")
+        self.free_slot_btn.setObjectName("SecondaryButton")
+        self.free_slot_btn.setToolTip(
+            "Zeitpunkte vorschlagen, an denen Lehrperson, Studiensemester, Gruppe und ein "
+            "passender Raum frei sind."
+        )
+        self.free_slot_btn.setEnabled(self._conflict_index is not None)
+        self.free_slot_btn.clicked.connect(self._find_free_slot)
+        termin_time_form.addRow("", self.free_slot_btn)
 
         termin_notes_form = _dialog_form()
         termin_notes_form.addRow("Zusatzbezeichnung:", self.name_le)
         termin_notes_form.addRow("Notiz:", self.note_te)
         termin_notes_form.addRow("Zu besprechen:", self.besprechungshinweis_wrap)
+        termin_notes_form.addRow("Fixiert:", self.fixiert_cb)
         self.tabs.addTab(
             _scrollable_sections(
                 _section("Termindaten", termin_base_form),
@@ -663,6 +709,29 @@ class LVATerminDialog(QDialog):
         self._render_occurrence_table()
         self._sync_series_occurrences_tab()
 
+        self.conflict_status_lbl = QLabel()
+        self.conflict_status_lbl.setObjectName("TerminConflictStatus")
+        self.conflict_status_lbl.setWordWrap(True)
+        self.conflict_status_lbl.hide()
+        lay.addWidget(self.conflict_status_lbl)
+        for signal in (
+            self.date_de.dateChanged,
+            self.date_to_de.dateChanged,
+            self.time_from.timeChanged,
+            self.duration_sb.valueChanged,
+            self.series_cb.toggled,
+            self.repeat_cb.currentIndexChanged,
+            self.typ_cb.currentIndexChanged,
+            self.lva_id_le.textChanged,
+            self.raum_id_le.textChanged,
+            self.grp_name.textChanged,
+            self.grp_size.valueChanged,
+            self.name_le.textChanged,
+            self.semester_selector.semesterChanged,
+        ):
+            signal.connect(self._schedule_conflict_check)
+        self._schedule_conflict_check()
+
         bb = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         bb.accepted.connect(self._accept)
         bb.rejected.connect(self.reject)
@@ -1051,6 +1120,7 @@ class LVATerminDialog(QDialog):
                 detail_item.setFont(strike)
                 detail_item.setText(f"{detail_item.text()} · Fällt aus")
 
+            detail_item.setData(Qt.UserRole, detail_item.text())
             self.occurrence_table.setItem(row, 0, original_item)
             self.occurrence_table.setItem(row, 1, detail_item)
 
@@ -1063,7 +1133,34 @@ class LVATerminDialog(QDialog):
                 self.occurrence_table.setRowHeight(
                     row, max(self.occurrence_table.rowHeight(row), 40)
                 )
+        self._apply_occurrence_conflicts()
         self.occurrence_table.viewport().update()
+        self._schedule_conflict_check()
+
+    def _apply_occurrence_conflicts(self) -> None:
+        """Mark the rows of series occurrences that the last live check reported."""
+        for row, value in enumerate(self._occurrence_row_dates):
+            item = self.occurrence_table.item(row, 1)
+            if item is None or value in self._ausfall_dates:
+                continue
+            base_text = item.data(Qt.UserRole) or item.text()
+            issues = self._occurrence_issues.get(value, [])
+            if not issues:
+                item.setText(base_text)
+                item.setData(Qt.ForegroundRole, None)
+                item.setToolTip("")
+                continue
+            labels = []
+            for issue in issues:
+                label = conflict_category_label(issue.category)
+                if label not in labels:
+                    labels.append(label)
+            has_conflict = any(issue.severity == "conflict" for issue in issues)
+            prefix = "Konflikt" if has_conflict else "Warnung"
+            item.setText(f"{base_text} · {prefix}: {', '.join(labels)}")
+            severity = "conflict" if has_conflict else "warning"
+            item.setForeground(qss_color(f"conflict-severity-{severity}-text"))
+            item.setToolTip("\n".join(issue.message for issue in issues if issue.message))
 
     def _occurrence_action_widget(
         self,
@@ -1360,6 +1457,170 @@ class LVATerminDialog(QDialog):
             self.semester_selector.set_semester_id(self._suggested_semester_id, emit=True)
             self._update_semester_warning()
 
+    def _draft_termin(self, require_date: bool = True) -> Optional[Termin]:
+        """
+        The Termin as currently entered, without validation; None while it has no date
+        (unless require_date is False, then it is returned unassigned).
+        """
+        qd = self.date_de.date()
+        if qd == self._unassigned_qdate and require_date:
+            return None
+        has_date = qd != self._unassigned_qdate
+        date_to = None
+        repeat = None
+        if self._has_series_range():
+            date_to = qdate_to_date(self.date_to_de.date())
+            repeat = self.repeat_cb.currentText()
+        gname = self.grp_name.text().strip()
+        selected_semester = self._selected_semester()
+        termin_id = (
+            self.termin.id
+            if self.termin is not None and hasattr(self.termin, "id")
+            else self.new_id
+        )
+        return Termin(
+            name=self.name_le.text().strip(),
+            id=str(termin_id or ""),
+            lva_id=self._current_lva_id(),
+            typ=self._current_termin_type(),
+            datum=qdate_to_date(qd) if has_date else None,
+            start_zeit=self._current_start_time() if has_date else None,
+            raum_id=self.raum_id_le.text().strip(),
+            gruppe=Gruppe(name=gname, groesse=int(self.grp_size.value())) if gname else None,
+            anwesenheitspflicht=bool(self.ap_cb.isChecked()),
+            notiz=self.note_te.toPlainText().strip(),
+            zu_besprechen=bool(self.zu_besprechen_cb.isChecked()),
+            fixiert=bool(self.fixiert_cb.isChecked()),
+            besprechungshinweis=self.besprechungshinweis_te.toPlainText().strip(),
+            duration=int(self.duration_sb.value()),
+            semester_id=selected_semester.id if selected_semester else "",
+            datum_bis=date_to,
+            periodizitaet=repeat,
+            ausfall_daten=self._current_ausfall_dates() if date_to is not None else [],
+            serien_ausnahmen=self._current_series_exceptions() if date_to is not None else [],
+        )
+
+    def _find_free_slot(self) -> None:
+        """Let the user pick a common free slot and take over its date, time and room."""
+        draft = self._draft_termin(require_date=False)
+        if self._conflict_index is None or draft is None:
+            return
+        if not draft.id:
+            draft = replace(draft, id="__draft__")
+        finder = CommonSlotFinder(self._conflict_index, self.settings, config=self._conflict_config)
+        start, end = default_search_range(draft, date.today())
+        dlg = FreeSlotDialog(
+            self,
+            finder=finder,
+            termin=draft,
+            raeume=list(self._raum_by_id.values()),
+            start=start,
+            end=end,
+            duration_minutes=int(self.duration_sb.value()),
+        )
+        if dlg.exec() != QDialog.Accepted or dlg.result is None:
+            return
+        candidate = dlg.result
+
+        series_end = self._series_end_date() if self.series_cb.isChecked() else None
+        self.date_de.setDate(date_to_qdate(candidate.datum))
+        if series_end is not None and draft.datum is not None:
+            # keep the length of the series when it is moved
+            self._set_series_end_date(series_end + (candidate.datum - draft.datum), auto=False)
+        self.time_from.setTime(QTime(candidate.von.hour, candidate.von.minute))
+        self._set_cb(self.raum_cb, candidate.raum_id)
+
+    def _schedule_conflict_check(self, *_args) -> None:
+        if self._conflict_index is not None:
+            self._conflict_timer.start()
+
+    def _start_conflict_check(self) -> None:
+        """
+        Check the entered Termin against the project in a worker thread.
+
+        The probe index is derived on the GUI thread (cheap, unchanged Termine are reused);
+        the worker only runs the detector for the buckets the Termin falls into. Results of
+        an older check are dropped when a newer one was started meanwhile.
+        """
+        self._conflict_generation += 1
+        generation = self._conflict_generation
+        draft = self._draft_termin()
+        self._checked_termin_id = draft.id if draft is not None else None
+        if draft is None or not draft.id or not hasattr(self, "conflict_status_lbl"):
+            self._on_conflicts_checked(generation, None)
+            return
+
+        termine = [draft if str(t.id) == draft.id else t for t in self._conflict_index.termine]
+        if not any(str(t.id) == draft.id for t in self._conflict_index.termine):
+            termine.append(draft)
+        probe_index = self._conflict_index.derive(termine)
+        config = self._conflict_config
+
+        def run() -> None:
+            try:
+                issues = probe_termin_conflicts(probe_index, draft.id, config=config)
+            except Exception:
+                return
+            try:
+                self._conflicts_checked.emit(generation, issues)
+            except RuntimeError:
+                # dialog was closed before the check finished
+                pass
+
+        QThreadPool.globalInstance().start(run)
+
+    def _on_conflicts_checked(self, generation: int, issues: Optional[List[ConflictIssue]]) -> None:
+        if generation != self._conflict_generation:
+            return
+        self._occurrence_issues = {}
+        for issue in issues or []:
+            for tid in issue.termin_ids:
+                value = occurrence_date_from_id(tid)
+                if value is None or source_termin_id(tid) != self._checked_termin_id:
+                    continue
+                bucket = self._occurrence_issues.setdefault(value, [])
+                if issue not in bucket:
+                    bucket.append(issue)
+        self._apply_occurrence_conflicts()
+        self._show_conflict_status(issues)
+
+    def _show_conflict_status(self, issues: Optional[List[ConflictIssue]]) -> None:
+        if issues is None:
+            self.conflict_status_lbl.hide()
+            return
+        conflicts = [issue for issue in issues if issue.severity == "conflict"]
+        warnings = [issue for issue in issues if issue.severity != "conflict"]
+        if not issues:
+            state = "ok"
+            text = "Keine Konflikte mit bestehenden Terminen."
+        else:
+            state = "conflict" if conflicts else "warning"
+            counts = []
+            if conflicts:
+                label = "Konflikt" if len(conflicts) == 1 else "Konflikte"
+                counts.append(f"{len(conflicts)} {label}")
+            if warnings:
+                label = "Warnung" if len(warnings) == 1 else "Warnungen"
+                counts.append(f"{len(warnings)} {label}")
+            lines = [f"Beim Speichern: {', '.join(counts)}"]
+            for issue in (conflicts + warnings)[:3]:
+                parts = [conflict_category_label(issue.category)]
+                if issue.datum:
+                    parts.append(fmt_date(issue.datum))
+                if issue.lva:
+                    parts.append(str(issue.lva))
+                lines.append(" · ".join(parts))
+            if len(issues) > 3:
+                lines.append(f"… und {len(issues) - 3} weitere")
+            if self._occurrence_issues:
+                lines.append("Betroffene Serienvorkommen sind im Tab Serie markiert.")
+            text = "\n".join(lines)
+        self.conflict_status_lbl.setProperty("state", state)
+        self.conflict_status_lbl.style().unpolish(self.conflict_status_lbl)
+        self.conflict_status_lbl.style().polish(self.conflict_status_lbl)
+        self.conflict_status_lbl.setText(text)
+        self.conflict_status_lbl.show()
+
     def _accept(self):
         self._select_existing_lva_from_entered_id()
         self._select_existing_raum_from_entered_id()
@@ -1546,6 +1807,7 @@ class LVATerminDialog(QDialog):
             periodizitaet=repeat,
             ausfall_daten=ausfall_dates,
             serien_ausnahmen=serien_ausnahmen,
+            fixiert=bool(self.fixiert_cb.isChecked()),
         )
         self.accept()
 
@@ -0,0 +1,243 @@
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from PySide6.QtCore import QThreadPool, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QFrame,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from ...core.models import Lehrveranstaltung, Termin
+from ...services.plan_optimizer_service import (
+    DEFAULT_TIME_BUDGET_S,
+    OptimizationResult,
+    PlanOptimizer,
+)
+from ...services.project_index_service import ProjectIndex
+from ...services.semester_rules import semester_from_id
+from ..utils.datetime_utils import fmt_date, fmt_time
+
+WEEKDAY_NAMES = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+
+
+class PlanOptimizerDialog(QDialog):
+    """Runs the plan optimiser in a worker thread and lists the proposed changes for review."""
+
+    # Emitted from the optimiser worker: (run generation, OptimizationResult or None)
+    _optimized = Signal(int, object)
+
+    def __init__(
+        self,
+        parent,
+        *,
+        index: ProjectIndex,
+        lvas: Iterable[Lehrveranstaltung],
+        settings: Dict,
+        data_dir: str | Path | None = None,
+        default_semester_id: Optional[str] = None,
+    ):
+        super().__init__(parent)
+        self.setObjectName("AppDialog")
+        self.setWindowTitle("Plan optimieren")
+        self.setModal(True)
+        self.resize(900, 640)
+        self._index = index
+        self._lva_by_id = {str(lva.id): lva for lva in lvas}
+        self._settings = settings
+        self._data_dir = data_dir
+        self._result: Optional[OptimizationResult] = None
+        self._generation = 0
+        self._closed = False
+        self._optimized.connect(self._on_optimized)
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(18, 16, 18, 14)
+        root.setSpacing(12)
+
+        title = QLabel("Plan optimieren", self)
+        title.setObjectName("DialogTitle")
+        root.addWidget(title)
+        subtitle = QLabel(
+            "Verschiebt Termine innerhalb ihrer Woche, tauscht Räume und Zeitfenster, um "
+            "Warnungen zu reduzieren, ohne neue Konflikte zu erzeugen. Fixierte und zu "
+            "besprechende Termine werden nie verschoben.",
+            self,
+        )
+        subtitle.setObjectName("DialogSubtitle")
+        subtitle.setWordWrap(True)
+        root.addWidget(subtitle)
+
+        self.semester_cb = QComboBox()
+        self.semester_cb.setObjectName("HeaderCombo")
+        self.semester_cb.addItem("Alle Semester", "")
+        semester_ids = sorted({t.semester_id for t in index.termine if t.semester_id})
+        for semester_id in semester_ids:
+            semester = semester_from_id(semester_id)
+            self.semester_cb.addItem(semester.name if semester else semester_id, semester_id)
+        if default_semester_id:
+            idx = self.semester_cb.findData(default_semester_id)
+            if idx >= 0:
+                self.semester_cb.setCurrentIndex(idx)
+
+        self.budget_sb = QSpinBox()
+        self.budget_sb.setObjectName("Field")
+        self.budget_sb.setRange(1, 120)
+        self.budget_sb.setValue(int(DEFAULT_TIME_BUDGET_S))
+        self.budget_sb.setSuffix(" s")
+        self.budget_sb.setMinimumWidth(90)
+
+        self.run_btn = QPushButton("Optimieren")
+        self.run_btn.setObjectName("SecondaryButton")
+        self.run_btn.clicked.connect(self._start)
+        budget_row = QHBoxLayout()
+        budget_row.setSpacing(8)
+        budget_row.addWidget(self.budget_sb)
+        budget_row.addStretch(1)
+        budget_row.addWidget(self.run_btn)
+
+        form = QFormLayout()
+        form.setHorizontalSpacing(14)
+        form.setVerticalSpacing(10)
+        form.addRow("Semester:", self.semester_cb)
+        form.addRow("Rechenzeit:", budget_row)
+        root.addWidget(self._section("Optimierung", form))
+
+        self.summary_lbl = QLabel(self)
+        self.summary_lbl.setObjectName("DialogSectionTitle")
+        self.summary_lbl.setWordWrap(True)
+        root.addWidget(self.summary_lbl)
+
+        self.table = QTableWidget(0, 3, self)
+        self.table.setObjectName("PlanOptimizerTable")
+        self.table.setHorizontalHeaderLabels(["Termin", "Vorher", "Nachher"])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
+        header = self.table.horizontalHeader()
+        for column in range(3):
+            header.setSectionResizeMode(column, QHeaderView.Stretch)
+        root.addWidget(self.table, 1)
+
+        bb = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self._ok_btn = bb.button(QDialogButtonBox.Ok)
+        cancel_btn = bb.button(QDialogButtonBox.Cancel)
+        if self._ok_btn:
+            self._ok_btn.setText("Übernehmen")
+            self._ok_btn.setObjectName("PrimaryButton")
+            self._ok_btn.setEnabled(False)
+        if cancel_btn:
+            cancel_btn.setText("Abbrechen")
+            cancel_btn.setObjectName("SecondaryButton")
+        bb.accepted.connect(self.accept)
+        bb.rejected.connect(self.reject)
+        bb.setObjectName("DialogButtons")
+        root.addWidget(bb)
+
+    @property
+    def result(self) -> Optional[OptimizationResult]:
+        return self._result
+
+    def done(self, result: int) -> None:
+        # lets a running optimisation stop early
+        self._closed = True
+        super().done(result)
+
+    def _section(self, title: str, content_layout: QFormLayout) -> QFrame:
+        section = QFrame(self)
+        section.setObjectName("DialogSection")
+        layout = QVBoxLayout(section)
+        layout.setContentsMargins(14, 12, 14, 14)
+        layout.setSpacing(10)
+        label = QLabel(title, section)
+        label.setObjectName("DialogSectionTitle")
+        layout.addWidget(label)
+        layout.addLayout(content_layout)
+        return section
+
+    def _start(self) -> None:
+        self._generation += 1
+        generation = self._generation
+        self._set_result(None)
+        self.run_btn.setEnabled(False)
+        self.summary_lbl.setText("Optimiere …")
+        optimizer = PlanOptimizer(self._index, self._settings, data_dir=self._data_dir)
+        semester_id = self.semester_cb.currentData() or None
+        budget = float(self.budget_sb.value())
+
+        def run() -> None:
+            try:
+                result = optimizer.optimize(
+                    time_budget=budget,
+                    semester_id=semester_id,
+                    should_stop=lambda: self._closed or generation != self._generation,
+                )
+            except Exception:
+                result = None
+            try:
+                self._optimized.emit(generation, result)
+            except RuntimeError:
+                # dialog was closed before the run finished
+                pass
+
+        QThreadPool.globalInstance().start(run)
+
+    def _on_optimized(self, generation: int, result: Optional[OptimizationResult]) -> None:
+        if generation != self._generation:
+            return
+        self.run_btn.setEnabled(True)
+        if result is None:
+            self.summary_lbl.setText("Die Optimierung ist fehlgeschlagen.")
+            return
+        self._set_result(result)
+        self.summary_lbl.setText(
+            f"Konflikte: {result.before.conflicts} → {result.after.conflicts} · "
+            f"Warnungen: {result.before.warnings} → {result.after.warnings} · "
+            f"{len(result.changes)} Termine geändert"
+        )
+
+    def _slot_text(self, termin: Termin) -> str:
+        text = (
+            f"{WEEKDAY_NAMES[termin.datum.weekday()]} {fmt_date(termin.datum)} "
+            f"{fmt_time(termin.start_zeit)}"
+        )
+        if termin.is_series():
+            text += " (Serie)"
+        return f"{text} · {termin.raum_id}" if termin.raum_id else text
+
+    def _termin_label(self, termin: Termin) -> str:
+        lva = self._lva_by_id.get(str(termin.lva_id))
+        parts = [str(termin.id), lva.name if lva else str(termin.lva_id), termin.typ]
+        return " · ".join(p for p in parts if p)
+
+    def _set_result(self, result: Optional[OptimizationResult]) -> None:
+        self._result = result
+        changes = sorted(
+            result.changes if result else [], key=lambda c: (c.before.datum, c.before.start_zeit)
+        )
+        if self._ok_btn:
+            self._ok_btn.setEnabled(bool(changes))
+        self.table.setRowCount(len(changes))
+        for row, change in enumerate(changes):
+            values = [
+                self._termin_label(change.before),
+                self._slot_text(change.before),
+                self._slot_text(change.after),
+            ]
+            for column, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                item.setToolTip(text)
+                self.table.setItem(row, column, item)
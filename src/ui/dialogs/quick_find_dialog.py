@@ -0,0 +1,95 @@
+from typing import List, Optional
+
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtWidgets import (
+    QDialog,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+)
+
+from ...services.search_index_service import ProjectSearchIndex, QuickFindHit
+
+KIND_LABELS = {"termin": "Termin", "lva": "LVA", "raum": "Raum", "dozent": "Lehrperson"}
+
+
+class QuickFindDialog(QDialog):
+    """Ctrl+K palette: one search box over Termine, LVAs, rooms and lecturers."""
+
+    def __init__(self, parent, *, search_index: ProjectSearchIndex):
+        super().__init__(parent)
+        self.setObjectName("AppDialog")
+        self.setWindowTitle("Schnellsuche")
+        self.setModal(True)
+        self.resize(620, 460)
+        self._search_index = search_index
+        self._hits: List[QuickFindHit] = []
+        self._selected: Optional[QuickFindHit] = None
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(14, 14, 14, 12)
+        root.setSpacing(10)
+
+        self.search_input = QLineEdit(self)
+        self.search_input.setObjectName("HeaderSearch")
+        self.search_input.setPlaceholderText("Termin, LVA, Raum oder Lehrperson suchen")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self._update_results)
+        self.search_input.returnPressed.connect(self._accept_current)
+        self.search_input.installEventFilter(self)
+        root.addWidget(self.search_input)
+
+        self.results = QListWidget(self)
+        self.results.setObjectName("QuickFindList")
+        self.results.setSelectionMode(QListWidget.SingleSelection)
+        self.results.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.results.setSpacing(3)
+        self.results.itemActivated.connect(lambda _item: self._accept_current())
+        root.addWidget(self.results, 1)
+
+        self.status_lbl = QLabel(self)
+        self.status_lbl.setObjectName("SettingsHelp")
+        root.addWidget(self.status_lbl)
+
+        self._update_results("")
+
+    @property
+    def selected_hit(self) -> Optional[QuickFindHit]:
+        return self._selected
+
+    def eventFilter(self, obj, event) -> bool:
+        # Up/Down in the search box move through the results
+        if obj is self.search_input and event.type() == QEvent.Type.KeyPress:
+            step = {Qt.Key.Key_Down: 1, Qt.Key.Key_Up: -1}.get(event.key())
+            if step is not None and self.results.count():
+                row = (self.results.currentRow() + step) % self.results.count()
+                self.results.setCurrentRow(row)
+                return True
+        return super().eventFilter(obj, event)
+
+    def _update_results(self, text: str) -> None:
+        self._hits = self._search_index.quick_find(text) if text.strip() else []
+        self.results.clear()
+        for hit in self._hits:
+            label = KIND_LABELS.get(hit.kind, hit.kind)
+            detail = f"{label} · {hit.detail}" if hit.detail else label
+            item = QListWidgetItem(f"{hit.title}\n{detail}")
+            item.setToolTip(hit.title)
+            self.results.addItem(item)
+        if self._hits:
+            self.results.setCurrentRow(0)
+            self.status_lbl.setText("Enter öffnet den Treffer, Esc schließt.")
+        elif text.strip():
+            self.status_lbl.setText("Keine Treffer.")
+        else:
+            self.status_lbl.setText(
+                "Termine springen in den Kalender, LVAs, Räume und Lehrpersonen setzen den Filter."
+            )
+
+    def _accept_current(self) -> None:
+        row = self.results.currentRow()
+        if 0 <= row < len(self._hits):
+            self._selected = self._hits[row]
+            self.accept()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable, Optional
 
 from PySide6.QtCore import Qt
@@ -16,6 +17,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QRadioButton,
     QFrame,
+    QSplitter,
     QTableWidget,
     QTableWidgetItem,
     QTabWidget,
@@ -23,16 +25,24 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ...core.models import Lehrveranstaltung, Semester, Termin
+from ...core.models import Lehrveranstaltung, Raum, Semester, Termin
+from ...services.conflict_labels import conflict_category_label
+from ...services.project_index_service import ProjectIndex
 from ...services.semester_rules import semester_from_id
 from ...services.semester_tools_service import (
     DATE_MODE_PLUS_YEAR,
     DATE_MODE_SEMESTER_WEEK,
+    CopyConflictPreview,
     count_semester_termine,
+    preview_semester_copy_conflicts,
     semester_lva_summaries,
 )
 from ..components.widgets.semester_selector import SemesterSelector
 from ..components.widgets.tick_checkbox import TickCheckBox
+from ..utils.datetime_utils import fmt_date, fmt_time
+
+# Rows of the copy conflict table; filling more rows would make ticking LVAs sluggish
+MAX_COPY_CONFLICT_ROWS = 200
 
 
 @dataclass(frozen=True)
@@ -55,18 +65,29 @@ class SemesterToolsDialog(QDialog):
         termine: Iterable[Termin],
         lvas: Iterable[Lehrveranstaltung],
         default_semester_id: Optional[str] = None,
+        raeume: Iterable[Raum] = (),
+        freie_tage: Iterable[dict] | None = None,
+        index: Optional[ProjectIndex] = None,
+        data_dir: str | Path | None = None,
     ):
         super().__init__(parent)
         self.setObjectName("SemesterToolsDialog")
         self.setModal(True)
         self.setWindowTitle("Semester-Werkzeuge")
-        self.resize(820, 620)
-        self.setMinimumSize(720, 520)
+        self.resize(880, 860)
+        self.setMinimumSize(720, 640)
 
         self._termine = list(termine)
         self._lvas = list(lvas)
+        self._raeume = list(raeume)
+        self._freie_tage = list(freie_tage or [])
+        self._index = index
+        self._data_dir = data_dir
         self._semester_by_id: dict[str, Semester] = {}
         self._result: Optional[SemesterToolRequest] = None
+        # Dry run of the copy for all source LVAs, rebuilt only when its key changes
+        self._copy_preview: Optional[CopyConflictPreview] = None
+        self._copy_preview_key: Optional[tuple] = None
 
         root = QVBoxLayout(self)
         root.setContentsMargins(18, 16, 18, 14)
@@ -165,6 +186,7 @@ class SemesterToolsDialog(QDialog):
         self.copy_ausfall_cb.setToolTip(
             "Übernimmt manuell markierte Ausfälle und Serien-Ausnahmen in das Zielsemester."
         )
+        self.copy_ausfall_cb.toggled.connect(self._refresh_copy_summary)
         mode_layout.addWidget(self.copy_ausfall_cb)
         self.auto_cancel_free_days_cb = TickCheckBox(
             "Serienvorkommen auf freien Tagen im Zielsemester automatisch als Ausfall markieren"
@@ -173,6 +195,7 @@ class SemesterToolsDialog(QDialog):
         self.auto_cancel_free_days_cb.setToolTip(
             "Betrifft nur Serientermine. Einzeltermine auf freien Tagen bleiben sichtbar und werden als Konflikt gemeldet."
         )
+        self.auto_cancel_free_days_cb.toggled.connect(self._refresh_copy_summary)
         mode_layout.addWidget(self.auto_cancel_free_days_cb)
         layout.addWidget(self._section("Datumsübernahme", mode_layout))
 
@@ -185,7 +208,28 @@ class SemesterToolsDialog(QDialog):
 
         self.copy_table = self._new_table(["", "LVA", "Typ", "Termine"])
         self.copy_table.itemChanged.connect(self._refresh_copy_summary)
-        layout.addWidget(self.copy_table, 1)
+        conflicts_layout = QVBoxLayout()
+        conflicts_layout.setContentsMargins(0, 0, 0, 0)
+        conflicts_layout.setSpacing(8)
+        self.copy_conflict_summary = QLabel(self)
+        self.copy_conflict_summary.setObjectName("SemesterToolsHelp")
+        self.copy_conflict_summary.setWordWrap(True)
+        conflicts_layout.addWidget(self.copy_conflict_summary)
+        self.copy_conflict_table = self._new_table(["Art", "Datum", "Zeit", "LVA", "Raum"])
+        header = self.copy_conflict_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        self.copy_conflict_table.setMinimumHeight(110)
+        conflicts_layout.addWidget(self.copy_conflict_table, 1)
+
+        splitter = QSplitter(Qt.Vertical, self)
+        splitter.setChildrenCollapsible(False)
+        self.copy_table.setMinimumHeight(140)
+        splitter.addWidget(self.copy_table)
+        splitter.addWidget(self._section("Konflikte im Zielsemester", conflicts_layout))
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 2)
+        layout.addWidget(splitter, 1)
 
         actions = QHBoxLayout()
         actions.addStretch(1)
@@ -373,6 +417,85 @@ class SemesterToolsDialog(QDialog):
         self.copy_btn.setEnabled(
             bool(source and target and source.id != target.id and selected_terms > 0)
         )
+        self._refresh_copy_conflicts()
+
+    def _refresh_copy_conflicts(self) -> None:
+        """
+        Show the conflicts the selected copies would cause in the target semester.
+
+        The dry run covers all LVAs of the source semester and is only repeated when source,
+        target or the date options change; ticking LVAs just filters its result.
+        """
+        if not hasattr(self, "copy_conflict_table"):
+            return
+        source = self._source_semester()
+        target = self._target_semester()
+        key = None
+        if source and target and source.id != target.id:
+            key = (
+                source.id,
+                target.id,
+                self._date_mode(),
+                self.copy_ausfall_cb.isChecked(),
+                self.auto_cancel_free_days_cb.isChecked(),
+            )
+        if key != self._copy_preview_key:
+            self._copy_preview_key = key
+            self._copy_preview = None
+            if key is not None:
+                try:
+                    self._copy_preview = preview_semester_copy_conflicts(
+                        self._termine,
+                        self._lvas,
+                        self._raeume,
+                        source=source,
+                        target=target,
+                        date_mode=self._date_mode(),
+                        copy_ausfall_daten=self.copy_ausfall_cb.isChecked(),
+                        freie_tage=self._freie_tage,
+                        auto_cancel_target_free_days=self.auto_cancel_free_days_cb.isChecked(),
+                        index=self._index,
+                        data_dir=self._data_dir,
+                    )
+                except Exception:
+                    self._copy_preview = None
+
+        if key is None:
+            issues = []
+            self.copy_conflict_summary.setText("Quelle und Ziel wählen.")
+        elif self._copy_preview is None:
+            issues = []
+            self.copy_conflict_summary.setText("Konfliktvorschau nicht verfügbar.")
+        else:
+            issues = self._copy_preview.conflicts_for(self._selected_copy_lva_ids())
+            if issues:
+                text = (
+                    f"Die ausgewählten Termine erzeugen {len(issues)} Raum-, Gruppen- oder "
+                    f"Lehrpersonen-Konflikte mit {target.name}."
+                )
+                if len(issues) > MAX_COPY_CONFLICT_ROWS:
+                    text += f" Angezeigt werden die ersten {MAX_COPY_CONFLICT_ROWS}."
+                self.copy_conflict_summary.setText(text)
+            else:
+                self.copy_conflict_summary.setText(
+                    f"Keine Raum-, Gruppen- oder Lehrpersonen-Konflikte mit {target.name}."
+                )
+
+        issues = issues[:MAX_COPY_CONFLICT_ROWS]
+        table = self.copy_conflict_table
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(issues))
+        for row, issue in enumerate(issues):
+            time_text = ""
+            if issue.zeit_von:
+                time_text = f"{fmt_time(issue.zeit_von)}–{fmt_time(issue.zeit_bis)}"
+            self._set_text_item(table, row, 0, conflict_category_label(issue.category))
+            self._set_text_item(table, row, 1, fmt_date(issue.datum))
+            self._set_text_item(table, row, 2, time_text)
+            self._set_text_item(table, row, 3, str(issue.lva or ""))
+            self._set_text_item(table, row, 4, str(issue.raum or ""))
+            table.item(row, 3).setToolTip(issue.message)
+        table.setUpdatesEnabled(True)
 
     def _refresh_clear_summary(self) -> None:
         semester = self._clear_semester()
@@ -96,6 +96,8 @@ class SettingsDialog(QDialog):
         self.dynamic_drag_conflict_preview_cb.setObjectName("Field")
         self.filter_conflicts_with_global_filters_cb = TickCheckBox()
         self.filter_conflicts_with_global_filters_cb.setObjectName("Field")
+        self.parallel_conflict_detection_cb = TickCheckBox()
+        self.parallel_conflict_detection_cb.setObjectName("Field")
         self.jump_to_semester_start_cb = TickCheckBox()
         self.jump_to_semester_start_cb.setObjectName("Field")
         self.previous_year_shortcut_mode_cb = TightComboBox()
@@ -225,6 +227,13 @@ class SettingsDialog(QDialog):
             "Legt fest, ob Strg+Alt+V gehalten oder umgeschaltet wird.",
         )
         self._add_field(app_grid, 2, "Design", self.theme_cb)
+        self._add_field(
+            app_grid,
+            3,
+            "Parallele Konfliktprüfung",
+            self.parallel_conflict_detection_cb,
+            "Große Projekte auf mehreren Prozessorkernen prüfen. Lohnt sich erst ab einigen tausend Terminen.",
+        )
         content.addStretch(1)
 
         conflicts_page = self._build_conflicts_page()
@@ -529,6 +538,9 @@ class SettingsDialog(QDialog):
         self.filter_conflicts_with_global_filters_cb.setChecked(
             bool(s.get("filter_conflicts_with_global_filters", True))
         )
+        self.parallel_conflict_detection_cb.setChecked(
+            bool(s.get("parallel_conflict_detection", False))
+        )
         mode = str(s.get("previous_year_shortcut_mode", "hold")).strip().lower()
         mode_idx = self.previous_year_shortcut_mode_cb.findData(mode)
         self.previous_year_shortcut_mode_cb.setCurrentIndex(mode_idx if mode_idx >= 0 else 0)
@@ -566,6 +578,7 @@ class SettingsDialog(QDialog):
             "filter_conflicts_with_global_filters": (
                 self.filter_conflicts_with_global_filters_cb.isChecked()
             ),
+            "parallel_conflict_detection": self.parallel_conflict_detection_cb.isChecked(),
             "jump_to_semester_start_on_filter": self.jump_to_semester_start_cb.isChecked(),
             "previous_year_shortcut_mode": self.previous_year_shortcut_mode_cb.currentData()
             or "hold",
@@ -2,10 +2,11 @@
 Konflikte Dock Widget - displays schedule conflicts and warnings.
 """
 
+from dataclasses import dataclass
 from typing import List, Optional
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal, QSize, QTimer
+from PySide6.QtCore import Qt, Signal, QSize, QThreadPool, QTimer
 from PySide6.QtGui import QIcon, QPalette
 from PySide6.QtWidgets import (
     QDockWidget,
@@ -14,22 +15,34 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
+    QListView,
     QFrame,
     QStyle,
     QTabBar,
+    QAbstractItemView,
 )
 
 from ...core.models import Termin, Lehrveranstaltung, Raum, ConflictIssue
+from ...services.conflict_cache_service import (
+    conflict_cache_key,
+    load_cached_conflicts,
+    store_cached_conflicts,
+)
 from ...services.conflict_service import ConflictDetector
+from ...services.project_index_service import ProjectIndex
 from ...services.conflict_labels import (
     CONFLICT_CATEGORY_LABELS,
-    conflict_category_kind,
     conflict_category_label,
 )
 from ...services.termin_occurrence_service import source_termin_id
-from ..components.cards.conflict_card import ConflictCard
-from ..utils.datetime_utils import fmt_date, fmt_time
+from ..components.cards.conflict_card import (
+    CONFLICT_TERMIN_IDS_ROLE,
+    GROUP_CATEGORY,
+    GROUP_DATE,
+    GROUP_NONE,
+    ConflictCardDelegate,
+    ConflictListModel,
+)
 
 from ..components.widgets.tight_combobox import TightComboBox
 
@@ -38,6 +51,40 @@ def _is_dark_theme(widget: QWidget) -> bool:
     return widget.palette().color(QPalette.Window).lightness() < 128
 
 
+@dataclass(frozen=True)
+class _ConflictScan:
+    """Result of the background part of ConflictsDock.refresh_conflicts."""
+
+    cache_key: Optional[str]
+    # detected or cached issues; None if only the counts were computed
+    issues: Optional[List[ConflictIssue]] = None
+    from_cache: bool = False
+    counts: object = None
+
+
+def _scan_conflicts(
+    detector: ConflictDetector,
+    termine: List[Termin],
+    visible_termin_ids: Optional[set[str]],
+    project_dir: Optional[Path],
+    full: bool,
+) -> _ConflictScan:
+    """Hash the detection input, read the cache and detect; touches no widgets."""
+    cache_key = None
+    if project_dir:
+        cache_key = conflict_cache_key(termine, detector.lvas, detector.raeume, detector.config)
+    if cache_key:
+        cached = load_cached_conflicts(project_dir, cache_key)
+        if cached is not None:
+            return _ConflictScan(cache_key, issues=cached, from_cache=True)
+    if full:
+        issues = detector.detect_all(termine)
+        if cache_key:
+            store_cached_conflicts(project_dir, cache_key, issues)
+        return _ConflictScan(cache_key, issues=issues)
+    return _ConflictScan(cache_key, counts=detector.count_all(termine, visible_termin_ids))
+
+
 class ConflictsDock(QDockWidget):
     """
     Dock widget for displaying conflicts and warnings
@@ -45,6 +92,10 @@ class ConflictsDock(QDockWidget):
 
     # Signal emitted to highlight all related termine
     conflict_items_highlight = Signal(list)
+    # Emitted from the background revalidation: (refresh generation, detected issues)
+    _revalidated = Signal(int, object)
+    # Emitted from the background scan: (refresh generation, _ConflictScan or error)
+    _scanned = Signal(int, object)
 
     def __init__(self, parent=None):
         super().__init__("Konflikte", parent)
@@ -57,12 +108,34 @@ class ConflictsDock(QDockWidget):
         self._tab_badge_retry_delays_ms = (0, 50, 150, 400, 900, 1600)
 
         self._issues: List[ConflictIssue] = []
+        self._all_issues: List[ConflictIssue] = []
         self._detector: Optional[ConflictDetector] = None
-        self._max_visible_cards = 250
+        # While the dock is hidden only counts are computed; the issue list is built on show
+        self._issues_stale = False
+        self._list_stale = False
+        # A scan started by refresh_conflicts is still running in the thread pool
+        self._scanning = False
+        self._on_screen = False
+        self._pending_termine: List[Termin] = []
+        self._pending_visible_ids: Optional[set[str]] = None
+        # ProjectIndex version of the pending Termine, and of _all_issues once they are
+        # known to be exact (detected or revalidated in this session); see current_issues
+        self._pending_version: Optional[int] = None
+        self._issues_version: Optional[int] = None
+        self._counted_categories: List[str] = []
+        # Persisted result cache, see refresh_conflicts
+        self._cache_project_dir: Optional[Path] = None
+        self._cache_key: Optional[str] = None
+        # Cache key whose entry was written or confirmed by a detection in this session
+        self._validated_cache_key: Optional[str] = None
+        self._refresh_generation = 0
+        self._revalidated.connect(self._on_revalidated)
+        self._scanned.connect(self._on_scanned)
 
         # Filter state
         self._filter_severity = "all"  # "all", "conflict", "warning"
         self._filter_category = "all"  # "all" or specific category key
+        self._group_by = GROUP_NONE
 
         # Main widget
         main_widget = QWidget(self)
@@ -92,6 +165,15 @@ class ConflictsDock(QDockWidget):
         self.category_filter.currentIndexChanged.connect(self._on_filter_changed)
         filter_layout.addWidget(self.category_filter)
 
+        self.group_selector = TightComboBox()
+        self.group_selector.setObjectName("HeaderCombo")
+        self.group_selector.setMinimumWidth(200)
+        self.group_selector.addItem("Gruppierung: Keine", GROUP_NONE)
+        self.group_selector.addItem("Gruppierung: Kategorie", GROUP_CATEGORY)
+        self.group_selector.addItem("Gruppierung: Datum", GROUP_DATE)
+        self.group_selector.currentIndexChanged.connect(self._on_filter_changed)
+        filter_layout.addWidget(self.group_selector)
+
         filter_layout.addStretch()
 
         layout.addWidget(filter_bar)
@@ -138,42 +220,168 @@ class ConflictsDock(QDockWidget):
 
         layout.addLayout(header)
 
-        # Scrollable card list
-        self.scroll = QScrollArea(self)
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setFrameShape(QFrame.NoFrame)
-
-        self.cards_container = QWidget(self.scroll)
-        self.cards_layout = QVBoxLayout(self.cards_container)
-        self.cards_layout.setContentsMargins(0, 0, 0, 0)
-        self.cards_layout.setSpacing(8)
-        self.cards_layout.addStretch(1)
-
-        self.scroll.setWidget(self.cards_container)
-        layout.addWidget(self.scroll)
+        # Card list: the delegate paints only the visible rows, so all issues stay scrollable
+        self.issue_model = ConflictListModel(self)
+        self.issue_list = QListView(self)
+        self.issue_list.setObjectName("ConflictList")
+        self.issue_list.setFrameShape(QFrame.NoFrame)
+        self.issue_list.setModel(self.issue_model)
+        self.issue_list.setItemDelegate(ConflictCardDelegate(self.issue_list))
+        self.issue_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.issue_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.issue_list.verticalScrollBar().setSingleStep(24)
+        self.issue_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.issue_list.setLayoutMode(QListView.Batched)
+        self.issue_list.setBatchSize(200)
+        self.issue_list.setMouseTracking(True)
+        self.issue_list.setCursor(Qt.PointingHandCursor)
+        self.issue_list.clicked.connect(self._on_issue_clicked)
+        self.issue_list.activated.connect(self._on_issue_clicked)
+        layout.addWidget(self.issue_list)
 
         self.setWidget(main_widget)
         self.dockLocationChanged.connect(lambda _area: self.request_tab_badge_sync())
         self.topLevelChanged.connect(lambda _floating: self.request_tab_badge_sync())
-        self.visibilityChanged.connect(lambda _visible: self.request_tab_badge_sync())
+        self.visibilityChanged.connect(self._on_visibility_changed)
 
     def initialize_detector(
-        self, lvas: List[Lehrveranstaltung], raeume: List[Raum], data_dir=None
+        self,
+        lvas: List[Lehrveranstaltung],
+        raeume: List[Raum],
+        data_dir=None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        index: Optional[ProjectIndex] = None,
     ) -> None:
         """Initialize the conflict detector with current data."""
-        self._detector = ConflictDetector(lvas, raeume, data_dir=data_dir)
+        self._detector = ConflictDetector(
+            lvas,
+            raeume,
+            data_dir=data_dir,
+            parallel=parallel,
+            max_workers=max_workers,
+            index=index,
+        )
 
     def refresh_conflicts(
-        self, termine: List[Termin], visible_termin_ids: Optional[set[str]] = None
+        self,
+        termine: List[Termin],
+        visible_termin_ids: Optional[set[str]] = None,
+        project_dir: Optional[Path] = None,
+        index_version: Optional[int] = None,
     ) -> None:
-        """Detect and display conflicts for the given Termine."""
+        """
+        Detect and display conflicts for the given Termine.
+
+        If the dock is hidden (e.g. an inactive tab), only the counts for the summary chips
+        and the tab badge are computed; the full issue list is built when the dock is shown.
+        With project_dir (the folder the Termine were loaded from), the last result is kept
+        in the project cache. If the project files and conflict settings are unchanged, the
+        cached issues are shown at once and revalidated in the background.
+
+        Hashing, cache reading and detection run in the thread pool; the dock keeps showing
+        the previous result until the scan of the newest refresh arrives. index_version is
+        the ProjectIndex version the Termine belong to, see current_issues.
+        """
         if not self._detector:
             return
 
-        # Detect all issues
-        self._issues = self._detector.detect_all(termine)
-        if visible_termin_ids is not None:
-            visible_sources = {source_termin_id(tid) for tid in visible_termin_ids}
+        self._pending_termine = termine
+        self._pending_visible_ids = visible_termin_ids
+        self._pending_version = index_version
+        self._cache_project_dir = Path(project_dir) if project_dir else None
+        self._start_scan(full=self._on_screen and self.isVisible())
+
+    def _start_scan(self, full: bool) -> None:
+        self._refresh_generation += 1
+        self._scanning = True
+        generation = self._refresh_generation
+        args = (
+            self._detector,
+            self._pending_termine,
+            self._pending_visible_ids,
+            self._cache_project_dir,
+            full,
+        )
+
+        def run() -> None:
+            try:
+                scan = _scan_conflicts(*args)
+            except Exception as exc:
+                scan = exc
+            try:
+                self._scanned.emit(generation, scan)
+            except RuntimeError:
+                # dock deleted while the scan was running
+                pass
+
+        QThreadPool.globalInstance().start(run)
+
+    def _on_scanned(self, generation: int, scan) -> None:
+        # A newer refresh replaced the data the worker was scanning
+        if generation != self._refresh_generation:
+            return
+        self._scanning = False
+        if isinstance(scan, Exception):
+            # scan again on the GUI thread, so the error surfaces normally
+            scan = _scan_conflicts(
+                self._detector,
+                self._pending_termine,
+                self._pending_visible_ids,
+                self._cache_project_dir,
+                True,
+            )
+        self._cache_key = scan.cache_key
+        self._issues_version = None
+
+        if scan.from_cache:
+            self._set_issues(scan.issues)
+            if self._cache_key != self._validated_cache_key:
+                self._start_revalidation()
+            else:
+                self._issues_version = self._pending_version
+            return
+
+        if scan.issues is not None:
+            if self._cache_key:
+                self._validated_cache_key = self._cache_key
+            self._set_issues(scan.issues)
+            self._issues_version = self._pending_version
+            return
+
+        if self._on_screen and self.isVisible():
+            # shown while the counts were computed
+            self._start_scan(full=True)
+            return
+
+        counts = scan.counts
+        self._issues = []
+        self._all_issues = []
+        self._issues_stale = True
+        self._counted_categories = counts.categories()
+        self._rebuild_category_filter_options()
+        self._show_summary(counts.conflicts, counts.warnings)
+        self._clear_list()
+
+    def current_issues(self, index_version: int) -> Optional[List[ConflictIssue]]:
+        """
+        All detected issues (ignoring the global filters) of the given ProjectIndex version,
+        or None if they are not built yet, belong to another version or are an
+        unrevalidated cache hit.
+        """
+        if self._scanning or self._issues_stale or not self._detector:
+            return None
+        if self._issues_version != index_version:
+            return None
+        return list(self._all_issues)
+
+    def _set_issues(self, issues: List[ConflictIssue]) -> None:
+        self._issues_stale = False
+        self._counted_categories = []
+        self._all_issues = issues
+        self._issues = issues
+        if self._pending_visible_ids is not None:
+            visible_sources = {source_termin_id(tid) for tid in self._pending_visible_ids}
             self._issues = [
                 issue
                 for issue in self._issues
@@ -181,29 +389,82 @@ class ConflictsDock(QDockWidget):
             ]
         self._rebuild_category_filter_options()
 
-        conflicts = [i for i in self._issues if i.severity == "conflict"]
-        warnings = [i for i in self._issues if i.severity == "warning"]
-        self._update_title_indicator(len(conflicts), len(warnings))
+        conflict_count = sum(1 for i in self._issues if i.severity == "conflict")
+        self._show_summary(conflict_count, len(self._issues) - conflict_count)
 
-        if not self._issues:
+        # Update the list with filtered results
+        if self._on_screen and self.isVisible():
+            self._populate_list()
+        else:
+            self._clear_list()
+            self._list_stale = True
+
+    def _start_revalidation(self) -> None:
+        generation = self._refresh_generation
+        detector = self._detector
+        termine = self._pending_termine
+
+        def run() -> None:
+            try:
+                issues = detector.detect_all(termine)
+            except Exception:
+                return
+            try:
+                self._revalidated.emit(generation, issues)
+            except RuntimeError:
+                # dock deleted while the detection was running
+                pass
+
+        QThreadPool.globalInstance().start(run)
+
+    def _on_revalidated(self, generation: int, issues: List[ConflictIssue]) -> None:
+        # A newer refresh replaced the data the worker was checking
+        if generation != self._refresh_generation:
+            return
+        self._validated_cache_key = self._cache_key
+        self._issues_version = self._pending_version
+        if issues == self._all_issues:
+            return
+        if self._cache_key:
+            store_cached_conflicts(self._cache_project_dir, self._cache_key, issues)
+        self._set_issues(issues)
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        # visibilityChanged also reports inactive tabs as hidden, unlike isVisible()
+        self._on_screen = visible
+        self.request_tab_badge_sync()
+        if not visible or not self._detector:
+            return
+        if self._scanning:
+            # _on_scanned builds the list if the dock is still shown
+            return
+        if self._issues_stale:
+            self._start_scan(full=True)
+        elif self._list_stale:
+            self._populate_list()
+
+    def _show_summary(self, conflict_count: int, warning_count: int) -> None:
+        self._update_title_indicator(conflict_count, warning_count)
+
+        if not conflict_count and not warning_count:
             self.summary_label.setProperty("state", "ok")
             self.summary_label.setText("Keine Konflikte")
             self.summary_label.show()
             self.conflict_summary_chip.hide()
             self.warning_summary_chip.hide()
         else:
-            state = "conflict" if conflicts else "warning"
+            state = "conflict" if conflict_count else "warning"
             self.summary_label.setProperty("state", state)
             self.summary_label.hide()
             self._set_summary_chip(
                 self.conflict_summary_chip,
-                len(conflicts),
+                conflict_count,
                 "Konflikt",
                 "Konflikte",
             )
             self._set_summary_chip(
                 self.warning_summary_chip,
-                len(warnings),
+                warning_count,
                 "Warnung",
                 "Warnungen",
             )
@@ -212,9 +473,6 @@ class ConflictsDock(QDockWidget):
         self.conflict_summary_chip.style().polish(self.conflict_summary_chip)
         self.warning_summary_chip.style().polish(self.warning_summary_chip)
 
-        # Update cards mit filtered results
-        self._populate_cards()
-
     def _set_summary_chip(
         self, chip: QLabel, count: int, singular: str, plural: str
     ) -> None:
@@ -280,69 +538,18 @@ class ConflictsDock(QDockWidget):
                 return index
         return -1
 
-    def _populate_cards(self) -> None:
-        self._clear_cards()
+    def _populate_list(self) -> None:
+        self._list_stale = False
+        self.issue_model.set_issues(self._apply_filters(), self._group_by)
 
-        filtered_issues = self._apply_filters()
-        visible_issues = filtered_issues[: self._max_visible_cards]
+    def _clear_list(self) -> None:
+        self.issue_model.set_issues([])
 
-        if len(filtered_issues) > len(visible_issues):
-            note = QLabel(
-                f"{len(filtered_issues)} Einträge gefunden. "
-                f"Die ersten {len(visible_issues)} werden angezeigt; Filter grenzen die Liste ein.",
-                self.cards_container,
-            )
-            note.setObjectName("SettingsHelp")
-            note.setWordWrap(True)
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, note)
-
-        for issue in visible_issues:
-            type_text = "Konflikt" if issue.severity == "conflict" else "Warnung"
-            zeit_str = ""
-            if issue.zeit_von and issue.zeit_bis:
-                zeit_str = f"{fmt_time(issue.zeit_von)} - {fmt_time(issue.zeit_bis)}"
-            elif issue.zeit_von:
-                zeit_str = fmt_time(issue.zeit_von)
-
-            subtitle = f"{fmt_date(issue.datum)} · {zeit_str}".strip(" ·")
-            category_label = self._get_category_label(issue.category)
-            title = f"{type_text} · {category_label}"
-
-            conflict_kind = self._get_conflict_kind(issue.category)
-            termin_ids = [str(tid) for tid in issue.termin_ids] if issue.termin_ids else []
-
-            card = ConflictCard(
-                termin_ids=termin_ids,
-                title=title,
-                subtitle=subtitle,
-                typ=type_text,
-                raum=issue.raum,
-                lva=issue.lva,
-                gruppe=issue.gruppe,
-                message=issue.message,
-                conflict_kind=conflict_kind,
-                severity=issue.severity,
-                parent=self.cards_container,
-            )
-            card.clicked.connect(self._on_card_clicked)
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
-
-    def _clear_cards(self) -> None:
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-
-        self.cards_layout.addStretch(1)
-
-    def _on_card_clicked(self, termin_ids: list[str]) -> None:
+    def _on_issue_clicked(self, index) -> None:
+        termin_ids = index.data(CONFLICT_TERMIN_IDS_ROLE)
         if termin_ids:
             self.conflict_items_highlight.emit(termin_ids)
 
-    def _get_conflict_kind(self, category: str) -> str:
-        return conflict_category_kind(category)
-
     def _get_category_label(self, category: str) -> str:
         return conflict_category_label(category)
 
@@ -355,6 +562,7 @@ class ConflictsDock(QDockWidget):
 
         categories = set(CONFLICT_CATEGORY_LABELS.keys())
         categories.update(i.category for i in self._issues if getattr(i, "category", None))
+        categories.update(self._counted_categories)
 
         self.category_filter.blockSignals(True)
         self.category_filter.clear()
@@ -382,7 +590,8 @@ class ConflictsDock(QDockWidget):
     def _on_filter_changed(self) -> None:
         self._filter_severity = self.severity_filter.currentData() or "all"
         self._filter_category = self.category_filter.currentData() or "all"
-        self._populate_cards()
+        self._group_by = self.group_selector.currentData() or GROUP_NONE
+        self._populate_list()
 
     def _apply_filters(self) -> List[ConflictIssue]:
         filtered = self._issues
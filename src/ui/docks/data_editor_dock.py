@@ -1,5 +1,6 @@
+from dataclasses import dataclass, fields, replace
 from types import SimpleNamespace
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QTabWidget
@@ -9,6 +10,140 @@ from ...services.free_day_id_service import free_day_entry_key
 from ..utils.crud_handlers import CrudHandlers
 from ..components.widgets.editor_tab_widget import EditorTab, make_item, selected_id
 from ..utils.datetime_utils import fmt_date, fmt_time
+from ..utils.refresh_scheduler import FREE_DAYS, LVAS, RAEUME, STUDIENRICHTUNGEN, TERMINE
+
+Rows = Tuple[Tuple[str, ...], ...]
+
+# everything the tables show
+ALL_TABLE_TOPICS = frozenset({LVAS, STUDIENRICHTUNGEN, RAEUME, FREE_DAYS, TERMINE})
+
+
+@dataclass(frozen=True)
+class DataEditorRows:
+    """Cell texts for the editor tables; None for tables that stay as they are."""
+
+    lvas: Optional[Rows] = None
+    studienrichtungen: Optional[Rows] = None
+    rooms: Optional[Rows] = None
+    freie_tage: Optional[Rows] = None
+    termine: Optional[Rows] = None
+
+    def tables(self) -> Iterator[Tuple[str, Rows]]:
+        for f in fields(self):
+            rows = getattr(self, f.name)
+            if rows is not None:
+                yield f.name, rows
+
+    def merged(self, newer: "DataEditorRows") -> "DataEditorRows":
+        return replace(self, **dict(newer.tables()))
+
+
+def _row(*values) -> Tuple[str, ...]:
+    return tuple(str(v) for v in values)
+
+
+def lva_rows(lvas: List[Lehrveranstaltung], semester_data: List[Dict]) -> Rows:
+    sem_id_to_name = {
+        str(s.get("id", "")).strip(): str(s.get("name", "")).strip()
+        for s in semester_data
+        if str(s.get("id", "")).strip()
+    }
+    return tuple(
+        _row(
+            l.id,
+            l.name,
+            getattr(l, "ects", ""),
+            getattr(l.vortragende, "name", ""),
+            getattr(l.vortragende, "email", ""),
+            " / ".join([sem_id_to_name.get(sid, sid) for sid in getattr(l, "studiensemester", [])]),
+            getattr(l, "studienrichtung", ""),
+        )
+        for l in lvas
+    )
+
+
+def room_rows(rooms: List[Raum]) -> Rows:
+    return tuple(_row(r.id, r.name, r.kapazitaet, getattr(r, "gebaeude", "")) for r in rooms)
+
+
+def studienrichtung_rows(studienrichtungen: List) -> Rows:
+    rows = []
+    for f in studienrichtungen:
+        if isinstance(f, dict):
+            rows.append(_row(f.get("id", ""), f.get("name", "")))
+        else:
+            rows.append(_row(f, f))
+    return tuple(rows)
+
+
+def freie_tage_rows(freie: List[Dict]) -> Rows:
+    return tuple(
+        _row(
+            it.get("typ", ""),
+            it.get("von_datum", ""),
+            it.get("bis_datum", ""),
+            it.get("beschreibung", ""),
+            free_day_entry_key(it) or "",
+        )
+        for it in freie
+    )
+
+
+def termin_rows(termine: List[Termin], lvas: List[Lehrveranstaltung]) -> Rows:
+    def safe_date(d) -> str:
+        try:
+            return fmt_date(d) if d else ""
+        except Exception:
+            return str(d) if d is not None else ""
+
+    def safe_time(t) -> str:
+        try:
+            return fmt_time(t) if t else ""
+        except Exception:
+            return str(t) if t is not None else ""
+
+    lva_by_id = {str(l.id): l for l in lvas}
+    rows = []
+    for tm in termine:
+        start_zeit = getattr(tm, "start_zeit", None)
+        end_zeit = tm.get_end_time() if hasattr(tm, "get_end_time") else None
+        gruppe = getattr(tm, "gruppe", None)
+        if gruppe and getattr(gruppe, "name", None):
+            name = getattr(gruppe, "name", "")
+            groesse = getattr(gruppe, "groesse", None)
+            if groesse is not None and str(groesse) != "":
+                gruppe_str = f"{name} ({groesse})"
+            else:
+                gruppe_str = f"{name}"
+        else:
+            gruppe_str = ""
+        termin_name = str(getattr(tm, "name", "") or "").strip()
+        if not termin_name:
+            lva_id = str(getattr(tm, "lva_id", "") or "").strip()
+            lva = lva_by_id.get(lva_id)
+            lva_name = str(getattr(lva, "name", "") or "").strip()
+            typ = str(getattr(tm, "typ", "") or "").strip()
+            parts = [p for p in (typ, lva_name or lva_id) if p]
+            termin_name = " - ".join(parts) if parts else "(ohne Name)"
+        rows.append(
+            _row(
+                termin_name,
+                safe_date(getattr(tm, "datum", None)),
+                safe_date(getattr(tm, "datum_bis", None)),
+                getattr(tm, "periodizitaet", "") or "",
+                safe_time(start_zeit),
+                safe_time(end_zeit),
+                getattr(tm, "typ", ""),
+                getattr(tm, "lva_id", ""),
+                getattr(tm, "raum_id", ""),
+                getattr(tm, "semester_id", ""),
+                gruppe_str,
+                "Ja" if bool(getattr(tm, "zu_besprechen", False)) else "Nein",
+                getattr(tm, "besprechungshinweis", ""),
+                getattr(tm, "id", ""),
+            )
+        )
+    return tuple(rows)
 
 
 class DataEditorDock(QDockWidget):
@@ -17,12 +152,13 @@ class DataEditorDock(QDockWidget):
     LVAs, rooms, terms, free days, and Studienrichtungen.
     """
 
-    def __init__(self, parent, ds, on_data_changed=None):
+    def __init__(self, parent, ds, refresh_scheduler=None):
         super().__init__("Dateneditor", parent)
         self.setAllowedAreas(Qt.AllDockWidgetAreas)
 
         self.ds = ds
-        self.on_data_changed = on_data_changed
+        # RefreshScheduler of the main window, told what an edit in this dock changed
+        self.refresh_scheduler = refresh_scheduler
 
         wrap = QWidget(self)
         root = QVBoxLayout(wrap)
@@ -88,7 +224,16 @@ class DataEditorDock(QDockWidget):
         self.tabs.addTab(self.tab_studienrichtung, "Studienrichtungen")
 
         self.setWidget(wrap)
-        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+        # what the CRUD actions of each tab save (deleting an LVA or a room also
+        # touches its Termine, deleting a Studienrichtung the LVAs)
+        self._tab_topics = {
+            self.tab_termine: (TERMINE, LVAS, RAEUME),
+            self.tab_lva: (LVAS, TERMINE),
+            self.tab_rooms: (RAEUME, TERMINE),
+            self.tab_free: (FREE_DAYS,),
+            self.tab_studienrichtung: (STUDIENRICHTUNGEN, LVAS),
+        }
 
         self._crud = CrudHandlers(
             ds=self.ds,
@@ -106,6 +251,18 @@ class DataEditorDock(QDockWidget):
 
         self.tab_free.table.setColumnHidden(4, True)
 
+        self._tables = {
+            "lvas": self.tab_lva.table,
+            "studienrichtungen": self.tab_studienrichtung.table,
+            "rooms": self.tab_rooms.table,
+            "freie_tage": self.tab_free.table,
+            "termine": self.tab_termine.table,
+        }
+        # Rows computed while the dock was hidden, filled in when it is shown
+        self._pending_rows = DataEditorRows()
+        self._on_screen = False
+        self.visibilityChanged.connect(self._on_visibility_changed)
+
         self.tab_lva.add_clicked.connect(self._crud.add_lva)
         self.tab_lva.edit_clicked.connect(self._crud.edit_lva)
         self.tab_lva.delete_clicked.connect(self._crud.del_lva)
@@ -129,12 +286,6 @@ class DataEditorDock(QDockWidget):
     def set_termine_read_only(self, read_only: bool) -> None:
         self.tab_termine.set_actions_enabled(not bool(read_only))
 
-    def _on_tab_changed(self, index):
-        # when the user opens the Termine tab, make sure it reflects the latest planner state, but don’t trigger a global refresh on every tab switch
-        if self.tabs.widget(index) == self.tab_termine:
-            if self.on_data_changed:
-                self.on_data_changed()
-
     def create_entity(self, entity: str) -> None:
         entity_map = {
             "termin": self.tab_termine,
@@ -156,136 +307,82 @@ class DataEditorDock(QDockWidget):
         tab.btn_add.click()
 
     def refresh_all(self) -> None:
-        self._refresh_lvas()
-        self._refresh_studienrichtungen()
-        self._refresh_rooms()
-        self._refresh_freie_tage()
-        self._refresh_termine()
-
-    # Refresh tables
-    def _refresh_lvas(self) -> None:
-        lvas: List[Lehrveranstaltung] = self.ds.load_lvas()
-        semester_data = self.ds.load_studiensemester()
-        sem_id_to_name = {
-            str(s.get("id", "")).strip(): str(s.get("name", "")).strip()
-            for s in semester_data
-            if str(s.get("id", "")).strip()
-        }
-
-        rows = [
-            [
-                l.id,
-                l.name,
-                getattr(l, "ects", ""),
-                getattr(l.vortragende, "name", ""),
-                getattr(l.vortragende, "email", ""),
-                " / ".join(
-                    [sem_id_to_name.get(sid, sid) for sid in getattr(l, "studiensemester", [])]
-                ),
-                getattr(l, "studienrichtung", ""),
-            ]
-            for l in lvas
-        ]
-        self._fill_table(self.tab_lva.table, rows)
-
-    def _refresh_rooms(self) -> None:
-        rooms: List[Raum] = self.ds.load_raeume()
-        rows = [[r.id, r.name, str(r.kapazitaet), getattr(r, "gebaeude", "")] for r in rooms]
-        self._fill_table(self.tab_rooms.table, rows)
-
-    def _refresh_studienrichtungen(self) -> None:
-        studienrichtungen = self.ds.load_studienrichtungen()
-        rows = []
-        for f in studienrichtungen:
-            if isinstance(f, dict):
-                rows.append([str(f.get("id", "")), str(f.get("name", ""))])
-            else:
-                txt = str(f)
-                rows.append([txt, txt])
-        self._fill_table(self.tab_studienrichtung.table, rows)
-
-    def _refresh_freie_tage(self) -> None:
-        freie = self.ds.load_freie_tage()
-        rows = []
-        for it in freie:
-            typ = str(it.get("typ", ""))
-            von = str(it.get("von_datum", ""))
-            bis = str(it.get("bis_datum", ""))
-            beschr = str(it.get("beschreibung", ""))
-            rows.append([typ, von, bis, beschr, free_day_entry_key(it) or ""])
-        self._fill_table(self.tab_free.table, rows)
-
-    def _refresh_termine(self) -> None:
-        def safe_date(d) -> str:
-            try:
-                return fmt_date(d) if d else ""
-            except Exception:
-                return str(d) if d is not None else ""
-
-        def safe_time(t) -> str:
-            try:
-                return fmt_time(t) if t else ""
-            except Exception:
-                return str(t) if t is not None else ""
-
-        termine: List[Termin] = self.ds.load_termine()
-        lva_by_id = {str(l.id): l for l in self.ds.load_lvas()}
-        rows = []
-        for tm in termine:
-            start_zeit = getattr(tm, "start_zeit", None)
-            end_zeit = tm.get_end_time() if hasattr(tm, "get_end_time") else None
-            gruppe = getattr(tm, "gruppe", None)
-            if gruppe and getattr(gruppe, "name", None):
-                name = getattr(gruppe, "name", "")
-                groesse = getattr(gruppe, "groesse", None)
-                if groesse is not None and str(groesse) != "":
-                    gruppe_str = f"{name} ({groesse})"
-                else:
-                    gruppe_str = f"{name}"
-            else:
-                gruppe_str = ""
-            termin_name = str(getattr(tm, "name", "") or "").strip()
-            if not termin_name:
-                lva_id = str(getattr(tm, "lva_id", "") or "").strip()
-                lva = lva_by_id.get(lva_id)
-                lva_name = str(getattr(lva, "name", "") or "").strip()
-                typ = str(getattr(tm, "typ", "") or "").strip()
-                parts = [p for p in (typ, lva_name or lva_id) if p]
-                termin_name = " - ".join(parts) if parts else "(ohne Name)"
-            rows.append(
-                [
-                    termin_name,
-                    safe_date(getattr(tm, "datum", None)),
-                    safe_date(getattr(tm, "datum_bis", None)),
-                    getattr(tm, "periodizitaet", "") or "",
-                    safe_time(start_zeit),
-                    safe_time(end_zeit),
-                    getattr(tm, "typ", ""),
-                    getattr(tm, "lva_id", ""),
-                    getattr(tm, "raum_id", ""),
-                    getattr(tm, "semester_id", ""),
-                    gruppe_str,
-                    "Ja" if bool(getattr(tm, "zu_besprechen", False)) else "Nein",
-                    getattr(tm, "besprechungshinweis", ""),
-                    getattr(tm, "id", ""),
-                ]
-            )
-        self._fill_table(self.tab_termine.table, rows)
+        self.apply_rows(self.compute_rows(ALL_TABLE_TOPICS))
+
+    def refresh(self, changed) -> None:
+        """Refresh only the tables that show one of the changed parts of the project"""
+        self.apply_rows(self.compute_rows(changed))
+
+    def compute_rows(self, changed, loaded=None) -> "DataEditorRows":
+        """
+        Table rows for the changed parts of the project. Reads the files but touches no
+        widgets, so it can run in the refresh pass' background stage. loaded is the
+        PlannerState.load result of the same pass, if there is one.
+        """
+        raeume = loaded.raeume if loaded is not None else None
+        lvas = loaded.lvas if loaded is not None else None
+        termine = loaded.termine if loaded is not None else None
+
+        def get_lvas():
+            nonlocal lvas
+            if lvas is None:
+                lvas = self.ds.load_lvas()
+            return lvas
+
+        tables = {}
+        if LVAS in changed:
+            tables["lvas"] = lva_rows(get_lvas(), self.ds.load_studiensemester())
+        if STUDIENRICHTUNGEN in changed:
+            tables["studienrichtungen"] = studienrichtung_rows(self.ds.load_studienrichtungen())
+        if RAEUME in changed:
+            tables["rooms"] = room_rows(raeume if raeume is not None else self.ds.load_raeume())
+        if FREE_DAYS in changed:
+            tables["freie_tage"] = freie_tage_rows(self.ds.load_freie_tage())
+        if TERMINE in changed or LVAS in changed:
+            if termine is None:
+                termine = self.ds.load_termine()
+            tables["termine"] = termin_rows(termine, get_lvas())
+        return DataEditorRows(**tables)
+
+    def apply_rows(self, rows: "DataEditorRows") -> None:
+        """Fill the tables from compute_rows; while the dock is hidden this waits until shown"""
+        self._pending_rows = self._pending_rows.merged(rows)
+        if self._on_screen:
+            self._apply_pending_rows()
+
+    def _apply_pending_rows(self) -> None:
+        rows, self._pending_rows = self._pending_rows, DataEditorRows()
+        for name, table_rows in rows.tables():
+            self._fill_table(self._tables[name], table_rows)
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        # visibilityChanged also reports inactive tabs as hidden, unlike isVisible()
+        self._on_screen = visible
+        if visible:
+            self._apply_pending_rows()
 
     def _refresh_and_notify(self) -> None:
-        self.refresh_all()
-        if self.on_data_changed:
-            self.on_data_changed()
+        if self.refresh_scheduler is None:
+            self.refresh_all()
+            return
+        # the refresh pass also updates this dock's tables
+        tab = self.tabs.currentWidget()
+        topics = self._tab_topics.get(tab, (TERMINE, LVAS, RAEUME))
+        label = self.tabs.tabText(self.tabs.currentIndex())
+        self.refresh_scheduler.invalidate(*topics, action=f"Dateneditor: {label}")
 
-    def _fill_table(self, table, rows: List[List[object]]) -> None:
+    def _fill_table(self, table, rows: Rows) -> None:
         table.setSortingEnabled(False)
         table.setRowCount(0)
+        table.setRowCount(len(rows))
 
-        for row_vals in rows:
-            row = table.rowCount()
-            table.insertRow(row)
+        # cloning one non-editable item is cheaper than setting the flags on every cell
+        prototype = make_item("")
+        for row, row_vals in enumerate(rows):
             for c, v in enumerate(row_vals):
-                table.setItem(row, c, make_item(str(v)))
+                item = prototype.clone()
+                item.setText(v)
+                table.setItem(row, c, item)
 
         table.setSortingEnabled(True)
         table.resizeColumnsToContents()
@@ -13,10 +13,12 @@ from PySide6.QtWidgets import (
     QPushButton,
 )
 
+from ..components.widgets.searchable_combobox import SearchableComboBox
 from ..components.widgets.tight_combobox import TightComboBox
 from ..components.widgets.semester_selector import SemesterSelector
 from ..components.widgets.tick_checkbox import TickCheckBox
 from ...core.states import FilterState
+from ...services.filter_service import FilterOptions, build_filter_options
 
 
 class GlobalFilterDock(QDockWidget):
@@ -30,7 +32,10 @@ class GlobalFilterDock(QDockWidget):
         super().__init__("Filter", parent)
         self.setAllowedAreas(Qt.TopDockWidgetArea | Qt.BottomDockWidgetArea)
         self.setFeatures(QDockWidget.NoDockWidgetFeatures)
-        self._all_rooms = []
+        # (text, room id, building) of every room; see _refresh_room_options
+        self._room_options = ()
+        # entries each combo currently shows; see _set_combo_items
+        self._combo_entries = {}
 
         title_bar = QWidget(self)
         title_bar.setObjectName("FilterDockTitleBar")
@@ -92,14 +97,14 @@ class GlobalFilterDock(QDockWidget):
         self.studiensemester_cb.setObjectName("HeaderCombo")
         headerBar.addWidget(self.studiensemester_cb)
 
-        self.lva_cb = TightComboBox()
+        self.lva_cb = SearchableComboBox()
         self.lva_cb.setToolTip("LVA filter")
         self.lva_cb.setMinimumWidth(140)
         self.lva_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         self.lva_cb.setObjectName("HeaderCombo")
         headerBar.addWidget(self.lva_cb)
 
-        self.dozent_cb = TightComboBox()
+        self.dozent_cb = SearchableComboBox()
         self.dozent_cb.setToolTip("Dozent filter")
         self.dozent_cb.setMinimumWidth(120)
         self.dozent_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
@@ -122,7 +127,7 @@ class GlobalFilterDock(QDockWidget):
         self.building_cb.setObjectName("HeaderCombo")
         headerBar.addWidget(self.building_cb)
 
-        self.room_cb = TightComboBox()
+        self.room_cb = SearchableComboBox()
         self.room_cb.setToolTip("Filtert auf einen konkreten Raum")
         self.room_cb.setMinimumWidth(120)
         self.room_cb.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
@@ -197,6 +202,33 @@ class GlobalFilterDock(QDockWidget):
         self._update_room_filter_visibility()
         self._on_change()
 
+    def focus_filter(
+        self,
+        *,
+        lva_id: Optional[str] = None,
+        raum_id: Optional[str] = None,
+        dozent: Optional[str] = None,
+    ) -> bool:
+        """Select one LVA, room or lecturer (other filters stay); False if it is not offered."""
+        if raum_id is not None:
+            # the room may lie outside the selected building
+            self.building_cb.blockSignals(True)
+            self.building_cb.setCurrentIndex(0)
+            self.building_cb.blockSignals(False)
+            self._refresh_room_options(raum_id)
+            if self.room_cb.currentData() != raum_id:
+                return False
+        else:
+            combo, value = (self.lva_cb, lva_id) if lva_id is not None else (self.dozent_cb, dozent)
+            i = combo.findData(value)
+            if i < 0:
+                return False
+            combo.blockSignals(True)
+            combo.setCurrentIndex(i)
+            combo.blockSignals(False)
+        self._on_change()
+        return True
+
     def reset_filters(self) -> None:
         widgets = (
             self.studienrichtung_cb,
@@ -244,162 +276,100 @@ class GlobalFilterDock(QDockWidget):
         dozent_list=None,
         current: Optional[FilterState] = None,
     ) -> None:
-        cur_studienrichtung = current.studienrichtung if current else None
-        cur_sem = current.semester if current else None
-        cur_lva = current.lva_id if current else None
+        self.set_filter_options(
+            build_filter_options(
+                studienrichtungen,
+                lva_list,
+                raum_list,
+                studiensemester_list=studiensemester_list,
+                typ_list=typ_list,
+                dozent_list=dozent_list,
+            ),
+            current,
+        )
+
+    def set_filter_options(
+        self, options: FilterOptions, current: Optional[FilterState] = None
+    ) -> None:
+        """Show options and select current; only combos whose entries changed are rebuilt."""
         cur_building = getattr(current, "gebaeude", None) if current else None
-        cur_room = current.raum_id if current else None
-        cur_typ = current.typ if current else None
-        cur_dozent = current.dozent if current else None
-        cur_studiensemester = current.studiensemester if current else None
         cur_zu_besprechen = bool(getattr(current, "zu_besprechen", False)) if current else False
-        self._all_rooms = list(raum_list or [])
+        self._room_options = options.raeume
 
         self.zu_besprechen_cb.blockSignals(True)
         self.zu_besprechen_cb.setChecked(cur_zu_besprechen)
         self.zu_besprechen_cb.blockSignals(False)
 
-        sem_id_to_display = {}
-        for item in studiensemester_list or []:
-            if isinstance(item, dict):
-                semester_id = str(item.get("id", "")).strip()
-                name = str(item.get("name", "")).strip()
-            else:
-                semester_id = str(getattr(item, "id", "")).strip()
-                name = str(getattr(item, "name", "")).strip()
-            if semester_id:
-                sem_id_to_display[semester_id] = name or semester_id
-
-        studiensemester_ids = set()
-        for lv in lva_list:
-            for sem_id in getattr(lv, "studiensemester", []):
-                studiensemester_ids.add(sem_id)
-
-        studiensemester_items = [("Studiensemester: Alle", None)] + [
-            (sem_id_to_display.get(sem_id, sem_id), sem_id)
-            for sem_id in sorted(studiensemester_ids)
-        ]
-
-        self.studiensemester_cb.blockSignals(True)
-        self.studiensemester_cb.clear()
-        for text, data in studiensemester_items:
-            self.studiensemester_cb.addItem(text, data)
-        if cur_studiensemester is not None:
-            i = self.studiensemester_cb.findData(cur_studiensemester)
-            if i >= 0:
-                self.studiensemester_cb.setCurrentIndex(i)
-        self.studiensemester_cb.blockSignals(False)
-
-        studienrichtung_items = []
-        for f in studienrichtungen:
-            if isinstance(f, dict):
-                studienrichtung_items.append((f.get("name", f.get("id", "")), f.get("id", "")))
-            else:
-                studienrichtung_items.append((str(f), str(f)))
-        self._set_combo_items(
-            self.studienrichtung_cb,
-            "Studienrichtung: Alle",
-            None,
-            studienrichtung_items,
-            cur_studienrichtung,
-        )
-
-        self.semester_selector.set_semester_id(cur_sem)
-
-        self._set_combo_items(
-            self.lva_cb,
-            "LVA: Alle",
-            None,
-            [(f"{lv.id} – {getattr(lv, 'name', '')}", lv.id) for lv in lva_list],
-            cur_lva,
-        )
-
-        typ_items = [(tp, tp) for tp in sorted({t for t in typ_list or [] if t})]
-        self._set_combo_items(
-            self.typ_cb,
-            "Typ: Alle",
-            None,
-            typ_items,
-            cur_typ,
-        )
-
-        building_items = [
-            (building, building)
-            for building in sorted(
-                {
-                    str(getattr(r, "gebaeude", "") or "").strip()
-                    for r in raum_list
-                    if str(getattr(r, "gebaeude", "") or "").strip()
-                }
-            )
-        ]
-        self._set_combo_items(
-            self.building_cb,
-            "Gebäude: Alle",
-            None,
-            building_items,
-            cur_building,
-        )
-
-        self._refresh_room_options(cur_room)
-
-        if dozent_list is not None:
-            dozent_items = [(d, d) for d in sorted({d for d in dozent_list if d})]
-        else:
-            dozent_items = [
-                (d, d)
-                for d in sorted(
-                    {
-                        getattr(lv.vortragende, "name", "")
-                        for lv in lva_list
-                        if hasattr(lv, "vortragende") and getattr(lv.vortragende, "name", "")
-                    }
-                )
-            ]
-        self._set_combo_items(
+        rebuilt = False
+        for combo, label, items, cur in (
+            (
+                self.studiensemester_cb,
+                "Studiensemester: Alle",
+                options.studiensemester,
+                current.studiensemester if current else None,
+            ),
+            (
+                self.studienrichtung_cb,
+                "Studienrichtung: Alle",
+                options.studienrichtungen,
+                current.studienrichtung if current else None,
+            ),
+            (self.lva_cb, "LVA: Alle", options.lvas, current.lva_id if current else None),
+            (self.typ_cb, "Typ: Alle", options.typen, current.typ if current else None),
+            (self.building_cb, "Gebäude: Alle", options.gebaeude, cur_building),
+        ):
+            rebuilt |= self._set_combo_items(combo, label, None, items, cur)
+
+        self.semester_selector.set_semester_id(current.semester if current else None)
+        rebuilt |= self._refresh_room_options(current.raum_id if current else None)
+        rebuilt |= self._set_combo_items(
             self.dozent_cb,
             "Dozent: Alle",
             None,
-            dozent_items,
-            cur_dozent,
+            options.dozenten,
+            current.dozent if current else None,
         )
         self._update_room_filter_visibility()
-        self._update_scroll_content_size()
+        if rebuilt:
+            self._update_scroll_content_size()
 
-    def _refresh_room_options(self, current_room) -> None:
+    def _refresh_room_options(self, current_room) -> bool:
         active_building = self.building_cb.currentData() or None
         rooms = [
-            r
-            for r in self._all_rooms
-            if not active_building
-            or str(getattr(r, "gebaeude", "") or "").strip() == active_building
+            (text, room_id)
+            for text, room_id, building in self._room_options
+            if not active_building or building == active_building
         ]
-        if current_room and not any(str(getattr(r, "id", "")) == str(current_room) for r in rooms):
+        if current_room and not any(str(room_id) == str(current_room) for _t, room_id in rooms):
             current_room = None
 
-        self._set_combo_items(
-            self.room_cb,
-            "Raum: Alle",
-            None,
-            [(f"{r.id} – {getattr(r, 'name', '')}", r.id) for r in rooms],
-            current_room,
-        )
+        rebuilt = self._set_combo_items(self.room_cb, "Raum: Alle", None, rooms, current_room)
         self._update_room_filter_visibility()
+        return rebuilt
 
     def _update_room_filter_visibility(self) -> None:
         self.building_cb.setVisible(not bool(self.room_cb.currentData()))
 
-    def _set_combo_items(self, combo, label: str, default_data, items, current) -> None:
+    def _set_combo_items(self, combo, label: str, default_data, items, current) -> bool:
+        """
+        Give combo the entries label + items and select current (the first entry if it is
+        not offered). The entries are only replaced if they changed; returns whether they were.
+        """
+        entries = ((label, default_data),) + tuple(items)
+        rebuild = self._combo_entries.get(combo) != entries
         combo.blockSignals(True)
-        combo.clear()
-        combo.addItem(label, default_data)
-
-        for text, data in items:
-            combo.addItem(text, data)
-
-        if current is not None and current != "":
-            i = combo.findData(current)
-            if i >= 0:
-                combo.setCurrentIndex(i)
-
-        combo.blockSignals(False)
+        try:
+            if rebuild:
+                self._combo_entries[combo] = entries
+                combo.clear()
+                # one insertion for all rows instead of one per addItem
+                combo.addItems([text for text, _data in entries])
+                for i, (_text, data) in enumerate(entries):
+                    combo.setItemData(i, data)
+            i = combo.findData(current) if current is not None and current != "" else 0
+            combo.setCurrentIndex(max(i, 0))
+        finally:
+            combo.blockSignals(False)
+        if isinstance(combo, SearchableComboBox):
+            combo._restore_current_text()
+        return rebuild
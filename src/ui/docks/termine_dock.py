@@ -1,7 +1,6 @@
 from collections import defaultdict
-from datetime import date, time
 from functools import partial
-from typing import List
+from typing import Dict, List, Optional
 
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
@@ -19,10 +18,14 @@ from PySide6.QtWidgets import (
 
 from ..utils.datetime_utils import fmt_date, fmt_time
 from ...core.models import Termin, Lehrveranstaltung, Raum
+from ...services.search_index_service import ProjectSearchIndex
 from ...services.semester_rules import semester_from_id
 from ..components.cards.termin_card import TerminCard
 from ..components.dragdrop.termin_drop_area import TerminDropArea
 
+# Typing pause before the card list is rebuilt for a new search text
+SEARCH_DELAY_MS = 150
+
 
 class TermineDock(QDockWidget):
     """Dock widget that lists Termine as grouped cards with edit/delete/unassign signals"""
@@ -31,6 +34,7 @@ class TermineDock(QDockWidget):
     termin_delete_clicked = Signal(str)
     termin_unassign_requested = Signal(str)
     termin_jump_requested = Signal(str)
+    termin_slot_search_requested = Signal(str)
 
     def _init_group_states(self):
         self._group_states = {}
@@ -42,9 +46,16 @@ class TermineDock(QDockWidget):
         self._all_termine: List[Termin] = []
         self._lvas: List[Lehrveranstaltung] = []
         self._raeume: List[Raum] = []
+        self._lva_by_id: Dict[str, Lehrveranstaltung] = {}
+        self._raum_by_id: Dict[str, Raum] = {}
         self._search_query = ""
+        self._search_index: Optional[ProjectSearchIndex] = None
         self._read_only = False
         self._init_group_states()
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._build_cards)
 
         header = QWidget(self)
         header.setObjectName("HeaderBar")
@@ -105,18 +116,25 @@ class TermineDock(QDockWidget):
         lvas: List[Lehrveranstaltung],
         raeume: List[Raum],
     ) -> None:
+        # termine arrive in planner order (termin_sort_key); cards keep that order per LVA
         self._all_termine = list(termine)
         self._lvas = list(lvas)
         self._raeume = list(raeume)
+        self._lva_by_id = {l.id: l for l in self._lvas}
+        self._raum_by_id = {r.id: r for r in self._raeume}
 
         self._build_cards()
 
+    def set_search_index(self, search_index: Optional[ProjectSearchIndex]) -> None:
+        """Index answering the search box; without one the rows are scanned."""
+        self._search_index = search_index
+
     def _normalize(self, text: str) -> str:
         return str(text or "").strip().lower()
 
     def _search_blob(self, termin: Termin) -> str:
-        lva = next((l for l in self._lvas if l.id == termin.lva_id), None)
-        raum = next((r for r in self._raeume if r.id == termin.raum_id), None)
+        lva = self._lva_by_id.get(termin.lva_id)
+        raum = self._raum_by_id.get(termin.raum_id)
         dozent = ""
         if lva and getattr(lva, "vortragende", None):
             dozent = getattr(lva.vortragende, "name", "") or ""
@@ -139,6 +157,9 @@ class TermineDock(QDockWidget):
         query = self._normalize(self._search_query)
         if not query:
             return terms
+        if self._search_index is not None:
+            hits = self._search_index.search_termine(query)
+            return terms if hits is None else [t for t in terms if str(t.id) in hits]
 
         filtered: List[Termin] = []
         for t in terms:
@@ -149,7 +170,7 @@ class TermineDock(QDockWidget):
 
     def _on_search_text_changed(self, text: str) -> None:
         self._search_query = text
-        self._build_cards()
+        self._search_timer.start()
 
     def set_search_enabled(self, enabled: bool) -> None:
         self.search_input.setVisible(enabled)
@@ -157,9 +178,12 @@ class TermineDock(QDockWidget):
         if not enabled:
             self.search_input.clear()
             self._search_query = ""
+            self._search_timer.stop()
             self._build_cards()
 
     def _jump_to_first_search_result(self) -> None:
+        if self._search_timer.isActive():
+            self._build_cards()
         terms = self._filtered_terms_for_search()
         if not terms:
             return
@@ -178,6 +202,7 @@ class TermineDock(QDockWidget):
         return f"SS {semester.start.year % 100:02d}"
 
     def _build_cards(self) -> None:
+        self._search_timer.stop()
         # clear old cards (leave last stretch)
         while self.list_layout.count() > 1:
             item = self.list_layout.takeAt(0)
@@ -189,14 +214,6 @@ class TermineDock(QDockWidget):
         terms = self._filtered_terms_for_search()
         self.result_label.setText(f"{len(terms)} Treffer" if self._search_query.strip() else "")
 
-        def _sort_key(t: Termin):
-            unassigned = (t.datum is None) or (t.start_zeit is None)
-            d = t.datum or date.min
-            von = t.start_zeit if t.start_zeit else time.min
-            return (not unassigned, d, von, t.id)
-
-        terms = sorted(terms, key=_sort_key)
-
         # Group termine by lva_id
         lva_groups = defaultdict(list)
         for t in terms:
@@ -204,11 +221,11 @@ class TermineDock(QDockWidget):
 
         # Sort LVA groups by display name, then by ID
         def lva_sort_key(lva_id):
-            lva = next((l for l in self._lvas if l.id == lva_id), None)
+            lva = self._lva_by_id.get(lva_id)
             return ((lva.name if lva else ""), (lva.id if lva else str(lva_id)))
 
         for lva_id in sorted(lva_groups.keys(), key=lva_sort_key):
-            lva = next((l for l in self._lvas if l.id == lva_id), None)
+            lva = self._lva_by_id.get(lva_id)
             lva_name = lva.name if lva else str(lva_id)
 
             # Collapsible group header
@@ -253,7 +270,7 @@ class TermineDock(QDockWidget):
                 continue
 
             for t in lva_groups[lva_id]:
-                raum = next((r for r in self._raeume if r.id == t.raum_id), None)
+                raum = self._raum_by_id.get(t.raum_id)
                 title = f"{t.lva_id} – {(lva.name if lva else '')}".strip(" –")
                 raum_txt = f"{t.raum_id} – {(raum.name if raum else '')}".strip(" –")
                 if t.is_series() and getattr(t, "datum_bis", None):
@@ -320,12 +337,17 @@ class TermineDock(QDockWidget):
                 self.termin_jump_requested.emit(termin_id)
             return
 
+        act_slot = None
+        if t is not None and not assigned:
+            act_slot = menu.addAction("Freien Termin suchen…")
         act_edit = menu.addAction("Bearbeiten")
         act_del = menu.addAction("Löschen")
 
         chosen = menu.exec(self.cursor().pos())
         if act_jump is not None and chosen == act_jump:
             self.termin_jump_requested.emit(termin_id)
+        elif act_slot is not None and chosen == act_slot:
+            self.termin_slot_search_requested.emit(termin_id)
         elif chosen == act_edit:
             self.termin_double_clicked.emit(termin_id)
         elif chosen == act_del:
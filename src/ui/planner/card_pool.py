@@ -0,0 +1,93 @@
+from collections import defaultdict, deque
+from datetime import date
+
+from PySide6.QtWidgets import QTableWidget, QWidget
+from shiboken6 import isValid
+
+from .termincard import TerminCard
+from .timeslotcell import TimeSlotCell
+
+
+class PlannerCardPool:
+    """
+    Recycles the TimeSlotCells and TerminCards of one planner table between renders.
+
+    A render starts with begin() and ends with end(). In between, cell() keeps the cell
+    that already sits at a row and column, and card() hands out a card to rebind with
+    TerminCard.bind: first the cards already shown in that cell, in their order, then
+    spare cards of the requested kind. end() removes the cells that were not used again
+    and keeps their cards, and the ones a cell no longer needs, as spares for later renders.
+    """
+
+    # spare cards kept beyond what the last render used
+    MAX_SPARE_CARDS = 64
+
+    def __init__(self, table: QTableWidget):
+        self.table = table
+        # hidden parent of the spare cards, so they are no longer children of any cell
+        self._holder = QWidget(table)
+        self._holder.hide()
+        self._cells: dict[tuple[int, int], TimeSlotCell] = {}
+        # positions used in this render
+        self._used: set[tuple[int, int]] = set()
+        # per used cell: cards it showed before, not yet rebound
+        self._reusable: dict[TimeSlotCell, deque] = {}
+        self._spare_cards: dict[str, list[TerminCard]] = defaultdict(list)
+
+    def begin(self) -> None:
+        self._used = set()
+        self._reusable = {}
+
+    def cell(self, row: int, col: int, target_date: date) -> TimeSlotCell:
+        pos = (row, col)
+        cell = self._cells.get(pos)
+        # setRowCount/setColumnCount delete the cell widgets of removed rows and columns
+        if cell is None or not isValid(cell) or self.table.cellWidget(row, col) is not cell:
+            cell = TimeSlotCell(target_date)
+            self.table.setCellWidget(row, col, cell)
+            self._cells[pos] = cell
+            self._reusable[cell] = deque()
+        elif pos in self._used:
+            # a second group anchored in the same row replaces the first one, as before
+            self._release(cell.take_termin_cards())
+            self._reusable[cell] = deque()
+        else:
+            self._reusable[cell] = deque(cell.termin_cards())
+        self._used.add(pos)
+        cell.target_date = target_date
+        return cell
+
+    def card(self, cell: TimeSlotCell, kind: str) -> TerminCard | None:
+        """A card to rebind for the given cell, or None if a new one is needed."""
+        reusable = self._reusable.get(cell)
+        if reusable:
+            return reusable.popleft()
+        spare = self._spare_cards.get(kind)
+        return spare.pop() if spare else None
+
+    def end(self) -> None:
+        """Remove the cells this render did not use and keep their cards as spares."""
+        for pos, cell in list(self._cells.items()):
+            if not isValid(cell):
+                del self._cells[pos]
+            elif pos not in self._used:
+                self._release(cell.take_termin_cards())
+                if self.table.cellWidget(*pos) is cell:
+                    self.table.removeCellWidget(*pos)
+                del self._cells[pos]
+            elif self._reusable.get(cell):
+                self._release(cell.take_termin_cards(self._reusable[cell]))
+        self._reusable = {}
+
+        budget = self.MAX_SPARE_CARDS
+        for cards in self._spare_cards.values():
+            keep = min(len(cards), budget)
+            budget -= keep
+            for card in cards[keep:]:
+                card.deleteLater()
+            del cards[keep:]
+
+    def _release(self, cards: list[TerminCard]) -> None:
+        for card in cards:
+            card.setParent(self._holder)
+            self._spare_cards[card.kind].append(card)
@@ -14,6 +14,7 @@ from .state import PlannerState
 from .timeslotcell import TimeSlotCell
 from .termincard import TerminCard
 from .free_day_provider import FreeDayProvider
+from .card_pool import PlannerCardPool
 from .render_helpers import FreeDayHeaderView, render_grouped_termine_column, section_accent_color
 
 
@@ -41,6 +42,8 @@ class PlannerDayView:
         self.context_menu_cb = context_menu_cb
         self.on_drop_cb = on_drop_cb
         self._read_only = False
+        # TimeSlotCells and TerminCards reused between renders
+        self._card_pool = PlannerCardPool(self.day_table)
 
         self._room_list: List[Raum] = []
 
@@ -100,6 +103,7 @@ class PlannerDayView:
                     target_raum_id=target_raum_id,
                     use_dragged_room=False,
                     data_dir=self.state.ds.data_dir,
+                    index=self.state.index,
                 )
 
             self.day_table.set_conflict_checker(_conflict_checker_day)
@@ -170,15 +174,9 @@ class PlannerDayView:
 
         slots = self._time_slots()
 
-        for row in range(self.day_table.rowCount()):
-            for col in range(self.day_table.columnCount()):
-                widget = self.day_table.cellWidget(row, col)
-                if widget:
-                    self.day_table.removeCellWidget(row, col)
-                    widget.deleteLater()
-
+        # Cells and cards are recycled; clearContents() would delete the cell widgets
+        self._card_pool.begin()
         self.day_table.clearSpans()
-        self.day_table.clearContents()
 
         self.day_table.setRowCount(len(slots))
         self.day_table.setColumnCount(1 + len(rooms))
@@ -248,14 +246,12 @@ class PlannerDayView:
         # Store room list for drop handler
         self._room_list = rooms
 
+        # terms are in start time order, so every room list is sorted as well
         by_room = defaultdict(list)
         for t in terms:
             if t.raum_id in room_index:
                 by_room[t.raum_id].append(t)
 
-        for items in by_room.values():
-            items.sort(key=lambda x: x.start_zeit if x.start_zeit else time(0, 0))
-
         for room_id, items in by_room.items():
             if not items:
                 continue
@@ -274,8 +270,11 @@ class PlannerDayView:
                 border_px=2,
                 sort_group_ids=False,
                 read_only=self._read_only,
+                pool=self._card_pool,
             )
 
+        self._card_pool.end()
+
     def _on_cell_clicked(self, row: int, col: int) -> None:
         # Clear focus when clicking empty calendar cells
         if col <= 0:
@@ -359,7 +359,7 @@ class PlannerMonthView:
             idx = planner.view_cb.findData(view_key)
             if idx >= 0:
                 planner.view_cb.setCurrentIndex(idx)
-            planner.refresh(emit=False)
+            planner.request_refresh(action="Ansicht gewechselt")
 
         dlg = DayEventsDialog(
             self.table.window(),
@@ -13,6 +13,7 @@ from ..utils.datetime_utils import fmt_date, fmt_time, mins_from_time
 from ..utils.grouping_utils import group_concurrent_appointments
 from ..utils.color_constants import planner_text_color, type_accent_color_for, type_color_for
 from ..utils.qss_tokens import qss_color
+from .card_pool import PlannerCardPool
 from .free_day_provider import FreeDayBadgeLine
 from .timeslotcell import TimeSlotCell
 from .termincard import TerminCard
@@ -358,10 +359,12 @@ def render_grouped_termine_column(
     border_px: int = 2,
     sort_group_ids: bool = False,
     read_only: bool = False,
+    pool: PlannerCardPool | None = None,
 ) -> None:
     """The function groups concurrent Termine, creates a single TimeSlotCell per group,
     applies row spanning for total group duration, and places each TerminCard at the
-    correct vertical offset inside that cell.
+    correct vertical offset inside that cell. items must be sorted by start time.
+    With a pool, cells and cards of the previous render are reused instead of created.
     """
     if not items:
         return
@@ -386,7 +389,7 @@ def render_grouped_termine_column(
             px += round(table.rowHeight(partial_row) * extra_minutes / slot_min)
         return px
 
-    appointment_groups = group_concurrent_appointments(items)
+    appointment_groups = group_concurrent_appointments(items, presorted=True)
     groups_by_id = defaultdict(list)
     for termin, group_id in appointment_groups:
         groups_by_id[group_id].append(termin)
@@ -418,8 +421,11 @@ def render_grouped_termine_column(
         max_span = max(1, (total_visual_dur + slot_min - 1) // slot_min)
         max_span = min(max_span, len(slots) - row)
 
-        cell_widget = TimeSlotCell(target_date)
-        table.setCellWidget(row, col_idx, cell_widget)
+        if pool is not None:
+            cell_widget = pool.cell(row, col_idx, target_date)
+        else:
+            cell_widget = TimeSlotCell(target_date)
+            table.setCellWidget(row, col_idx, cell_widget)
 
         if max_span > 1:
             try:
@@ -455,11 +461,7 @@ def render_grouped_termine_column(
             bg = type_color_for(typ)
             is_exception = is_series_exception_instance(app)
             is_series = is_series_instance(app)
-            card = TerminCard(
-                app.id,
-                app_text,
-                bg,
-                card_parent,
+            card_data = dict(
                 zu_besprechen=bool(getattr(app, "zu_besprechen", False)),
                 besprechungshinweis=str(getattr(app, "besprechungshinweis", "") or ""),
                 typ=typ,
@@ -468,10 +470,16 @@ def render_grouped_termine_column(
                 missing_room=not bool(str(getattr(app, "raum_id", "") or "").strip()),
                 details_tooltip=format_termin_tooltip(app, lvas),
             )
+            card = pool.card(cell_widget, typ) if pool is not None else None
+            if card is not None:
+                # pooled cards of a table keep their signal connections
+                card.bind(app.id, app_text, bg, **card_data)
+            else:
+                card = TerminCard(app.id, app_text, bg, card_parent, **card_data)
+                card.doubleClicked.connect(edit_by_id_cb)
+                if context_menu_cb is not None:
+                    card.rightClicked.connect(context_menu_cb)
             card.set_read_only(read_only)
-            card.doubleClicked.connect(edit_by_id_cb)
-            if context_menu_cb is not None:
-                card.rightClicked.connect(context_menu_cb)
 
             place_termin_card(
                 table=table,
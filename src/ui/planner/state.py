@@ -3,13 +3,27 @@ from typing import Dict, List, Optional
 
 from ...core.models import Raum, Lehrveranstaltung, Termin
 from ...services.data_service import DataService
-from ...services.filter_service import filter_termine
-from ...services.termin_occurrence_service import expand_termine
+from ...services.filter_service import TerminFilterIndex
+from ...services.project_index_service import ProjectIndex
+from ...services.search_index_service import ProjectSearchIndex
 from ...services.termin_service import TerminService
 
 # Manages data and filtering for the planner UI
 
 
+@dataclass(frozen=True)
+class LoadedProject:
+    """Project files read by PlannerState.load, ready to be applied on the GUI thread."""
+
+    raeume: List[Raum]
+    lvas: List[Lehrveranstaltung]
+    termine: List[Termin]
+    settings: Dict
+    # derived from the state's index at base_version
+    index: ProjectIndex
+    base_version: int
+
+
 @dataclass
 class PlannerState:
     """
@@ -25,18 +39,53 @@ class PlannerState:
     occurrences: List[Termin] = field(default_factory=list)
     termin_map: Dict[str, Termin] = field(default_factory=dict)
     settings: Dict = field(default_factory=dict)
+    index: ProjectIndex = field(default_factory=ProjectIndex)
 
     ts: Optional[TerminService] = None
+    filter_index: TerminFilterIndex = field(init=False)
+    search_index: ProjectSearchIndex = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.filter_index = TerminFilterIndex(self.index)
+        self.search_index = ProjectSearchIndex(self.index)
 
     def reload(self) -> None:
-        self.raeume = self.ds.load_raeume()
-        self.lvas = self.ds.load_lvas()
-        self.termine = self.ds.load_termine()
-        self.occurrences = expand_termine(self.termine)
-        self.termin_map = {str(t.id): t for t in self.termine}
-        self.termin_map.update({str(t.id): t for t in self.occurrences})
-        self.settings = self.ds.load_settings()
-        self.ts = TerminService(self.settings)
+        self.apply_loaded(self.load())
+
+    def load(self) -> "LoadedProject":
+        """
+        Read the project files and index them without changing this state, so it can run
+        in a worker thread while the GUI keeps using the current data. See apply_loaded.
+        """
+        raeume = self.ds.load_raeume()
+        lvas = self.ds.load_lvas()
+        termine = self.ds.load_termine()
+        base_version = self.index.version
+        return LoadedProject(
+            raeume=raeume,
+            lvas=lvas,
+            termine=termine,
+            settings=self.ds.load_settings(),
+            index=self.index.derive(termine, lvas, raeume),
+            base_version=base_version,
+        )
+
+    def apply_loaded(self, loaded: "LoadedProject") -> None:
+        self.raeume = loaded.raeume
+        self.lvas = loaded.lvas
+        self.termine = loaded.termine
+        if loaded.base_version == self.index.version:
+            self.index.adopt(loaded.index)
+        else:
+            # the index changed since the files were read; index the data again
+            self.index.update(self.termine, self.lvas, self.raeume)
+        self.occurrences = self.index.occurrences
+        self.termin_map = self.index.termin_map
+        settings = loaded.settings
+        # keep the service (and its room bitmaps) while the settings are unchanged
+        if self.ts is None or settings != self.settings:
+            self.ts = TerminService(settings, index=self.index)
+        self.settings = settings
 
     def filtered_termine(
         self,
@@ -48,18 +97,17 @@ class PlannerState:
         lva_id: Optional[str] = None,
         studienrichtung: Optional[str] = None,
         zu_besprechen: bool = False,
+        gebaeude: Optional[str] = None,
     ) -> List[Termin]:
-        lva_dict = {lva.id: lva for lva in self.lvas}
-        out = filter_termine(
-            self.termine,
+        # answered from the inverted indexes; repeated calls between reloads hit the cache
+        return self.filter_index.filter(
             semester_id=semester_id,
             studiensemester=studiensemester,
             raum_id=raum_id,
+            gebaeude=gebaeude,
             lva_id=lva_id,
             typ=typ,
             dozent=dozent,
             studienrichtung=studienrichtung,
             zu_besprechen=zu_besprechen,
-            lva_dict=lva_dict,
         )
-        return out
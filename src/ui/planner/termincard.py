@@ -33,8 +33,51 @@ class TerminCard(QLabel):
         details_tooltip: str = "",
     ):
         super().__init__(text, parent)
+        self._focused = False
+        self._highlighted = False
+        self._read_only = False
+        self._style_sheet = None
+
+        self.setWordWrap(True)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setContentsMargins(0, 0, 0, 0)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.bind(
+            termin_id,
+            text,
+            bg_color,
+            zu_besprechen=zu_besprechen,
+            besprechungshinweis=besprechungshinweis,
+            typ=typ,
+            is_series=is_series,
+            is_series_exception=is_series_exception,
+            missing_room=missing_room,
+            details_tooltip=details_tooltip,
+        )
+
+    @property
+    def kind(self) -> str:
+        """Termin type the card is coloured for; PlannerCardPool reuses cards of one kind."""
+        return self._typ
+
+    def bind(
+        self,
+        termin_id: str,
+        text: str,
+        bg_color: QColor,
+        *,
+        zu_besprechen: bool = False,
+        besprechungshinweis: str = "",
+        typ: str = "",
+        is_series: bool = False,
+        is_series_exception: bool = False,
+        missing_room: bool = False,
+        details_tooltip: str = "",
+    ) -> None:
+        """Show another Termin in this card, as if it had been created for it."""
         self.termin_id = termin_id
         self.bg_color = bg_color
+        self._typ = typ
         self.accent_color = type_accent_color_for(typ)
         self._zu_besprechen = bool(zu_besprechen)
         self._besprechungshinweis = str(besprechungshinweis or "").strip()
@@ -42,11 +85,14 @@ class TerminCard(QLabel):
         self._is_series_exception = bool(is_series_exception)
         self._missing_room = bool(missing_room)
         self._needs_attention = self._zu_besprechen or self._missing_room
-        self._focused = False
         self._highlighted = False
-        self._read_only = False
+        if self._focused:
+            self._focused = False
+            self.clearFocus()
+        if hasattr(self, "_drag_start_pos"):
+            delattr(self, "_drag_start_pos")
 
-        self.setWordWrap(True)
+        self.setText(text)
         badge_count = int(self._zu_besprechen) + int(self._missing_room) + int(self._is_series)
         right_padding = 4 + (13 * badge_count) if badge_count else 4
         if self._is_series_exception:
@@ -59,12 +105,9 @@ class TerminCard(QLabel):
             "border-radius: 4px;"
         )
         self._apply_style()
-        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self.setContentsMargins(0, 0, 0, 0)
-        self.setFocusPolicy(Qt.StrongFocus)
-        details_tooltip = str(details_tooltip or "").strip()
-        if details_tooltip:
-            self.setToolTip(details_tooltip)
+        self.setToolTip(str(details_tooltip or "").strip())
+        # the badges are painted, not part of the style sheet
+        self.update()
 
     def _badge_items(self) -> list[tuple[str, QColor, QColor]]:
         items = []
@@ -114,7 +157,11 @@ class TerminCard(QLabel):
             border = f"border: 1px solid {qss_color('planner-discuss-border').name()};"
         else:
             border = f"border: 1px solid {qss_color('planner-card-border').name()};"
-        self.setStyleSheet(self._base_style + border)
+        style_sheet = self._base_style + border
+        # re-polishing is expensive; rebound cards of the same kind mostly keep their style
+        if style_sheet != self._style_sheet:
+            self._style_sheet = style_sheet
+            self.setStyleSheet(style_sheet)
 
     def paintEvent(self, event) -> None:
         super().paintEvent(event)
@@ -18,6 +18,8 @@ class TimeSlotCell(QWidget):
         self.setLayout(self.layout)
 
         self.setStyleSheet("background-color: transparent;")
+        # Wrappers emptied by take_termin_cards, reused by add_termin_card
+        self._spare_wrappers: list[QWidget] = []
 
     def add_termin_card(
         self,
@@ -25,14 +27,54 @@ class TimeSlotCell(QWidget):
         top_offset_px: int = 0,
         bottom_margin_px: int = 0,
     ) -> None:
-        wrapper = QWidget(self)
-        wrapper.setContentsMargins(0, 0, 0, 0)
-        vbox = QVBoxLayout(wrapper)
-        vbox.setContentsMargins(0, max(0, top_offset_px), 0, max(0, bottom_margin_px))
-        vbox.setSpacing(0)
+        margins = (0, max(0, top_offset_px), 0, max(0, bottom_margin_px))
+        wrapper = card.parentWidget()
+        if wrapper is not None and wrapper.parentWidget() is self:
+            # rebound card that was already shown in this cell keeps its place
+            wrapper.layout().setContentsMargins(*margins)
+            return
+
+        if self._spare_wrappers:
+            wrapper = self._spare_wrappers.pop()
+            vbox = wrapper.layout()
+            wrapper.show()
+        else:
+            wrapper = QWidget(self)
+            wrapper.setContentsMargins(0, 0, 0, 0)
+            vbox = QVBoxLayout(wrapper)
+            vbox.setSpacing(0)
+        vbox.setContentsMargins(*margins)
         vbox.addWidget(card)
+        card.show()
         self.layout.addWidget(wrapper, 1, Qt.AlignTop)
 
+    def termin_cards(self) -> list[TerminCard]:
+        """The cards of the cell from left to right"""
+        cards = []
+        for i in range(self.layout.count()):
+            wrapper = self.layout.itemAt(i).widget()
+            card = wrapper.findChild(TerminCard) if wrapper is not None else None
+            if card is not None:
+                cards.append(card)
+        return cards
+
+    def take_termin_cards(self, cards=None) -> list[TerminCard]:
+        """
+        Remove the given cards (default: all) from the cell and return them; the caller
+        gives them a new parent. Their wrappers are kept for add_termin_card.
+        """
+        taken = []
+        for card in list(self.termin_cards() if cards is None else cards):
+            wrapper = card.parentWidget()
+            if wrapper is None or wrapper.parentWidget() is not self:
+                continue
+            wrapper.layout().removeWidget(card)
+            self.layout.removeWidget(wrapper)
+            wrapper.hide()
+            self._spare_wrappers.append(wrapper)
+            taken.append(card)
+        return taken
+
     def get_termin_ids(self) -> list[str]:
         ids = []
         for i in range(self.layout.count()):
@@ -14,6 +14,7 @@ from .state import PlannerState
 from .timeslotcell import TimeSlotCell
 from .termincard import TerminCard
 from .free_day_provider import FreeDayProvider
+from .card_pool import PlannerCardPool
 from .render_helpers import FreeDayHeaderView, render_grouped_termine_column, week_day_accent_color
 
 
@@ -41,6 +42,8 @@ class PlannerWeekView:
         self.context_menu_cb = context_menu_cb
         self.on_drop_cb = on_drop_cb
         self._read_only = False
+        # TimeSlotCells and TerminCards reused between renders
+        self._card_pool = PlannerCardPool(self.week_table)
 
         if hasattr(self.week_table, "terminDropped"):
             self.week_table.terminDropped.connect(self._on_termin_dropped)
@@ -98,6 +101,7 @@ class PlannerWeekView:
                     target_raum_id=None,
                     use_dragged_room=True,
                     data_dir=self.state.ds.data_dir,
+                    index=self.state.index,
                 )
 
             self.week_table.set_conflict_checker(_conflict_checker_week)
@@ -232,16 +236,9 @@ class PlannerWeekView:
                 tooltip_lines.append(day_label)
             header_tooltips[1 + i] = "\n".join(tooltip_lines)
 
-        # Clear all cell widgets before rebuilding
-        for row in range(self.week_table.rowCount()):
-            for col in range(self.week_table.columnCount()):
-                widget = self.week_table.cellWidget(row, col)
-                if widget:
-                    self.week_table.removeCellWidget(row, col)
-                    widget.deleteLater()
-
+        # Cells and cards are recycled; clearContents() would delete the cell widgets
+        self._card_pool.begin()
         self.week_table.clearSpans()
-        self.week_table.clearContents()
 
         self.week_table.setRowCount(len(slots))
         self.week_table.setColumnCount(1 + len(days))
@@ -269,11 +266,10 @@ class PlannerWeekView:
             self.week_table.setItem(r, 0, it)
 
         # render existing Termine into grid as blocks
+        # terms are in (date, start) order, so every day list is sorted by start time
         by_day = defaultdict(list)
         for t in terms:
             by_day[t.datum].append(t)
-        for day_items in by_day.values():
-            day_items.sort(key=lambda x: x.start_zeit if x.start_zeit is not None else time(0, 0))
 
         for col in range(len(days)):
             d0 = week_mo + timedelta(days=col)
@@ -296,8 +292,11 @@ class PlannerWeekView:
                 border_px=2,
                 sort_group_ids=True,
                 read_only=self._read_only,
+                pool=self._card_pool,
             )
 
+        self._card_pool.end()
+
     def _on_cell_clicked(self, row: int, col: int) -> None:
         self.week_table.clearSelection()
         self.week_table.setCurrentCell(-1, -1)
@@ -17,9 +17,10 @@ from PySide6.QtWidgets import (
 )
 
 from ...services.data_service import DataService
-from ...services.termin_occurrence_service import expand_termine, source_termin_id
+from ...services.termin_occurrence_service import source_termin_id
 from ..utils.datetime_utils import date_to_qdate
 from ..utils.qss_tokens import qss_color
+from ..utils.refresh_scheduler import LVAS, RAEUME, TERMINE, VIEW
 from .state import PlannerState
 from .day_view import PlannerDayView
 from .week_view import PlannerWeekView
@@ -35,10 +36,19 @@ from ..components.dragdrop.month_drop_table import MonthDropTable
 class PlannerWorkspace(QWidget):
     """Main planner container coordinating day/week/month views and shared state"""
 
-    def __init__(self, parent: QWidget, ds: DataService, on_data_changed, global_filter_dock=None):
+    def __init__(
+        self,
+        parent: QWidget,
+        ds: DataService,
+        on_data_changed,
+        global_filter_dock=None,
+        refresh_scheduler=None,
+    ):
         super().__init__(parent)
 
         self.on_data_changed = on_data_changed
+        # RefreshScheduler of the main window; without one every change redraws at once
+        self.refresh_scheduler = refresh_scheduler
         self._previous_year_enabled = False
 
         self.state = PlannerState(ds)
@@ -166,19 +176,39 @@ class PlannerWorkspace(QWidget):
 
         # Initial state setup
         self._init_default_dates()
-        self._on_view_changed()
-        self.refresh(emit=False)
+        self.request_refresh(action="Start")
         self._emit_enabled = True
 
         # Set object names for styling
         self.day_date.setObjectName("DateEdit")
         self.view_cb.setObjectName("HeaderCombo")
 
-    def reload_and_refresh_everything(self) -> None:
+    def reload_and_refresh_everything(
+        self, action: str = "", topics: tuple = (TERMINE, LVAS, RAEUME)
+    ) -> None:
+        if self.refresh_scheduler is not None:
+            # the Termin dialog may also save LVAs and rooms, moves and deletes only Termine
+            self.refresh_scheduler.invalidate(*topics, action=action)
+            return
         self.refresh(emit=False)
         if callable(self.on_data_changed):
             self.on_data_changed()
 
+    def request_refresh(self, action: str = "") -> None:
+        """Redraw the calendar in the next refresh pass, together with other pending changes"""
+        if self.refresh_scheduler is not None:
+            self.refresh_scheduler.invalidate(VIEW, action=action)
+        else:
+            self.refresh(emit=False)
+
+    def refresh_now(self, action: str = "") -> None:
+        """Redraw the calendar right away, for callers that work with the cards afterwards"""
+        if self.refresh_scheduler is not None:
+            self.refresh_scheduler.invalidate(VIEW, action=action)
+            self.refresh_scheduler.flush()
+        else:
+            self.refresh(emit=False)
+
     def _apply_planner_table_palette(self, table: QTableWidget) -> None:
         pal = QPalette(table.palette())
         pal.setColor(QPalette.Highlight, QColor(0, 0, 0, 0))
@@ -249,8 +279,10 @@ class PlannerWorkspace(QWidget):
             "zu_besprechen": bool(getattr(gf, "zu_besprechen", False)),
         }
 
-    def refresh(self, emit: bool = True):
-        self.state.reload()
+    def refresh(self, emit: bool = True, reload: bool = True):
+        # reload=False redraws from the loaded state, for passes where only the view changed
+        if reload:
+            self.state.reload()
 
         filters = self.current_filters()
         filters_for_planner = self._filters_for_display(filters)
@@ -263,10 +295,10 @@ class PlannerWorkspace(QWidget):
             semester_id=filters_for_planner["semester_id"],
             studiensemester=filters_for_planner["studiensemester"],
             zu_besprechen=filters_for_planner["zu_besprechen"],
+            gebaeude=filters_for_planner.get("gebaeude"),
         )
-        if filters_for_planner.get("gebaeude") and not filters_for_planner.get("raum_id"):
-            filtered = self._filter_terms_by_building(filtered, filters_for_planner["gebaeude"])
-        expanded = expand_termine(filtered)
+        # occurrences come in (date, start) order, so the views need not sort them again
+        expanded = self.state.index.occurrences_in_order(str(t.id) for t in filtered)
 
         view = str(self.view_cb.currentData())
         if view == "day":
@@ -294,7 +326,7 @@ class PlannerWorkspace(QWidget):
         self._previous_year_enabled = bool(enabled)
         self._apply_history_read_only()
         if refresh:
-            self.refresh(emit=False)
+            self.request_refresh(action="Vorjahr")
 
     def _apply_history_read_only(self) -> None:
         read_only = bool(self._previous_year_enabled)
@@ -322,7 +354,7 @@ class PlannerWorkspace(QWidget):
 
     def _on_view_changed(self):
         # view switching should not refresh external docks/terminliste
-        self.refresh(emit=False)
+        self.request_refresh(action="Ansicht gewechselt")
 
     def _day_rooms_for_filters(self, filters) -> list:
         rooms = self.state.raeume
@@ -336,15 +368,6 @@ class PlannerWorkspace(QWidget):
             return [r for r in rooms if r.id == filters["raum_id"]]
         return rooms
 
-    def _filter_terms_by_building(self, termine: list, gebaeude: str) -> list:
-        room_by_id = {str(room.id): room for room in self.state.raeume}
-        return [
-            termin
-            for termin in termine
-            if str(getattr(room_by_id.get(str(termin.raum_id)), "gebaeude", "") or "").strip()
-            == gebaeude
-        ]
-
     def _paged_day_rooms(self, rooms: list, has_room_filter: bool) -> list:
         total = len(rooms)
         page_size = self._day_room_page_size()
@@ -375,7 +398,7 @@ class PlannerWorkspace(QWidget):
 
     def _shift_day_room_page(self, direction: int) -> None:
         self._day_room_page = max(0, self._day_room_page + direction)
-        self.refresh(emit=False)
+        self.request_refresh(action="Raumseite gewechselt")
 
     def _show_day_room_page_for_room(self, room_id: str) -> None:
         if not room_id or self.current_filters().get("raum_id"):
@@ -391,11 +414,10 @@ class PlannerWorkspace(QWidget):
             return
         saved = self.crud.edit_termin_by_id(tid)
         jump_to_id = getattr(self.crud, "last_jump_to_termin_id", None)
+        if saved:
+            self.reload_and_refresh_everything(action="Termin bearbeitet")
         if jump_to_id:
             self.jump_to_termin(str(jump_to_id))
-            return
-        if saved:
-            self.reload_and_refresh_everything()
 
     def _open_calendar_termin_menu(self, tid: str) -> None:
         if not tid:
@@ -414,17 +436,19 @@ class PlannerWorkspace(QWidget):
             self._edit_termin_by_id(tid)
         elif chosen == act_unassign:
             if self.crud.unassign_termin(tid):
-                self.reload_and_refresh_everything()
+                self.reload_and_refresh_everything(
+                    action="Termin zurück in Terminliste", topics=(TERMINE,)
+                )
         elif chosen == act_delete:
             if self.crud.del_termin_by_id(tid):
-                self.reload_and_refresh_everything()
+                self.reload_and_refresh_everything(action="Termin gelöscht", topics=(TERMINE,))
 
     def _show_history_read_only_toast(self) -> None:
         cb = getattr(self.window(), "_show_history_read_only_toast", None)
         if callable(cb):
             cb()
 
-    def set_global_filter_state(self, fs) -> None:
+    def set_global_filter_state(self, fs, *, refresh: bool = True) -> None:
         old_room_id = getattr(getattr(self, "_global_filter", None), "raum_id", None)
         new_room_id = getattr(fs, "raum_id", None) if fs is not None else None
         if old_room_id != new_room_id:
@@ -435,7 +459,8 @@ class PlannerWorkspace(QWidget):
         else:
             self._global_filter = fs
 
-        self.refresh(emit=False)
+        if refresh:
+            self.refresh(emit=False)
 
     def highlight_termine(self, termin_ids: list[str]) -> None:
         ids = {str(tid) for tid in (termin_ids or []) if tid}
@@ -444,7 +469,7 @@ class PlannerWorkspace(QWidget):
         source_ids = {source_termin_id(tid) for tid in ids}
 
         self._jump_to_first_termin(ids)
-        self.refresh(emit=False)
+        self.refresh_now(action="Konflikt markiert")
 
         # Clear previous highlights
         self.clear_conflict_highlights()
@@ -462,7 +487,7 @@ class PlannerWorkspace(QWidget):
         source_ids = {source_termin_id(tid)}
         self.clear_conflict_highlights()
         self._jump_to_first_termin(ids)
-        self.refresh(emit=False)
+        self.refresh_now(action="Zu Termin springen")
         self._focus_visible_termin_card(self.week_table, ids, source_ids)
         self._focus_visible_termin_card(self.day_table, ids, source_ids)
 
@@ -481,7 +506,7 @@ class PlannerWorkspace(QWidget):
         self.clear_conflict_highlights()
 
     def _on_date_changed(self, *_args) -> None:
-        self.refresh(emit=False)
+        self.request_refresh(action="Datum gewechselt")
 
     def _jump_to_first_termin(self, ids: set[str]) -> None:
         t = next(
@@ -600,4 +625,4 @@ class PlannerWorkspace(QWidget):
             self._show_history_read_only_toast()
             return
         if self.crud.move_termin(termin_id, **kwargs):
-            self.reload_and_refresh_everything()
+            self.reload_and_refresh_everything(action="Termin verschoben", topics=(TERMINE,))
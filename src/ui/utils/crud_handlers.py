@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QDialog, QMessageBox
 
 from ...services.free_day_id_service import free_day_entry_key
 from ...services.id_service import next_id
+from ...services.slot_finder_service import CommonSlotFinder, default_search_range
 from ...services.termin_occurrence_service import occurrence_date_from_id, source_termin_id
 from ...services.undo_service import UndoService
 from ..dialogs import LVADialog, RaumDialog
@@ -14,6 +15,7 @@ from ..components.widgets.editor_tab_widget import selected_id
 from ..dialogs.freie_tage_dialog import FreieTageDialog
 from ..dialogs.studienrichtung_dialog import StudienrichtungDialog
 from ..dialogs.lva_termin_dialog import LVATerminDialog
+from ..dialogs.free_slot_dialog import FreeSlotDialog
 from ..components.widgets.action_dialog import ActionDialog, DialogAction
 from ..components.widgets.delete_dialog import DeleteDialog
 from ..components.widgets.toast import Toast
@@ -57,6 +59,12 @@ class CrudHandlers:
             for item in (getattr(termin, "serien_ausnahmen", []) or [])
         )
 
+    def _conflict_index(self):
+        """Project index for the live conflict check in the Termin dialog, if available."""
+        planner = getattr(self.mw, "planner", None) or self.planner
+        state = getattr(planner, "state", None)
+        return getattr(state, "index", None)
+
     def add_studienrichtung(self) -> None:
         studienrichtungen = self.ds.load_studienrichtungen()
         dlg = StudienrichtungDialog(self.parent, None)
@@ -234,6 +242,8 @@ class CrudHandlers:
             studienrichtungen=self.ds.load_studienrichtungen(),
             termin=cur,
             settings=self.ds.load_settings(),
+            index=self._conflict_index(),
+            data_dir=self.ds.data_dir,
             new_id=source_id,
         )
         dialog_result = dlg.exec()
@@ -361,6 +371,8 @@ class CrudHandlers:
             studienrichtungen=self.ds.load_studienrichtungen(),
             termin=None,
             settings=self.ds.load_settings(),
+            index=self._conflict_index(),
+            data_dir=self.ds.data_dir,
             new_id=self._new_termin_id(),
             default_semester_id=default_semester_id,
         )
@@ -425,6 +437,8 @@ class CrudHandlers:
             raeume=self.ds.load_raeume(),
             termin=None,
             settings=self.ds.load_settings(),
+            index=self._conflict_index(),
+            data_dir=self.ds.data_dir,
             new_id=self._new_termin_id(),
         )
         dlg.duration_sb.setValue(60)
@@ -481,6 +495,8 @@ class CrudHandlers:
             raeume=self.ds.load_raeume(),
             termin=cur,
             settings=self.ds.load_settings(),
+            index=self._conflict_index(),
+            data_dir=self.ds.data_dir,
             new_id=source_id,
         )
         if dlg.exec() != QDialog.Accepted or not dlg.result:
@@ -928,6 +944,31 @@ class CrudHandlers:
             return False
         return None
 
+    def find_slot_for_termin(self, termin_id: str) -> bool:
+        """Offer common free slots for a Termin and move it to the chosen one."""
+        index = self._conflict_index()
+        if index is None:
+            return False
+        termin = index.termin_map.get(source_termin_id(termin_id))
+        if termin is None:
+            return False
+        finder = CommonSlotFinder(index, self.ds.load_settings(), data_dir=self.ds.data_dir)
+        start, end = default_search_range(termin, date.today())
+        dlg = FreeSlotDialog(
+            self.parent,
+            finder=finder,
+            termin=termin,
+            raeume=list(index.raeume),
+            start=start,
+            end=end,
+        )
+        if dlg.exec() != QDialog.Accepted or dlg.result is None:
+            return False
+        candidate = dlg.result
+        return self.move_termin(
+            termin.id, candidate.datum, candidate.von, new_room_id=candidate.raum_id
+        )
+
     def unassign_termin(self, termin_id: str) -> bool:
         termine = self.ds.load_termine()
         source_id = source_termin_id(termin_id)
@@ -3,7 +3,9 @@ from ...core.models import Termin
 from ..utils.datetime_utils import mins_from_time
 
 
-def group_concurrent_appointments(items: List[Termin]) -> List[Tuple[Termin, int]]:
+def group_concurrent_appointments(
+    items: List[Termin], presorted: bool = False
+) -> List[Tuple[Termin, int]]:
     """
     Group Termine that overlap in time so they can be rendered side-by-side.
 
@@ -17,11 +19,17 @@ def group_concurrent_appointments(items: List[Termin]) -> List[Tuple[Termin, int
     All members of the same group receive the same integer group_counter so
     that the caller can collect them, determine the combined time span,
     and place them all into one shared TimeSlotCell.
+
+    Pass presorted=True when items are already sorted by start time.
     """
     if not items:
         return []
 
-    sorted_items = sorted(items, key=lambda x: mins_from_time(x.start_zeit) if x.start_zeit else 0)
+    sorted_items = (
+        items
+        if presorted
+        else sorted(items, key=lambda x: mins_from_time(x.start_zeit) if x.start_zeit else 0)
+    )
 
     groups: List[Tuple[Termin, int]] = []
     group_counter = 0
@@ -0,0 +1,254 @@
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal
+
+# Parts of the project a change can invalidate
+TERMINE = "termine"
+LVAS = "lvas"
+RAEUME = "raeume"
+FREE_DAYS = "freie_tage"
+STUDIENRICHTUNGEN = "studienrichtungen"
+SETTINGS = "settings"
+FILTER = "filter"
+# date, view or window size changed: only the calendar has to be drawn again
+VIEW = "view"
+
+PROJECT_TOPICS = frozenset({TERMINE, LVAS, RAEUME, FREE_DAYS, STUDIENRICHTUNGEN})
+ALL_TOPICS = PROJECT_TOPICS | {SETTINGS, FILTER, VIEW}
+
+DEFAULT_ACTION = "Aktualisierung"
+
+# compute(changed, models) -> view model; handler(changed, view model or None)
+Compute = Callable[[FrozenSet[str], Dict[str, Any]], Any]
+Handler = Callable[[FrozenSet[str], Any], None]
+
+
+@dataclass
+class RefreshStats:
+    """Refresh work caused by one kind of user action since the statistics were reset."""
+
+    action: str
+    # how often the action published a change
+    invalidations: int = 0
+    # refresh passes that included the action's changes
+    passes: int = 0
+    # background stages whose result was dropped because newer changes replaced them
+    dropped: int = 0
+    # subscriber name -> how often it ran in those passes
+    runs: Dict[str, int] = field(default_factory=dict)
+    # time spent applying the passes on the GUI thread
+    seconds: float = 0.0
+    # time the background stages of the passes took (on the GUI thread for flushed passes)
+    background_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class _Pass:
+    generation: int
+    changed: FrozenSet[str]
+    actions: Tuple[str, ...]
+    subscribers: Tuple[Tuple[str, FrozenSet[str], Handler, Optional[Compute]], ...]
+    # set when a newer pass replaces this one; the background stage stops at the next subscriber
+    cancelled: threading.Event = field(default_factory=threading.Event, compare=False)
+
+
+class RefreshScheduler(QObject):
+    """
+    Invalidation bus with a coalescing refresh pass.
+
+    Mutations publish which parts of the project changed, components subscribe to the
+    parts they show. Everything published within one event-loop turn is refreshed in a
+    single pass that runs only the affected subscribers, in subscription order.
+
+    Subscribers may split their work: a compute function that runs in the thread pool and
+    returns an immutable view model, and a handler that applies it to the widgets on the GUI
+    thread. Passes are numbered; if new changes arrive while the background stage runs, a
+    pass covering both replaces it and the older result is dropped.
+    """
+
+    # Emitted from the background stage: (pass generation, (view models, seconds) or error)
+    _computed = Signal(int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers: List[Tuple[str, FrozenSet[str], Handler, Optional[Compute]]] = []
+        self._pending: set = set()
+        self._pending_actions: List[str] = []
+        self._running = False
+        self._generation = 0
+        # pass whose background stage is still running
+        self._in_flight: Optional[_Pass] = None
+        self._stats: Dict[str, RefreshStats] = {}
+        self._computed.connect(self._on_computed)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_pending)
+
+    def subscribe(
+        self, name: str, topics, handler: Handler, compute: Optional[Compute] = None
+    ) -> None:
+        """
+        handler(changed, model) runs in every pass that includes one of the given topics.
+        model is what compute(changed, models) returned in the thread pool, or None without
+        a compute function. compute must not touch widgets; models holds the view models of
+        the subscribers before it in the same pass.
+        """
+        self._subscribers.append((name, frozenset(topics), handler, compute))
+
+    def invalidate(self, *topics: str, action: str = "") -> None:
+        """Mark parts of the project as changed; the refresh pass follows in the next turn."""
+        if not topics:
+            return
+        action = action or DEFAULT_ACTION
+        self._pending.update(topics)
+        if action not in self._pending_actions:
+            self._pending_actions.append(action)
+        self._stats_for(action).invalidations += 1
+        if not self._running and not self._timer.isActive():
+            self._timer.start()
+
+    def has_pending(self) -> bool:
+        return bool(self._pending) or self._in_flight is not None
+
+    def flush(self) -> None:
+        """
+        Run the pending refresh pass now, background stages included, for callers that
+        read the widgets right after. A background stage still running is superseded.
+        """
+        self._timer.stop()
+        if self._running:
+            return
+        self._take_in_flight()
+        if not self._pending:
+            return
+        refresh_pass = self._take_pending()
+        started = perf_counter()
+        models = self._compute(refresh_pass)
+        self._apply(refresh_pass, models, perf_counter() - started)
+
+    def stats(self) -> List[RefreshStats]:
+        """Per-action statistics in the order the actions first occurred."""
+        return list(self._stats.values())
+
+    def reset_stats(self) -> None:
+        self._stats = {}
+
+    def _run_pending(self) -> None:
+        if self._running or not self._pending:
+            return
+        if self._in_flight is not None and not self._needs_compute(self._pending):
+            # changes without a background stage (date, view, filter) do not wait for it
+            refresh_pass = self._take_pending()
+            self._apply(refresh_pass, {}, 0.0)
+            return
+        self._take_in_flight()
+        refresh_pass = self._take_pending()
+        if not any(compute for *_rest, compute in refresh_pass.subscribers):
+            self._apply(refresh_pass, {}, 0.0)
+            return
+
+        self._in_flight = refresh_pass
+
+        def run() -> None:
+            started = perf_counter()
+            try:
+                models = self._compute(refresh_pass)
+                if models is None:
+                    # superseded, the replacing pass computes again
+                    return
+                result = (models, perf_counter() - started)
+            except Exception as exc:
+                result = exc
+            try:
+                self._computed.emit(refresh_pass.generation, result)
+            except RuntimeError:
+                # window closed while the stage was running
+                pass
+
+        QThreadPool.globalInstance().start(run)
+
+    def _on_computed(self, generation: int, result) -> None:
+        refresh_pass = self._in_flight
+        if refresh_pass is None or generation != refresh_pass.generation:
+            return
+        self._in_flight = None
+        if isinstance(result, Exception):
+            # run the stage again on the GUI thread, so the error surfaces normally
+            started = perf_counter()
+            result = (self._compute(refresh_pass), perf_counter() - started)
+        models, seconds = result
+        self._apply(refresh_pass, models, seconds)
+
+    def _take_pending(self) -> _Pass:
+        changed = frozenset(self._pending)
+        actions = tuple(self._pending_actions)
+        self._pending = set()
+        self._pending_actions = []
+        self._generation += 1
+        subscribers = tuple(sub for sub in self._subscribers if sub[1] & changed)
+        return _Pass(self._generation, changed, actions, subscribers)
+
+    def _take_in_flight(self) -> None:
+        """Fold a running background stage back into the pending changes; its result is dropped."""
+        refresh_pass = self._in_flight
+        if refresh_pass is None:
+            return
+        self._in_flight = None
+        refresh_pass.cancelled.set()
+        self._pending.update(refresh_pass.changed)
+        for action in refresh_pass.actions:
+            self._stats_for(action).dropped += 1
+            if action not in self._pending_actions:
+                self._pending_actions.append(action)
+
+    def _needs_compute(self, topics) -> bool:
+        return any(
+            compute is not None and sub_topics & topics
+            for _name, sub_topics, _handler, compute in self._subscribers
+        )
+
+    @staticmethod
+    def _compute(refresh_pass: _Pass) -> Optional[Dict[str, Any]]:
+        """View models of the pass, or None if it was cancelled in the meantime."""
+        models: Dict[str, Any] = {}
+        for name, _topics, _handler, compute in refresh_pass.subscribers:
+            if refresh_pass.cancelled.is_set():
+                return None
+            if compute is not None:
+                models[name] = compute(refresh_pass.changed, models)
+        return models
+
+    def _apply(self, refresh_pass: _Pass, models: Dict[str, Any], background: float) -> None:
+        ran: List[str] = []
+        started = perf_counter()
+        self._running = True
+        try:
+            for name, _topics, handler, _compute in refresh_pass.subscribers:
+                handler(refresh_pass.changed, models.get(name))
+                ran.append(name)
+        finally:
+            self._running = False
+        elapsed = perf_counter() - started
+
+        for action in refresh_pass.actions:
+            stats = self._stats_for(action)
+            stats.passes += 1
+            stats.seconds += elapsed
+            stats.background_seconds += background
+            for name in ran:
+                stats.runs[name] = stats.runs.get(name, 0) + 1
+
+        # changes published by the subscribers themselves get a pass of their own
+        if self._pending:
+            self._timer.start()
+
+    def _stats_for(self, action: str) -> RefreshStats:
+        stats = self._stats.get(action)
+        if stats is None:
+            stats = self._stats[action] = RefreshStats(action)
+        return stats
@@ -7,8 +7,9 @@ import os
 import re
 import subprocess
 import sys
-from typing import Any
-from PySide6.QtCore import Qt, QTimer, QDate, QUrl
+from types import SimpleNamespace
+from typing import Any, Callable
+from PySide6.QtCore import Qt, QThreadPool, QTimer, QDate, QUrl, Signal
 from PySide6.QtGui import QAction, QActionGroup, QDesktopServices
 from PySide6.QtWidgets import (
     QDialog,
@@ -23,7 +24,15 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from ....services.conflict_diff_service import (
+    ConflictDiff,
+    conflict_diff_summary,
+    diff_conflicts,
+)
+from ....services.conflict_labels import conflict_category_label
+from ....services.conflict_service import load_conflict_config
 from ....services.data_service import DataService
+from ....services.filter_service import FilterOptions, build_filter_options
 from ....services.excel_exchange_service import (
     export_project_file_to_csv,
     export_project_to_excel,
@@ -56,10 +65,23 @@ from ...docks.data_editor_dock import DataEditorDock
 from ...docks.conflicts_dock import ConflictsDock
 from ...docks.global_filter_dock import GlobalFilterDock
 from ...docks.date_navigation_dock import DateNavigationDock
-from ...utils.datetime_utils import date_to_qdate, qdate_to_date
+from ...utils.datetime_utils import date_to_qdate, fmt_date, qdate_to_date
 from ...utils.project_folder_flow import prepare_project_folder, project_part_labels
 from ....core.states import FilterState
 from ...utils.crud_handlers import CrudHandlers
+from ...utils.refresh_scheduler import (
+    ALL_TOPICS,
+    FILTER,
+    FREE_DAYS,
+    LVAS,
+    PROJECT_TOPICS,
+    RAEUME,
+    SETTINGS,
+    STUDIENRICHTUNGEN,
+    TERMINE,
+    VIEW,
+    RefreshScheduler,
+)
 from .layout_manager import LayoutManager
 from .shortcuts import install_main_window_shortcuts
 from ...planner.workspace import PlannerWorkspace
@@ -68,6 +90,9 @@ from ...dialogs import (
     SettingsDialog,
     TeacherExportDialog,
     SemesterToolsDialog,
+    AutoPlacementDialog,
+    PlanOptimizerDialog,
+    QuickFindDialog,
     FreeDayImportDialog,
     CatalogImportDialog,
     ProjectExportDialog,
@@ -105,6 +130,9 @@ class MainWindow(QMainWindow):
     This class wires UI components, forwards CRUD operations, keeps filters in sync
     """
 
+    # Emitted from a background conflict diff: (request id, ConflictDiff or None)
+    _conflict_diff_ready = Signal(int, object)
+
     def _apply_start_date(self, start_date) -> None:
         """Synchronize planner and navigation controls to the same start day/week"""
 
@@ -177,7 +205,7 @@ class MainWindow(QMainWindow):
             return
         tid = self._focused_calendar_termin_id()
         if tid and self.crud.del_termin_by_id(tid):
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(TERMINE, action="Termin gelöscht")
 
     def __init__(self, data_dir: Path):
         super().__init__()
@@ -192,7 +220,25 @@ class MainWindow(QMainWindow):
 
         self._build_menus()
 
+        # every refresh goes through here, see _subscribe_refresh_handlers
+        self.refresh_scheduler = RefreshScheduler(self)
+        self._resize_refresh_timer = QTimer(self)
+        self._resize_refresh_timer.setSingleShot(True)
+        self._resize_refresh_timer.setInterval(120)
+        self._resize_refresh_timer.timeout.connect(
+            lambda: self.refresh_scheduler.invalidate(VIEW, action="Fenstergröße geändert")
+        )
+
         self.filter_state = FilterState()
+        # see _filter_options
+        self._cached_filter_options = FilterOptions()
+        self._filter_options_key: tuple | None = None
+        self._filter_options_version: int | None = None
+        self._studiensemester: list | None = None
+        # callbacks of conflict diffs running in the thread pool, see _conflict_diff_since
+        self._conflict_diff_callbacks: dict[int, Callable] = {}
+        self._conflict_diff_requests = 0
+        self._conflict_diff_ready.connect(self._on_conflict_diff_ready)
 
         self.setDockOptions(
             QMainWindow.AllowTabbedDocks
@@ -203,9 +249,11 @@ class MainWindow(QMainWindow):
 
         self._setup_docks()
 
-        self.crud = CrudHandlers(self)
+        # saves publish their changes instead of redrawing the calendar themselves
+        self.crud = CrudHandlers(self, planner=SimpleNamespace(refresh=self._publish_crud_save))
         self.layout_mgr = LayoutManager(self)
 
+        self._subscribe_refresh_handlers()
         self._wire_signals()
         install_main_window_shortcuts(self)
 
@@ -214,23 +262,23 @@ class MainWindow(QMainWindow):
             bool(startup_settings.get("show_termine_search", True))
         )
 
-        self.refresh_everything()
+        self.refresh_scheduler.invalidate(*ALL_TOPICS, action="Start")
+        self.refresh_scheduler.flush()
         self.update_undo_redo_actions()
         self.layout_mgr.init_default()
 
         self.showMaximized()
 
         # Delayed refresh to fix initial card heights after startup layout (50ms not exact time, did not work with 0)
-        QTimer.singleShot(50, self._refresh_planner_only)
+        QTimer.singleShot(50, lambda: self.refresh_scheduler.invalidate(VIEW, action="Start"))
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
         if hasattr(self, "global_filter_dock") and hasattr(self, "date_navigation_dock"):
             QTimer.singleShot(0, self._update_top_dock_layout)
-        QTimer.singleShot(120, self._refresh_planner_only)
-
-    def _refresh_planner_only(self) -> None:
-        self.planner.refresh(emit=False)
+        if hasattr(self, "_resize_refresh_timer"):
+            # one redraw once the resizing pauses, not one per resize event
+            self._resize_refresh_timer.start()
 
     def open_settings(self, initial_tab: str = "general") -> None:
         cur = self.ds.load_settings()
@@ -272,8 +320,7 @@ class MainWindow(QMainWindow):
         else:
             Toast(self, "Einstellungen gespeichert.", duration_ms=2500).show()
         self.termine_dock.set_search_enabled(bool(s.get("show_termine_search", True)))
-        self.refresh_everything()
-        self.refresh_conflicts()
+        self.refresh_scheduler.invalidate(SETTINGS, action="Einstellungen gespeichert")
 
     def _activate_project_folder(
         self,
@@ -482,6 +529,10 @@ class MainWindow(QMainWindow):
         self.act_redo.triggered.connect(self.perform_redo)
         edit_menu.addAction(self.act_undo)
         edit_menu.addAction(self.act_redo)
+        edit_menu.addSeparator()
+        self.act_quick_find = QAction("Schnellsuche…", self)
+        self.act_quick_find.triggered.connect(self.open_quick_find)
+        edit_menu.addAction(self.act_quick_find)
 
         self.view_menu = mb.addMenu("Ansicht")
         self.layout_menu = self.view_menu.addMenu("Layout")
@@ -508,6 +559,19 @@ class MainWindow(QMainWindow):
         self.act_semester_tools.triggered.connect(self.open_semester_tools)
         tools_menu.addAction(self.act_semester_tools)
 
+        self.act_auto_placement = QAction("Termine automatisch einplanen…", self)
+        self.act_auto_placement.triggered.connect(self.open_auto_placement)
+        tools_menu.addAction(self.act_auto_placement)
+
+        self.act_plan_optimizer = QAction("Plan optimieren…", self)
+        self.act_plan_optimizer.triggered.connect(self.open_plan_optimizer)
+        tools_menu.addAction(self.act_plan_optimizer)
+
+        tools_menu.addSeparator()
+        self.act_refresh_stats = QAction("Aktualisierungsstatistik…", self)
+        self.act_refresh_stats.triggered.connect(self.show_refresh_stats)
+        tools_menu.addAction(self.act_refresh_stats)
+
     def create_data_editor_entity(self, entity: str) -> None:
         if entity == "termin" and self._previous_year_enabled:
             self._show_history_read_only_toast()
@@ -523,12 +587,12 @@ class MainWindow(QMainWindow):
             default_qdate=date_to_qdate(current_date),
             default_semester_id=self._semester_id_for_calendar_date(current_date),
         ):
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(TERMINE, LVAS, RAEUME, action="Termin angelegt")
 
     def jump_to_today(self) -> None:
         today = QDate.currentDate()
         self.date_navigation_dock.day_date.setDate(today)
-        self.planner.refresh(emit=False)
+        self.refresh_scheduler.invalidate(VIEW, action="Heute")
 
     def open_konflikte_dialog(self):
         self.open_settings(initial_tab="conflicts")
@@ -540,12 +604,17 @@ class MainWindow(QMainWindow):
             termine=self.ds.load_termine(),
             lvas=self.ds.load_lvas(),
             default_semester_id=self._semester_id_for_calendar_date(current_date),
+            raeume=self.ds.load_raeume(),
+            freie_tage=self.ds.load_freie_tage(),
+            index=self.planner.state.index,
+            data_dir=self.data_dir,
         )
         if dlg.exec() != QDialog.Accepted or not dlg.result_request:
             return
 
         request = dlg.result_request
         try:
+            before_conflicts = self._capture_conflict_state()
             termine = self.ds.load_termine()
             if request.action == "copy" and request.source and request.target:
                 result = copy_semester_termine(
@@ -578,15 +647,114 @@ class MainWindow(QMainWindow):
             if changed_count <= 0:
                 return
 
+            self._conflict_diff_since(
+                before_conflicts,
+                updated,
+                on_done=lambda diff: self._apply_semester_tool_result(
+                    termine, updated, message, diff
+                ),
+            )
+        except Exception as e:
+            QMessageBox.warning(
+                self, "Semester-Werkzeuge", f"Aktion konnte nicht ausgeführt werden: {e}"
+            )
+
+    def _apply_semester_tool_result(
+        self, termine: list, updated: list, message: str, diff: ConflictDiff | None
+    ) -> None:
+        """Confirm changed conflicts and save the result of open_semester_tools."""
+        try:
+            # the diff may have run in the background while the Termine were edited
+            if self.ds.load_termine() != termine:
+                QMessageBox.warning(
+                    self,
+                    "Semester-Werkzeuge",
+                    "Die Termine wurden inzwischen geändert. Bitte die Aktion erneut ausführen.",
+                )
+                return
+            if diff is not None and diff.has_changes:
+                answer = QMessageBox.question(
+                    self,
+                    "Semester-Werkzeuge",
+                    "Diese Aktion verändert die Konflikte: "
+                    f"{conflict_diff_summary(diff)}.\n\n"
+                    + "\n".join(self._conflict_diff_lines(diff))
+                    + "\n\nTrotzdem ausführen?",
+                )
+                if answer != QMessageBox.Yes:
+                    return
+
             self.undo_service.record_snapshot(self.ds)
             self.ds.save_termine(updated)
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(TERMINE, action="Semester-Werkzeuge")
             Toast(self, message, duration_ms=3000).show()
         except Exception as e:
             QMessageBox.warning(
                 self, "Semester-Werkzeuge", f"Aktion konnte nicht ausgeführt werden: {e}"
             )
 
+    def open_auto_placement(self) -> None:
+        if self._previous_year_enabled:
+            self._show_history_read_only_toast()
+            return
+        current_date = self._current_calendar_date()
+        dlg = AutoPlacementDialog(
+            self,
+            termine=self.ds.load_termine(),
+            lvas=self.ds.load_lvas(),
+            raeume=self.ds.load_raeume(),
+            index=self.planner.state.index,
+            settings=self.ds.load_settings(),
+            data_dir=self.data_dir,
+            default_semester_id=self._semester_id_for_calendar_date(current_date),
+        )
+        if dlg.exec() != QDialog.Accepted or dlg.plan is None or not dlg.plan.placements:
+            return
+
+        try:
+            updated = dlg.plan.apply(self.ds.load_termine())
+            self.undo_service.record_snapshot(self.ds)
+            self.ds.save_termine(updated)
+            self.refresh_scheduler.invalidate(TERMINE, action="Automatisch einplanen")
+            count = len(dlg.plan.placements)
+            Toast(self, f"{count} Termine eingeplant.", duration_ms=3000).show()
+        except Exception as e:
+            QMessageBox.warning(
+                self,
+                "Termine automatisch einplanen",
+                f"Termine konnten nicht gespeichert werden: {e}",
+            )
+
+    def open_plan_optimizer(self) -> None:
+        if self._previous_year_enabled:
+            self._show_history_read_only_toast()
+            return
+        current_date = self._current_calendar_date()
+        dlg = PlanOptimizerDialog(
+            self,
+            index=self.planner.state.index,
+            lvas=self.ds.load_lvas(),
+            settings=self.ds.load_settings(),
+            data_dir=self.data_dir,
+            default_semester_id=self._semester_id_for_calendar_date(current_date),
+        )
+        if dlg.exec() != QDialog.Accepted or dlg.result is None or not dlg.result.changes:
+            return
+
+        try:
+            updated = dlg.result.apply(self.ds.load_termine())
+            self.undo_service.record_snapshot(self.ds)
+            self.ds.save_termine(updated)
+            self.refresh_scheduler.invalidate(TERMINE, action="Plan optimieren")
+            count = len(dlg.result.changes)
+            Toast(self, f"{count} Termine verschoben.", duration_ms=3000).show()
+        except Exception as e:
+            QMessageBox.warning(
+                self,
+                "Plan optimieren",
+                f"Termine konnten nicht gespeichert werden: {e}",
+            )
+
     def open_free_day_import(self) -> None:
         default_from, default_to = self._default_free_day_import_range()
         dlg = FreeDayImportDialog(
@@ -607,7 +775,7 @@ class MainWindow(QMainWindow):
 
             self.undo_service.record_snapshot(self.ds)
             self.ds.save_freie_tage(updated)
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(FREE_DAYS, action="Freie Tage importiert")
             Toast(self, f"{changed_count} freie Tage gespeichert.", duration_ms=3000).show()
         except Exception as e:
             QMessageBox.warning(
@@ -701,7 +869,10 @@ class MainWindow(QMainWindow):
         return headline, details
 
     def _show_import_finished_dialog(
-        self, success_text: str, counts_by_file: dict[str, dict[str, int]]
+        self,
+        success_text: str,
+        counts_by_file: dict[str, dict[str, int]],
+        conflict_diff: ConflictDiff | None = None,
     ) -> None:
         totals, rows = self._import_result_rows(counts_by_file)
 
@@ -772,6 +943,23 @@ class MainWindow(QMainWindow):
             warning.setWordWrap(True)
             root.addWidget(warning)
 
+        if conflict_diff is not None:
+            conflicts = QFrame(dlg)
+            conflicts.setObjectName("DialogSection")
+            conflicts_layout = QVBoxLayout(conflicts)
+            conflicts_layout.setContentsMargins(14, 12, 14, 12)
+            conflicts_layout.setSpacing(6)
+            heading = QLabel(f"Konflikte: {conflict_diff_summary(conflict_diff)}")
+            heading.setObjectName("SettingsFieldLabel")
+            heading.setWordWrap(True)
+            conflicts_layout.addWidget(heading)
+            for line in self._conflict_diff_lines(conflict_diff):
+                label = QLabel(line)
+                label.setObjectName("SettingsHelp")
+                label.setWordWrap(True)
+                conflicts_layout.addWidget(label)
+            root.addWidget(conflicts)
+
         buttons = QHBoxLayout()
         buttons.addStretch()
         ok_btn = QPushButton("OK")
@@ -1246,7 +1434,7 @@ class MainWindow(QMainWindow):
         dlg.import_requested.connect(handle_import)
         dlg.exec()
         if imported_any and refresh_after:
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(*PROJECT_TOPICS, action="Import")
         return imported_any
 
     def export_teacher_terms(self) -> None:
@@ -1377,15 +1565,28 @@ class MainWindow(QMainWindow):
         if payload_has_changes(target_dir, normalized) and is_current_project:
             self.undo_service.record_snapshot(self.ds)
 
+        before_conflicts = self._capture_conflict_state() if is_current_project else None
         dlg = ImportDialog(self, target_dir, normalized, auto_import_new=auto_import_new)
         if dlg.exec() != QDialog.Accepted:
             return False
         self._last_import_counts = dlg.result_counts
         self._last_import_reference_warnings = dlg.reference_warnings
         if show_success_toast:
-            self._show_import_finished_dialog(success_text, dlg.result_counts)
+            result_counts = dlg.result_counts
+            if before_conflicts is not None:
+                self._conflict_diff_since(
+                    before_conflicts,
+                    self.ds.load_termine(),
+                    self.ds.load_lvas(),
+                    self.ds.load_raeume(),
+                    on_done=lambda diff: self._show_import_finished_dialog(
+                        success_text, result_counts, diff
+                    ),
+                )
+            else:
+                self._show_import_finished_dialog(success_text, result_counts, None)
         if refresh_after:
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(*PROJECT_TOPICS, action="Import")
         return True
 
     def import_project(self) -> None:
@@ -1408,11 +1609,13 @@ class MainWindow(QMainWindow):
             self.ds,
             on_data_changed=self.refresh_docks,
             global_filter_dock=self.date_navigation_dock,
+            refresh_scheduler=self.refresh_scheduler,
         )
         self.setCentralWidget(self.planner)
 
         self.termine_dock = TermineDock(self)
         self.termine_dock.setObjectName("dock_termine")
+        self.termine_dock.set_search_index(self.planner.state.search_index)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.termine_dock)
 
         self.conflicts_dock = ConflictsDock(self)
@@ -1423,7 +1626,7 @@ class MainWindow(QMainWindow):
         self.data_editor_dock = DataEditorDock(
             self,
             ds=self.ds,
-            on_data_changed=self.refresh_everything,
+            refresh_scheduler=self.refresh_scheduler,
         )
         self.data_editor_dock.setObjectName("dock_data_editor")
         self.tabifyDockWidget(self.termine_dock, self.data_editor_dock)
@@ -1434,6 +1637,7 @@ class MainWindow(QMainWindow):
         self.termine_dock.termin_delete_clicked.connect(self._delete_termin_by_id)
         self.termine_dock.termin_unassign_requested.connect(self._on_unassign_termin)
         self.termine_dock.termin_jump_requested.connect(self._on_jump_to_termin)
+        self.termine_dock.termin_slot_search_requested.connect(self._on_find_slot_for_termin)
 
         self.conflicts_dock.conflict_items_highlight.connect(self.planner.highlight_termine)
 
@@ -1468,9 +1672,8 @@ class MainWindow(QMainWindow):
 
         self.filter_state = fs
 
-        self.planner.set_global_filter_state(fs)
-        terms = self._termine_for_dock(fs)
-        self.termine_dock.set_rows(terms, self.planner.state.lvas, self.planner.state.raeume)
+        self.planner.set_global_filter_state(fs, refresh=False)
+        self.refresh_scheduler.invalidate(FILTER, action="Filter geändert")
 
         settings = self.ds.load_settings()
         if fs.semester and bool(settings.get("jump_to_semester_start_on_filter", True)):
@@ -1480,14 +1683,20 @@ class MainWindow(QMainWindow):
                 if self._previous_year_enabled:
                     start_date = self._previous_year_date_for(start_date)
                 self._apply_start_date(start_date)
-        self.refresh_conflicts()
 
     def _on_unassign_termin(self, tid: str):
         if self._previous_year_enabled:
             self._show_history_read_only_toast()
             return
         if self.planner.crud.unassign_termin(tid):
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(TERMINE, action="Termin zurück in Terminliste")
+
+    def _on_find_slot_for_termin(self, tid: str) -> None:
+        if self._previous_year_enabled:
+            self._show_history_read_only_toast()
+            return
+        if self.crud.find_slot_for_termin(tid):
+            self.refresh_scheduler.invalidate(TERMINE, action="Freien Termin gesucht")
 
     def _edit_termin_by_id(self, tid: str) -> None:
         if self._previous_year_enabled:
@@ -1495,18 +1704,17 @@ class MainWindow(QMainWindow):
             return
         saved = self.crud.edit_termin_by_id(tid)
         jump_to_id = getattr(self.crud, "last_jump_to_termin_id", None)
+        if saved:
+            self.refresh_scheduler.invalidate(TERMINE, LVAS, RAEUME, action="Termin bearbeitet")
         if jump_to_id:
             self.planner.jump_to_termin(str(jump_to_id))
-            return
-        if saved:
-            self.refresh_everything()
 
     def _delete_termin_by_id(self, tid: str) -> None:
         if self._previous_year_enabled:
             self._show_history_read_only_toast()
             return
         if self.crud.del_termin_by_id(tid):
-            self.refresh_everything()
+            self.refresh_scheduler.invalidate(TERMINE, action="Termin gelöscht")
 
     def _show_history_read_only_toast(self) -> None:
         now = monotonic()
@@ -1523,6 +1731,24 @@ class MainWindow(QMainWindow):
     def _on_jump_to_termin(self, tid: str) -> None:
         self.planner.jump_to_termin(tid)
 
+    def open_quick_find(self) -> None:
+        dlg = QuickFindDialog(self, search_index=self.planner.state.search_index)
+        if dlg.exec() != QDialog.Accepted or dlg.selected_hit is None:
+            return
+        hit = dlg.selected_hit
+        if hit.kind == "termin":
+            termin = self.planner.state.index.termin_map.get(hit.id)
+            if termin is not None and termin.datum is not None and termin.start_zeit is not None:
+                self.planner.jump_to_termin(hit.id)
+            else:
+                # unassigned Termine have no place in the calendar
+                self._edit_termin_by_id(hit.id)
+        else:
+            key = {"lva": "lva_id", "raum": "raum_id", "dozent": "dozent"}[hit.kind]
+            if not self.global_filter_dock.focus_filter(**{key: hit.id}):
+                message = f"„{hit.title}“ ist im Filter nicht verfügbar."
+                Toast(self, message, duration_ms=3000).show()
+
     def _on_nav_prev(self) -> None:
         self.planner._shift_period(-1)
 
@@ -1556,7 +1782,7 @@ class MainWindow(QMainWindow):
             self._previous_year_return_date = None
         self.date_navigation_dock.day_date.setDate(date_to_qdate(target_date))
         self._sync_previous_year_button()
-        self.planner.refresh(emit=False)
+        self.refresh_scheduler.invalidate(VIEW, action="Vorjahr")
 
     def _apply_previous_year_read_only(self) -> None:
         read_only = bool(self._previous_year_enabled)
@@ -1606,68 +1832,234 @@ class MainWindow(QMainWindow):
         )
 
     def refresh_everything(self) -> None:
-        # self.planner.refresh(emit=True) einen callback mehr
-        self.planner.refresh(emit=False)
-        self.refresh_docks()
+        """Reload and redraw everything right away (Datei → Aktualisieren)"""
+        self.refresh_scheduler.invalidate(*ALL_TOPICS, action="Aktualisieren")
+        self.refresh_scheduler.flush()
+
+    def _subscribe_refresh_handlers(self) -> None:
+        """What each part of the window shows, in the order a refresh pass updates them"""
+        scheduler = self.refresh_scheduler
+        # loaded once per pass, in the thread pool; passes for the date, view or filter
+        # redraw from memory
+        scheduler.subscribe(
+            "Projektdaten",
+            PROJECT_TOPICS | {SETTINGS},
+            lambda _c, loaded: self.planner.state.apply_loaded(loaded),
+            compute=lambda _c, _models: self.planner.state.load(),
+        )
+        scheduler.subscribe(
+            "Filter",
+            {TERMINE, LVAS, RAEUME, STUDIENRICHTUNGEN},
+            lambda _c, _m: self._refresh_filters(),
+        )
+        scheduler.subscribe(
+            "Kalender", ALL_TOPICS, lambda _c, _m: self.planner.refresh(emit=False, reload=False)
+        )
+        scheduler.subscribe(
+            "Terminliste",
+            {TERMINE, LVAS, RAEUME, SETTINGS, FILTER},
+            lambda _c, _m: self._refresh_termine_dock(),
+        )
+        scheduler.subscribe(
+            "Dateneditor",
+            PROJECT_TOPICS,
+            lambda _c, rows: self.data_editor_dock.apply_rows(rows),
+            compute=lambda changed, models: self.data_editor_dock.compute_rows(
+                changed, models.get("Projektdaten")
+            ),
+        )
+        # detection runs in the conflicts dock's own worker
+        scheduler.subscribe(
+            "Konflikte",
+            {TERMINE, LVAS, RAEUME, FREE_DAYS, SETTINGS, FILTER},
+            lambda _c, _m: self.refresh_conflicts(),
+        )
+
+    def show_refresh_stats(self) -> None:
+        lines = []
+        for stats in self.refresh_scheduler.stats():
+            runs = ", ".join(f"{name} {count}×" for name, count in stats.runs.items())
+            dropped = f", {stats.dropped} verworfen" if stats.dropped else ""
+            lines.append(
+                f"{stats.action}: {stats.invalidations} Änderungen → {stats.passes} Durchläufe"
+                f"{dropped}, {stats.seconds * 1000:.0f} ms "
+                f"(+ {stats.background_seconds * 1000:.0f} ms im Hintergrund)"
+                + (f" ({runs})" if runs else "")
+            )
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Information)
+        msg.setWindowTitle("Aktualisierungsstatistik")
+        msg.setText(
+            "Wie oft jede Aktion seit dem Start (oder dem letzten Zurücksetzen) Änderungen "
+            "gemeldet hat und wie viele Aktualisierungsdurchläufe daraus wurden. Verworfen sind "
+            "Hintergrundberechnungen, die von neueren Änderungen überholt wurden."
+        )
+        msg.setInformativeText("\n".join(lines) if lines else "Noch keine Aktualisierungen.")
+        reset_btn = msg.addButton("Zurücksetzen", QMessageBox.ResetRole)
+        msg.addButton(QMessageBox.Ok)
+        msg.exec()
+        if msg.clickedButton() == reset_btn:
+            self.refresh_scheduler.reset_stats()
+
+    def _publish_crud_save(self) -> None:
+        # the Termin dialog may also save LVAs and rooms
+        self.refresh_scheduler.invalidate(TERMINE, LVAS, RAEUME, action="Daten bearbeitet")
 
     def update_undo_redo_actions(self) -> None:
         self.act_undo.setEnabled(self.undo_service.can_undo())
         self.act_redo.setEnabled(self.undo_service.can_redo())
 
     def perform_undo(self) -> None:
+        before_conflicts = self._capture_conflict_state()
         snapshot = self.undo_service.undo(self.ds)
         if snapshot is None:
             return
         self.undo_service.restore(self.ds, snapshot)
-        self.refresh_everything()
+        self.refresh_scheduler.invalidate(*PROJECT_TOPICS, action="Rückgängig")
         self.update_undo_redo_actions()
-        Toast(self, "Rückgängig ausgeführt.", duration_ms=2500).show()
+        self._conflict_diff_since(
+            before_conflicts,
+            snapshot.termine,
+            snapshot.lvas,
+            snapshot.raeume,
+            on_done=lambda diff: self._show_history_toast("Rückgängig ausgeführt.", diff),
+        )
 
     def perform_redo(self) -> None:
+        before_conflicts = self._capture_conflict_state()
         snapshot = self.undo_service.redo(self.ds)
         if snapshot is None:
             return
         self.undo_service.restore(self.ds, snapshot)
-        self.refresh_everything()
+        self.refresh_scheduler.invalidate(*PROJECT_TOPICS, action="Wiederholen")
         self.update_undo_redo_actions()
-        Toast(self, "Wiederholen ausgeführt.", duration_ms=2500).show()
+        self._conflict_diff_since(
+            before_conflicts,
+            snapshot.termine,
+            snapshot.lvas,
+            snapshot.raeume,
+            on_done=lambda diff: self._show_history_toast("Wiederholen ausgeführt.", diff),
+        )
+
+    def _show_history_toast(self, message: str, diff: ConflictDiff | None) -> None:
+        if diff is not None and diff.has_changes:
+            message += f" Konflikte: {conflict_diff_summary(diff)}."
+        Toast(self, message, duration_ms=2500).show()
+
+    def _capture_conflict_state(self) -> tuple:
+        """
+        Snapshot of the current project state for a later _conflict_diff_since call. The
+        dock's issues are only taken if they were detected for exactly this index version.
+        """
+        index = self.planner.state.index
+        return (
+            index.derive(index.termine),
+            self.conflicts_dock.current_issues(index.version),
+            load_conflict_config(data_dir=self.data_dir),
+        )
+
+    def _conflict_diff_since(
+        self,
+        before: tuple,
+        termine,
+        lvas=None,
+        raeume=None,
+        on_done: Callable[[ConflictDiff | None], None] = lambda diff: None,
+    ) -> None:
+        """
+        Conflicts added/resolved between a captured state and the given project data, passed
+        to on_done (None on errors). With the dock's issues of the captured state only the
+        changed part is re-evaluated, so on_done is called right away; otherwise the full
+        detection of the captured state runs in the thread pool and on_done follows later.
+        """
+        before_index, before_issues, before_config = before
+        after_index = before_index.derive(termine, lvas, raeume)
+        after_config = load_conflict_config(data_dir=self.data_dir)
+
+        def run() -> ConflictDiff | None:
+            try:
+                return diff_conflicts(
+                    before_index,
+                    after_index,
+                    before_issues=before_issues,
+                    data_dir=self.data_dir,
+                    before_config=before_config,
+                    after_config=after_config,
+                )
+            except Exception:
+                return None
+
+        if before_issues is not None:
+            on_done(run())
+            return
+
+        self._conflict_diff_requests += 1
+        request = self._conflict_diff_requests
+        self._conflict_diff_callbacks[request] = on_done
+
+        def run_in_pool() -> None:
+            diff = run()
+            try:
+                self._conflict_diff_ready.emit(request, diff)
+            except RuntimeError:
+                # window closed while the diff was running
+                pass
+
+        QThreadPool.globalInstance().start(run_in_pool)
+
+    def _on_conflict_diff_ready(self, request: int, diff) -> None:
+        on_done = self._conflict_diff_callbacks.pop(request, None)
+        if on_done is not None:
+            on_done(diff)
+
+    def _conflict_diff_lines(self, diff: ConflictDiff, limit: int = 8) -> list[str]:
+        lines = []
+        for prefix, issues in (("Neu", diff.added), ("Behoben", diff.removed)):
+            for issue in issues:
+                parts = [
+                    f"{prefix}: {conflict_category_label(issue.category)}",
+                    fmt_date(issue.datum) if issue.datum else "",
+                    str(issue.lva or ""),
+                ]
+                lines.append(" · ".join(part for part in parts if part))
+        if len(lines) > limit:
+            hidden = len(lines) - limit
+            lines = lines[:limit] + [f"… und {hidden} weitere"]
+        return lines
 
     def refresh_conflicts(self) -> None:
+        settings = self.ds.load_settings()
         self.conflicts_dock.initialize_detector(
             self.planner.state.lvas,
             self.planner.state.raeume,
             data_dir=self.data_dir,
+            parallel=bool(settings.get("parallel_conflict_detection", False)),
+            max_workers=self._csv_int(settings.get("conflict_detection_workers", 0)),
+            index=self.planner.state.index,
         )
         visible_termin_ids = None
-        settings = self.ds.load_settings()
         if bool(settings.get("filter_conflicts_with_global_filters", True)):
             visible_termin_ids = {
                 str(t.id) for t in self._compute_filtered_termine(self.filter_state)
             }
         self.conflicts_dock.refresh_conflicts(
-            self.planner.state.termine,
+            self.planner.state.occurrences,
             visible_termin_ids=visible_termin_ids,
+            project_dir=self.planner.state.ds.data_dir,
+            index_version=self.planner.state.index.version,
         )
 
     def refresh_docks(self) -> None:
         """Refresh dock data and option lists based on current planner state/filters"""
-        lva_list = getattr(self.planner.state, "lvas", None) or []
-
-        studienrichtungen = self.ds.load_studienrichtungen()
-
-        typ_list = [
-            t.typ for t in getattr(self.planner.state, "termine", []) if getattr(t, "typ", None)
-        ]
+        self._refresh_filters()
+        self._refresh_termine_dock()
+        self.data_editor_dock.refresh_all()
+        self.refresh_conflicts()
 
-        self.global_filter_dock.refresh_filter_options(
-            studienrichtungen,
-            [],
-            lva_list,
-            self.planner.state.raeume,
-            studiensemester_list=self.ds.load_studiensemester(),
-            typ_list=typ_list,
-            current=self.filter_state,
-        )
+    def _refresh_filters(self) -> None:
+        """Update the filter option lists and take over what stays selected"""
+        self.global_filter_dock.set_filter_options(self._filter_options(), self.filter_state)
+        previous = self.filter_state
 
         self.filter_state = FilterState(
             studienrichtung=self.global_filter_dock.studienrichtung_cb.currentData() or None,
@@ -1680,19 +2072,46 @@ class MainWindow(QMainWindow):
             studiensemester=self.global_filter_dock.studiensemester_cb.currentData() or None,
             zu_besprechen=bool(self.global_filter_dock.zu_besprechen_cb.isChecked()),
         )
+        if self.filter_state != previous:
+            # a selected LVA or room no longer exists; the calendar follows the dock
+            self.planner.set_global_filter_state(self.filter_state, refresh=False)
 
+    def _refresh_termine_dock(self) -> None:
         terms = self._termine_for_dock(self.filter_state)
-
         self.termine_dock.set_rows(terms, self.planner.state.lvas, self.planner.state.raeume)
 
-        self.data_editor_dock.refresh_all()
-        self.refresh_conflicts()
+    def _filter_options(self) -> FilterOptions:
+        """
+        Filter dock options, rebuilt only when LVAs, rooms, the Termin types or the
+        Studienrichtungen file changed (an edit of Termine alone keeps them).
+        """
+        state = self.planner.state
+        key = (
+            str(self.ds.data_dir),
+            self.ds.file_stamp("studienrichtungen.json"),
+            state.filter_index.values("typ"),
+        )
+        changed = state.index.changes_since(self._filter_options_version)
+        if changed is None or key != self._filter_options_key:
+            if self._studiensemester is None:
+                # bundled with the application, does not change while it runs
+                self._studiensemester = self.ds.load_studiensemester()
+            self._cached_filter_options = build_filter_options(
+                self.ds.load_studienrichtungen(),
+                getattr(state, "lvas", None) or [],
+                state.raeume,
+                studiensemester_list=self._studiensemester,
+                typ_list=key[2],
+            )
+            self._filter_options_key = key
+        self._filter_options_version = state.index.version
+        return self._cached_filter_options
 
     def _termine_for_dock(self, fs: FilterState | None):
         settings = self.ds.load_settings()
         if bool(settings.get("filter_termine_list_with_global_filters", True)):
             return self._compute_filtered_termine(fs)
-        return list(getattr(self.planner.state, "termine", []) or [])
+        return list(self.planner.state.index.sorted_termine)
 
     def _compute_filtered_termine(self, fs: FilterState | None):
         """Return the filtered list of Termine for the given filter state"""
@@ -1728,13 +2147,6 @@ class MainWindow(QMainWindow):
             semester_id=semester_id,
             studiensemester=studiensemester,
             zu_besprechen=zu_besprechen,
+            gebaeude=building,
         )
-        if building and not room:
-            room_by_id = {str(r.id): r for r in self.planner.state.raeume}
-            terms = [
-                t
-                for t in terms
-                if str(getattr(room_by_id.get(str(t.raum_id)), "gebaeude", "") or "").strip()
-                == building
-            ]
         return terms